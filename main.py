@@ -63,7 +63,8 @@ def run_cli():
     
     # Main game loop
     print("\n" + "🌟"*25)
-    print("🎊 Your Adventure Begins! Type 'quit' when you're ready to leave this magical world.")
+    print("🎊 Your Adventure Begins! Type 'next quest' once you've finished a quest,")
+    print("   and 'quit' when you're ready to leave this magical world.")
     print("🌟"*25)
 
     while True:
@@ -73,9 +74,20 @@ def run_cli():
                 print("\n👋 Thanks for the amazing adventure! See you next time!")
                 break
             
+            if action.lower() == 'next quest':
+                upcoming = engine.advance_quest()
+                if upcoming:
+                    print(f"\n🗺️ {upcoming['title']} ({upcoming['theme']}) begins!")
+                else:
+                    print("\n🏆 That was the final quest - your legend is complete!")
+                continue
+            
             if action:
-                response = engine.process_player_action(action)
-                print(f"\n🧙‍♂️ DM: {response}")
+                # The story appears as the DM writes it - no staring at a blank screen!
+                print("\n🧙‍♂️ DM: ", end="", flush=True)
+                for piece in engine.process_player_action_stream(action):
+                    print(piece, end="", flush=True)
+                print()
             else:
                 print("💭 Take your time! What would you like to do?")
         
@@ -20,6 +20,13 @@ except ImportError:
 # 🤖 AI Brain Configuration - This is where we talk to our smart AI friend
 LLM_MODEL = "llama-3.1-8b-instant"  # Our storytelling AI's brain model
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
+LLM_TIMEOUT_SECONDS = 30.0          # Give it time to think of great stories
+LLM_CONNECT_TIMEOUT_SECONDS = 10.0  # ...but not forever to pick up the phone
+LLM_RETRIES = 3                     # Try again if the connection hiccups
+LLM_MAX_CONNECTIONS = 20            # Open connections shared by every adventure (async client)
+LLM_MAX_KEEPALIVE_CONNECTIONS = 10  # ...how many stay warm between requests
+LLM_KEEPALIVE_SECONDS = 30.0        # ...and for how long
+LLM_MAX_CONCURRENT_REQUESTS = 8     # Requests allowed in flight at once (async client)
 
 if GROQ_API_KEY:
     print("🔑 Perfect! Your AI connection key is ready to go")
@@ -28,13 +35,45 @@ else:
 
 # 🧠 Memory Magic Configuration - How your AI remembers everything
 MEMORY_SAVE_PATH = "memory_docs"  # Where all the epic memories are stored
-MAX_CONVERSATION_HISTORY = 50     # Keeps the last 50 chats fresh in memory
+MEMORY_RAM_BUDGET_BYTES = 256 * 1024  # How much conversation text we keep close at hand
+RECENT_TURNS_RESIDENT = 20        # The newest chats always stay fresh in memory
+RETRIEVAL_HIT_SALIENCE = 0.5      # How much being recalled makes an old memory worth keeping
+COLD_LOG_COMPACT_BYTES = 64 * 1024  # Stale bytes the cold memory log may pile up before it's tidied
 MAX_RETRIEVAL_RESULTS = 5         # How many old memories to dig up for context
+MAX_QUERY_EXPANSIONS = 4          # Extra entity lookups we spin off from one player action
+MEMORY_RETRIEVAL_BUDGET_MS = 150  # How long the memory search may take before we go with what we have
+RERANK_KEYWORD_WEIGHT = 0.5       # How much shared words count when blending search results
+RERANK_IMPORTANCE_WEIGHT = 0.05   # How much an epic moment gets nudged up the list
+RERANK_FACT_WEIGHT = 0.75         # How much sharing named people, places and loot with the action counts
+DUPLICATE_SIMILARITY_THRESHOLD = 0.8  # How alike two turns must be to count as the same moment
+COLLAPSE_DUPLICATES_IN_ARCHIVE = False  # Save only one copy of near-identical turns?
+MAX_RELATIONSHIP_CONTEXT = 6      # How many known relationships around the scene's NPCs we mention
+FACT_STORE_CAPACITY = 5000        # The most facts we keep before clearing out forgotten ones
+FACT_RECENCY_HALF_LIFE = 50       # Turns until an unused fact's popularity counts half as much
+FACT_EVICTION_SLACK = 0.1         # Clear out 10% extra at once so we don't evict every turn
 
 # 🔍 Smart Memory Search Configuration
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"      # The brain that understands memories
 VECTOR_DB_COLLECTION = "story_memory"      # Our memory treasure vault
 
+# 🎬 Scene Tracking - Who's around right now
+SCENE_IDLE_UPDATES = 6            # Texts without a word from an NPC before they drift out of the scene
+NPC_NAME_MEMO_SIZE = 4096         # How many "is this word a name?" answers we remember
+NPC_SNAPSHOT_EVERY = 200          # NPC changes logged before we tidy them into a fresh snapshot
+NPC_INTERACTIONS_IN_PROMPT = 3    # Past interactions we remind the storyteller of, per NPC in the scene
+INTERACTION_SUMMARY_CHARS = 120   # How much of the player's action each diary entry keeps
+NPC_DIARY_MAX_ENTRIES = 50        # Diary entries kept per NPC - older ones live on in the memories
+FUZZY_NAME_MAX_EDITS = 2          # Typos we forgive in a long NPC name ("Marcos" -> Marcus)
+FUZZY_NAME_MIN_LENGTH = 4         # Shorter words are too easy to mix up, so they must match exactly
+NPC_CONTEXT_TOP_K = 5             # The most NPCs we describe to the storyteller at once
+NPC_CONTEXT_TOKEN_BUDGET = 120    # ...and roughly how many tokens those descriptions may take
+NPC_STREAM_CARRY_CHARS = 240      # Longest unfinished sentence we hold back while a response streams in
+NPC_SALIENCE_WEIGHTS = {          # What makes an NPC worth mentioning in a crowded scene
+    'recency': 0.5,               # Just talked about?
+    'relationship': 0.3,          # Strong feelings either way?
+    'presence': 0.2,              # How sure we are they're actually here
+}
+
 # ⚔️ Character Power Stats - Default abilities for new heroes
 DEFAULT_ATTRIBUTES = {
     'strength': 10,      # How strong your hero is
@@ -44,19 +83,22 @@ DEFAULT_ATTRIBUTES = {
 }
 
 # 🔍 Smart Pattern Recognition - How we spot important stuff in your story
-ENTITY_PATTERNS = [
-    r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b',  # Cool names (like Sir Galahad)
-    r'\b(?:sword|shield|armor|weapon|potion|key|treasure|gold|silver)\b',  # Epic loot!
-    r'\b(?:castle|tavern|forest|mountain|village|city|tower|dungeon)\b',  # Amazing places
+# Cool names (like Sir Galahad) are runs of Capitalized words - case matters there!
+LOOT_WORDS = [    # Epic loot!
+    'sword', 'shield', 'armor', 'weapon', 'potion', 'key', 'treasure', 'gold', 'silver'
 ]
-
-RELATIONSHIP_PATTERNS = [
-    r'(\w+)\s+(?:gives?|gave|handed?|offered?)\s+(\w+)',         # Who gave what to whom
-    r'(\w+)\s+(?:tells?|told|said?|mentioned?)\s+(?:to\s+)?(\w+)',  # Who talked to whom
-    r'(\w+)\s+(?:attacks?|attacked?|fights?|fought?)\s+(\w+)',   # Epic battles!
-    r'(\w+)\s+(?:helps?|helped?|assists?|assisted?)\s+(\w+)',    # Helpful friendships
+PLACE_WORDS = [   # Amazing places
+    'castle', 'tavern', 'forest', 'mountain', 'village', 'city', 'tower', 'dungeon'
 ]
 
+# Who did what to whom - "Marcus gave Elena", "Elena told Marcus"...
+RELATIONSHIP_VERBS = {
+    'gave': ['give', 'gives', 'gave', 'hand', 'hands', 'handed', 'offer', 'offers', 'offered'],          # Who gave what to whom
+    'told': ['tell', 'tells', 'told', 'say', 'says', 'said', 'mention', 'mentions', 'mentioned'],        # Who talked to whom
+    'attacked': ['attack', 'attacks', 'attacked', 'fight', 'fights', 'fought'],                         # Epic battles!
+    'helped': ['help', 'helps', 'helped', 'assist', 'assists', 'assisted'],                             # Helpful friendships
+}
+
 # 🌟 Keywords That Make Stories EPIC - We pay extra attention to these!
 IMPORTANCE_KEYWORDS = [
     'quest', 'mission', 'treasure', 'secret', 'magic', 'prophecy',
@@ -64,6 +106,26 @@ IMPORTANCE_KEYWORDS = [
     'powerful', 'dangerous', 'legendary', 'cursed', 'blessed'
 ]
 
+# 💬 How the Hero Sounds - Words that reveal your tone (checked in this order!)
+TONE_KEYWORDS = {
+    'Threatening': ["kill", "hurt", "attack", "threaten", "fight", "die"],           # Yikes! That's scary talk!
+    'Rude': ["shut up", "stupid", "idiot", "get out", "go away"],                     # Not very nice...
+    'Polite': ["please", "thank you", "excuse me", "sorry", "may i", "could you"],    # Such good manners!
+    'Friendly': ["hello", "hi", "friend", "help", "kind", "nice"],                    # How nice and welcoming!
+}
+
+# How much each tone word adds on top of a tone's strongest word (anything not listed counts 1.0) -
+# "kill, kill, kill" says more than "fight, fight, fight", but a lone "kill" still costs what a threat always did
+TONE_KEYWORD_WEIGHTS = {
+    'kill': 2.0, 'die': 1.5, 'threaten': 1.5,
+    'idiot': 1.5, 'stupid': 1.5, 'shut up': 1.5,
+    'thank you': 1.5,
+    'hi': 0.5, 'help': 0.5, 'kind': 0.5, 'nice': 0.5,
+}
+TONE_INTENSIFIERS = ['very', 'really', 'so', 'truly', 'extremely', 'absolutely']  # "really sorry" means it!
+TONE_INTENSIFIER_BOOST = 1.5   # How much an intensifier right before a tone word adds
+TONE_MAX_STRENGTH = 3.0        # A tone can count at most this many times its usual effect
+
 # 🖼️ User Interface Magic - Making everything look awesome
 GUI_WINDOW_SIZE = "1000x700"
 GUI_TITLE = "🧙‍♂️ Your Personal AI Storyteller with Amazing Memory!"
\ No newline at end of file
@@ -8,12 +8,18 @@ all the fundamental pieces that make the magic happen.
 """
 
 from .character import Character
-from .memory import DocumentMemorySystem, MemoryEntry  
+from .memory import DocumentMemorySystem, MemoryEntry, RetrievalResult
+from .bitmap_index import MemoryFilter
+from .relationship_graph import RelationshipGraph, Relationship
 from .engine import StorytellingEngine
 
 __all__ = [
     'Character',              # Your amazing hero character
     'DocumentMemorySystem',   # The incredible memory palace
     'MemoryEntry',           # Individual precious memories
+    'MemoryFilter',          # Narrowing memories down to what matters
+    'RetrievalResult',       # Found memories, plus how far the search got
+    'RelationshipGraph',     # The web of who did what to whom
+    'Relationship',
     'StorytellingEngine'     # The master orchestrator of adventures
 ]
\ No newline at end of file
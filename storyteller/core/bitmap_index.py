@@ -0,0 +1,90 @@
+# storyteller/core/bitmap_index.py
+"""
+🗂️ The Memory Card Catalogue - Instantly Narrowing Down Which Memories Count!
+
+Sometimes you only care about the big moments, or the turns where a certain
+character was around, or what happened during the current quest. This catalogue
+keeps a tiny bitset per attribute (one bit per turn), so answering "which turns
+match all of these?" is just a handful of bitwise ANDs - before we score anything!
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class BitmapIndex:
+    """🗂️ One compact bitset of turn ids for every attribute we care about!"""
+
+    def __init__(self):
+        self._bitmaps: Dict[str, int] = {}  # attribute key -> bitset (bit N = turn N)
+
+    def add(self, key: str, turn_id: int):
+        """Mark a turn as having this attribute"""
+        self._bitmaps[key] = self._bitmaps.get(key, 0) | (1 << turn_id)
+
+    def get(self, key: str) -> int:
+        """All turns having this attribute (an empty bitset if none do)"""
+        return self._bitmaps.get(key, 0)
+
+    def union(self, keys) -> int:
+        """All turns having any of these attributes"""
+        bitmap = 0
+        for key in keys:
+            bitmap |= self._bitmaps.get(key, 0)
+        return bitmap
+
+    def keys(self):
+        return self._bitmaps.keys()
+
+    @staticmethod
+    def ids(bitmap: int) -> List[int]:
+        """The turn ids set in a bitset, lowest first - unpacked in one go
+        
+        (Shifting a big Python int copies the whole thing, so test membership
+        against a set of these ids rather than bit by bit.)
+        """
+        if not bitmap:
+            return []
+        packed = np.frombuffer(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little'), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(packed, bitorder='little')).tolist()
+
+    def to_dict(self) -> Dict[str, str]:
+        """Pack every bitset as hex so it saves compactly"""
+        return {key: format(bitmap, 'x') for key, bitmap in self._bitmaps.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> 'BitmapIndex':
+        index = cls()
+        index._bitmaps = {key: int(bitmap, 16) for key, bitmap in data.items()}
+        return index
+
+
+@dataclass
+class MemoryFilter:
+    """🎯 Which memories should we even look at? Every condition given must hold!"""
+
+    min_importance: Optional[int] = None   # Only turns at least this epic
+    npcs: Tuple[str, ...] = field(default_factory=tuple)  # Turns where ALL of these were around
+    quest: Optional[int] = None            # Only turns from this quest number
+
+    def evaluate(self, index: BitmapIndex, max_importance: int = 5) -> Optional[int]:
+        """Turn the conditions into one bitset of allowed turns (None means no filtering)"""
+        bitmap = None
+
+        def narrow(current, other):
+            return other if current is None else current & other
+
+        if self.min_importance is not None:
+            buckets = [f"importance:{level}" for level in range(math.ceil(self.min_importance), max_importance + 1)]
+            bitmap = narrow(bitmap, index.union(buckets))
+
+        for npc in self.npcs:
+            bitmap = narrow(bitmap, index.get(f"npc:{npc.lower()}"))
+
+        if self.quest is not None:
+            bitmap = narrow(bitmap, index.get(f"quest:{self.quest}"))
+
+        return bitmap
@@ -0,0 +1,111 @@
+# storyteller/core/canonical.py
+"""
+🪪 The Name Tag Desk - Every Way of Saying a Name Gets the Same Tag!
+
+"Marcus", "marcus", "Marcus's" and "Old Marcus" are all the same blacksmith,
+so they should all share one entry in the fact cabinet. This desk folds case,
+strips possessives and, once the NPC roster tells us who's who, merges titles
+and nicknames into that character's one true tag. Each surface form is worked
+out once and then remembered, so looking a name up again is a single dict hit.
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Set
+
+# Words that can sit around a name without making it someone else ("Old Marcus", "Sir Galahad")
+_TITLE_WORDS = frozenset({
+    'the', 'old', 'young', 'little', 'big', 'sir', 'lady', 'lord', 'dame', 'master', 'mistress',
+    'captain', 'brother', 'sister', 'father', 'mother', 'uncle', 'aunt', 'elder', 'good',
+    'mister', 'miss', 'mrs', 'mr', 'doctor', 'king', 'queen', 'prince', 'princess',
+})
+
+_POSSESSIVE_RE = re.compile(r"(?<=\w)(?:\s*['’]s|['’])(?=\s|$)", re.IGNORECASE)
+RELATION_ARROW = " -> "
+_CACHE_LIMIT = 10000  # Remembered answers before we start afresh
+
+
+class FactCanonicalizer:
+    """🪪 Surface form -> canonical id, learning new aliases from the NPC roster"""
+
+    def __init__(self):
+        self.aliases: Dict[str, str] = {}   # Any folded surface form -> canonical id
+        self.entities: Dict[str, str] = {}  # Canonical id -> the name we show for it
+        self._cache: Dict[str, str] = {}    # Raw text -> canonical id, worked out once
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """Lowercase, possessives off, tidy spaces: "Marcus's  Sword" -> "marcus sword\""""
+        return " ".join(_POSSESSIVE_RE.sub("", text.strip()).lower().split())
+
+    @classmethod
+    def words_of(cls, names: Iterable[str]) -> Set[str]:
+        """Every folded word in these names - what a fact must contain for them to change its tag"""
+        return {word for name in names for word in cls.fold(name).split()}
+
+    def register_entity(self, name: str, aliases: Iterable[str] = ()) -> str:
+        """🎭 Tell the desk about a character so every way of naming them shares one tag"""
+        canonical = self.fold(name)
+        if not canonical:
+            return canonical
+        self.entities[canonical] = name.strip()
+        self.aliases[canonical] = canonical
+        first_word = canonical.split()[0]
+        if first_word != canonical and first_word not in _TITLE_WORDS:
+            self.aliases.setdefault(first_word, canonical)  # "Marcus Blackwood" answers to "Marcus"
+        for alias in aliases:
+            folded = self.fold(alias)
+            if folded:
+                self.aliases[folded] = canonical
+        self._cache.clear()  # Old answers may now point somewhere better
+        return canonical
+
+    def canonical(self, fact: str) -> str:
+        """The one true tag for a fact - relations get each side tagged ("a -> b")"""
+        cached = self._cache.get(fact)
+        if cached is not None:
+            return cached
+        if RELATION_ARROW in fact:
+            subject, _, obj = fact.partition(RELATION_ARROW)
+            result = f"{self._canonical_entity(subject)}{RELATION_ARROW}{self._canonical_entity(obj)}"
+        else:
+            result = self._canonical_entity(fact)
+        if len(self._cache) >= _CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[fact] = result
+        return result
+
+    def _canonical_entity(self, text: str) -> str:
+        folded = self.fold(text)
+        known = self.aliases.get(folded)
+        if known is not None:
+            return known
+
+        # "Old Marcus", "Marcus Marcus", "Captain Marcus": one known character plus titles is still them
+        words = folded.split()
+        if len(words) > 1:
+            characters = {self.aliases[word] for word in words if word in self.aliases}
+            others = [word for word in words if word not in self.aliases]
+            if len(characters) == 1 and all(word in _TITLE_WORDS for word in others):
+                canonical = characters.pop()
+                self.aliases[folded] = canonical
+                return canonical
+        return folded
+
+    def label(self, canonical: str) -> str:
+        """The nicest way to show a canonical id"""
+        return self.entities.get(canonical, canonical)
+
+    def resolve(self, text: str) -> Optional[str]:
+        """The registered character this text names, if any"""
+        canonical = self._canonical_entity(text)
+        return canonical if canonical in self.entities else None
+
+    def to_dict(self) -> Dict[str, Dict[str, str]]:
+        return {'entities': dict(self.entities), 'aliases': dict(self.aliases)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict[str, str]]) -> 'FactCanonicalizer':
+        desk = cls()
+        desk.entities.update(data.get('entities', {}))
+        desk.aliases.update(data.get('aliases', {}))
+        return desk
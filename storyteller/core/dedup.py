@@ -0,0 +1,128 @@
+# storyteller/core/dedup.py
+"""
+👯 The Déjà Vu Detector - Spotting Moments We've Basically Seen Before!
+
+Long adventures are full of little filler turns ("I look around the room
+carefully...") that say almost exactly the same thing. This detector gives
+every turn a tiny MinHash fingerprint and files it into LSH buckets, so we can
+tell in an instant whether a new turn is a near-copy of an older one. Copies get
+folded into a single representative with a count, keeping our memory lean!
+"""
+
+import random
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+class NearDuplicateIndex:
+    """👯 MinHash signatures + LSH buckets, updated one turn at a time!"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.8,
+                 shingle_size: int = 3, seed: int = 7):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)  # Fixed seed so fingerprints are stable between sessions
+        self._a = np.array([rng.randrange(1, _MERSENNE_PRIME) for _ in range(num_perm)], dtype=np.int64)
+        self._b = np.array([rng.randrange(0, _MERSENNE_PRIME) for _ in range(num_perm)], dtype=np.int64)
+
+        self._buckets: List[Dict[Tuple[int, ...], int]] = [{} for _ in range(bands)]  # band -> bucket -> representative
+        self._signatures: Dict[int, np.ndarray] = {}   # representative turn -> fingerprint
+        self.representative_of: Dict[int, int] = {}    # every turn -> the turn that stands in for it
+        self.group_sizes: Dict[int, int] = {}          # representative turn -> how many turns it covers
+
+    def _shingles(self, text: str) -> Set[int]:
+        words = text.lower().split()
+        if len(words) < self.shingle_size:
+            return {zlib.crc32(" ".join(words).encode())}
+        return {
+            zlib.crc32(" ".join(words[i:i + self.shingle_size]).encode())
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+
+    def signature(self, text: str) -> np.ndarray:
+        """🔏 Squeeze a turn down to a fixed-size MinHash fingerprint"""
+        hashes = np.fromiter(self._shingles(text), dtype=np.int64) % _MERSENNE_PRIME
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows:(band + 1) * self.rows].tolist())
+
+    def add(self, turn_id: int, text: str) -> Optional[int]:
+        """📥 Fingerprint a new turn; returns the older turn it duplicates, if any"""
+        signature = self.signature(text)
+
+        candidates = {self._buckets[band].get(key) for band, key in self._band_keys(signature)}
+        candidates.discard(None)
+        best, best_similarity = None, 0.0
+        for candidate in candidates:
+            similarity = float(np.mean(self._signatures[candidate] == signature))
+            if similarity > best_similarity:
+                best, best_similarity = candidate, similarity
+
+        if best is not None and best_similarity >= self.threshold:
+            self.representative_of[turn_id] = best
+            self.group_sizes[best] += 1
+            return best
+
+        # Something new! It becomes the representative for any look-alikes to come
+        self._file(turn_id, signature)
+        return None
+
+    def _file(self, turn_id: int, signature: np.ndarray, group_size: int = 1):
+        self.representative_of[turn_id] = turn_id
+        self.group_sizes[turn_id] = group_size
+        self._signatures[turn_id] = signature
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, turn_id)
+
+    def representative(self, turn_id: int) -> int:
+        return self.representative_of.get(turn_id, turn_id)
+
+    def group_size(self, turn_id: int) -> int:
+        """How many turns (including itself) this turn's representative stands for"""
+        return self.group_sizes.get(self.representative(turn_id), 1)
+
+    def duplicates(self) -> Dict[int, int]:
+        """Every folded-away turn, mapped to its representative"""
+        return {turn: rep for turn, rep in self.representative_of.items() if turn != rep}
+
+    def __len__(self) -> int:
+        """How many distinct (representative) turns we've seen"""
+        return len(self._signatures)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """📦 Each representative's fingerprint (as hex) and group size, plus who repeats whom
+        
+        Saving the fingerprints means turns packed away in cold storage still
+        catch their repeats after a restart - no need to unpack them to re-read.
+        """
+        return {
+            'signatures': {
+                turn_id: [signature.astype('<u4').tobytes().hex(), self.group_sizes.get(turn_id, 1)]
+                for turn_id, signature in self._signatures.items()
+            },
+            'duplicates': self.duplicates()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **options) -> 'NearDuplicateIndex':
+        """Bring back what to_dict saved (oldest representative first, so buckets fill the same way)"""
+        index = cls(**options)
+        signatures = sorted(data.get('signatures', {}).items(), key=lambda item: int(item[0]))
+        for turn_id, (signature, group_size) in signatures:
+            index._file(int(turn_id), np.frombuffer(bytes.fromhex(signature), dtype='<u4').astype(np.int64), group_size)
+        for turn_id, representative in data.get('duplicates', {}).items():
+            index.representative_of[int(turn_id)] = representative
+        return index
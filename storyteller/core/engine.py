@@ -11,12 +11,17 @@ to create truly immersive experiences that grow and evolve with every session!
 """
 
 import json
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Iterator, Optional, Tuple
 
 from .character import Character
 from .memory import DocumentMemorySystem
-from .npc import NPCManager
-from ..utils.llm import llm_client
+from .npc import NPCManager, NPCAnalysis
+from .npc_stream import NPCStreamScanner
+from ..utils.llm import llm_client, StreamResult
+from ..utils.text import TextAnalysis
+from ..config import (MEMORY_RETRIEVAL_BUDGET_MS, MAX_RELATIONSHIP_CONTEXT, NPC_INTERACTIONS_IN_PROMPT,
+                      NPC_CONTEXT_TOP_K)
 
 
 class StorytellingEngine:
@@ -37,6 +42,33 @@ class StorytellingEngine:
             })
         return quests
 
+    def set_current_quest(self, number: int):
+        """🧭 Move the adventure on to another quest from the plot!"""
+        if number not in {quest["number"] for quest in self.get_plot()}:
+            raise ValueError(f"There is no quest number {number} in this plot")
+        self.current_quest = number
+
+    def advance_quest(self) -> Optional[Dict[str, Any]]:
+        """🏁 Quest complete - on to the next one! (None once the last quest is behind you)
+        
+        The move goes into memory as a turn of its own under the new quest, so
+        every turn after it is filed under the right quest - even after a restart.
+        """
+        plot = self.get_plot()
+        numbers = [quest["number"] for quest in plot]
+        position = numbers.index(self.current_quest)
+        if position + 1 >= len(numbers):
+            return None
+        
+        finished, upcoming = plot[position], plot[position + 1]
+        self.set_current_quest(upcoming["number"])
+        self.memory.add_conversation_turn(
+            f"[Quest Complete: {finished['title']}]",
+            f"[Quest Begins: {upcoming['title']} - {upcoming['theme']}]",
+            quest=self.current_quest
+        )
+        return upcoming
+
     def get_possible_endings(self):
         """🏆 Discover the possible ways your epic story could conclude!"""
         return [
@@ -49,13 +81,23 @@ class StorytellingEngine:
     
     def __init__(self, memory_path: str = None):
         self.memory = DocumentMemorySystem(memory_path)  # Our amazing memory palace
-        self.npc_manager = NPCManager()                   # All the characters you'll meet
+        self.npc_manager = NPCManager(self.memory.save_path)  # All the characters you'll meet (and met before!)
+        self.npc_manager.roster_listeners.append(self.memory.register_entity)  # New faces get one fact tag
         self.character: Optional[Character] = None        # Your heroic character
         self.game_started = False                         # Adventure status
+        self.current_quest = self._resume_quest()          # Which quest we're on right now
+        self.last_stream: Optional[StreamResult] = None   # How the last streamed reply went (tokens, timing)
         
         # Welcome back any returning heroes!
         self._load_character()
     
+    def _resume_quest(self) -> int:
+        """🧭 Pick up on the quest the latest remembered turn was part of (or the first one)"""
+        for entry in reversed(self.memory.conversation_history):
+            if entry.quest is not None:
+                return entry.quest
+        return self.get_plot()[0]["number"]
+    
     def _load_character(self):
         """🔍 Look for any returning heroes who want to continue their adventure!"""
         try:
@@ -107,24 +149,58 @@ class StorytellingEngine:
         # Add to memory
         self.memory.add_conversation_turn(
             f"[Character Created: {self.character.name}]", 
-            intro
+            intro,
+            quest=self.current_quest
         )
         
         self.game_started = True
         return intro
     
-    def process_player_action(self, action: str) -> str:
-        """Process player action and generate DM response"""
+    def _check_action(self, action: str) -> Optional[str]:
+        """Why we can't play this action yet (None when we can)"""
         if not self.game_started:
             return "Please start an adventure first!"
         
         if not action.strip():
             return "Please tell me what you want to do."
+        return None
+    
+    def _prepare_turn(self, action: str) -> Tuple[TextAnalysis, NPCAnalysis, str, str]:
+        """🧰 Everything the storyteller needs before it can answer: the action, its NPCs and the context"""
+        # Read the action once - every stage below shares this one analysis
+        action_analysis = TextAnalysis.of(action)
+        
+        # One NPC pass over the action: mentions, scene changes and how everyone feels about it
+        action_npcs = self.npc_manager.apply(self.npc_manager.analyze(action_analysis), react_to_tone=True)
+        mentioned_npcs = action_npcs.mentioned
         
-        # Retrieve relevant memories
-        relevant_memories = self.memory.retrieve_relevant_memories(action)
+        # Retrieve relevant memories, with an extra lookup for every NPC we spotted,
+        # going with whatever we've found once the memory time budget runs out
+        relevant_memories = self.memory.retrieve_relevant_memories(
+            action_analysis, entities=mentioned_npcs,
+            deadline=time.perf_counter() + MEMORY_RETRIEVAL_BUDGET_MS / 1000
+        )
         memory_context = "\n".join(relevant_memories) if relevant_memories else "No relevant past events."
         
+        # Remind the storyteller who did what to whom among the NPCs in this scene
+        relationships = self.memory.relationship_graph.relations_around(
+            self.npc_manager.current_npcs | set(mentioned_npcs), limit=MAX_RELATIONSHIP_CONTEXT
+        )
+        if relationships:
+            memory_context += "\n\nKnown Relationships:\n" + "\n".join(
+                relationship.describe() for relationship in relationships
+            )
+        
+        # ...and how the player treated the ones that matter most lately, straight from their diaries
+        # (whoever the action names, then the most salient in the scene - never the whole crowd)
+        interactions = []
+        for name in list(dict.fromkeys([*mentioned_npcs, *self.npc_manager.salient_npcs()]))[:NPC_CONTEXT_TOP_K]:
+            diary = self.memory.npc_interactions.recent(name, NPC_INTERACTIONS_IN_PROMPT)
+            if diary:
+                interactions.append(f"{name}: " + "; ".join(interaction.describe() for interaction in diary))
+        if interactions:
+            memory_context += "\n\nPast Interactions:\n" + "\n".join(interactions)
+        
         # Get recent conversation context (last 3 turns)
         recent_context = ""
         if len(self.memory.conversation_history) > 0:
@@ -134,39 +210,87 @@ class StorytellingEngine:
                 for turn in recent_turns
             ])
         
-        # Get NPC context
+        return action_analysis, action_npcs, memory_context, recent_context
+    
+    def _record_turn(self, action_analysis: TextAnalysis, action_npcs: NPCAnalysis, response_analysis: TextAnalysis):
+        """📝 Put the finished turn into memory, tagged with who was around and which quest we're on"""
+        mentioned_npcs = action_npcs.mentioned
+        self.memory.add_conversation_turn(
+            action_analysis, response_analysis,
+            npcs=self.npc_manager.current_npcs | set(mentioned_npcs),
+            quest=self.current_quest,
+            mentioned=mentioned_npcs, tone=action_npcs.tone, tone_delta=action_npcs.mood.delta
+        )
+        self.npc_manager.save()  # Only what changed this turn gets written
+    
+    def process_player_action(self, action: str) -> str:
+        """Process player action and generate DM response"""
+        problem = self._check_action(action)
+        if problem:
+            return problem
+        
+        action_analysis, action_npcs, memory_context, recent_context = self._prepare_turn(action)
+        
+        # Who's in the scene and how they feel - the most salient few, within budget
         npc_context = self.npc_manager.get_npc_context()
         
         character_info = self.character.get_description()
         
         # Generate DM response
-        full_context = f"{character_info}\n\nNPC States:\n{npc_context}\n\nRecent Context:\n{recent_context}\n\nRelevant Memories:\n{memory_context}"
         dm_response = llm_client.continue_story(
-            character_info, memory_context, recent_context, action
+            character_info, memory_context, recent_context, action, npc_context
         )
         
-        # Process NPCs mentioned in player action and update current NPCs
-        self.npc_manager.update_current_npcs(action)
-        mentioned_npcs = self.npc_manager.get_mentioned_npcs(action)
-        if mentioned_npcs:
-            tone = self.npc_manager.analyze_player_tone(action)
-            for npc_name in mentioned_npcs:
-                self.npc_manager.update_npc_emotion(npc_name, tone, action)
-        
-        # Extract new NPCs from DM response and update current NPCs
-        self.npc_manager.process_dm_response_for_npcs(dm_response)
+        # Read the response once too, then one NPC pass: new characters and scene changes
+        response_analysis = TextAnalysis.of(dm_response)
+        self.npc_manager.apply(self.npc_manager.analyze(response_analysis, find_new_npcs=True))
         
-        # Add to memory
-        self.memory.add_conversation_turn(action, dm_response)
+        self._record_turn(action_analysis, action_npcs, response_analysis)
         
         return dm_response
     
+    def process_player_action_stream(self, action: str) -> Iterator[str]:
+        """🌊 Like process_player_action, but the DM's reply arrives piece by piece as it's written
+        
+        NPCs are spotted sentence by sentence while the reply streams in, and the
+        whole turn goes into memory once the last piece is out. Stop reading
+        early (close this generator) and the AI's stream is hung up and the turn
+        isn't recorded - but, just like a finished turn, the action has already
+        been read by then: the NPCs it named were noticed, joined the scene and
+        reacted to your tone, and those feelings are saved with the next turn.
+        `last_stream` has the token counts and timing afterwards.
+        """
+        problem = self._check_action(action)
+        if problem:
+            yield problem
+            return
+        
+        action_analysis, action_npcs, memory_context, recent_context = self._prepare_turn(action)
+        npc_context = self.npc_manager.get_npc_context()
+        character_info = self.character.get_description()
+        
+        stream = llm_client.continue_story_stream(character_info, memory_context, recent_context, action,
+                                                  npc_context)
+        npc_scanner = NPCStreamScanner(self.npc_manager)  # New faces join while the DM is still talking
+        try:
+            for piece in stream:
+                npc_scanner.feed(piece)
+                yield piece
+        finally:
+            stream.close()  # Hang up on the AI even if the reader stopped early
+        self.last_stream = stream.result
+        
+        # The scanner already read every word - its analysis is the response's one read
+        response_npcs = npc_scanner.finish()
+        self._record_turn(action_analysis, action_npcs, response_npcs.text)
+    
     def get_memory_summary(self) -> Dict[str, Any]:
         """Get a summary of current memory state"""
         summary = self.memory.get_summary()
         summary['character'] = self.character.to_dict() if self.character else None
         summary['npcs'] = self.npc_manager.get_npc_states()
         summary['current_npcs'] = self.npc_manager.get_current_npc_states()
+        summary['npc_registry'] = self.npc_manager.npcs.stats()
         return summary
     
     def get_character_info(self) -> Optional[Dict[str, Any]]:
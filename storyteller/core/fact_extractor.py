@@ -0,0 +1,96 @@
+# storyteller/core/fact_extractor.py
+"""
+🔬 The Fact Finder - Spotting Names, Loot, Places and Deeds in One Read!
+
+Instead of running a pile of separate searches over every sentence, the fact
+finder walks through the shared text reader's words a single time, noticing
+names (Capitalized, just like real names!) and who-did-what-to-whom all along
+the way. Epic loot and amazing places come from the shared keyword spotter's
+single read, so nobody has to search for them twice.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Tuple, Union
+
+from ..config import RELATIONSHIP_VERBS
+from ..utils.text import TextAnalysis, is_word
+
+# Capitalized words that start sentences rather than names ("The", "You", ...)
+_NOT_NAMES = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'so', 'yet', 'for', 'nor', 'as', 'at', 'by',
+    'in', 'on', 'of', 'to', 'up', 'if', 'then', 'when', 'while', 'with', 'from', 'into',
+    'i', 'you', 'your', 'he', 'him', 'his', 'she', 'her', 'it', 'its', 'we', 'our',
+    'they', 'them', 'their', 'this', 'that', 'these', 'those', 'there', 'here',
+    'what', 'which', 'who', 'why', 'how', 'where', 'after', 'before', 'suddenly',
+    'finally', 'meanwhile', 'now', 'yes', 'no', 'not', 'please', 'thank', 'thanks',
+})
+
+
+@dataclass
+class ExtractedFacts:
+    """🗃️ Everything the fact finder noticed in one piece of text"""
+
+    entities: List[str] = field(default_factory=list)                 # Names, loot and places
+    relations: List[Tuple[str, str, str]] = field(default_factory=list)  # (who, did what, to whom)
+
+    def as_fact_strings(self) -> List[str]:
+        """The classic flat fact list: entities plus "who -> whom" relations"""
+        facts = list(self.entities)
+        facts.extend(f"{subject} -> {obj}" for subject, _, obj in self.relations)
+        return list(dict.fromkeys(facts))  # Keep each fact only once (in order!)
+
+
+class FactExtractor:
+    """🔬 One tokenizer pass + a tiny state machine = every fact in a single scan!"""
+
+    def __init__(self, relationship_verbs=RELATIONSHIP_VERBS):
+        self.verb_types = {
+            verb.lower(): relation
+            for relation, verbs in relationship_verbs.items()
+            for verb in verbs
+        }
+
+    def extract(self, text: Union[str, TextAnalysis]) -> ExtractedFacts:
+        """🔍 Walk the text's words once and collect every entity and relationship
+
+        Pass a TextAnalysis if the text has already been read, so nothing is read twice.
+        """
+        analysis = TextAnalysis.ensure(text)
+        tokens, folded = analysis.tokens, analysis.folded
+        found = ExtractedFacts()
+
+        # Names: runs of Capitalized words (sentence starters like "The" aren't part of the name)
+        for start, end in analysis.capitalized_spans:
+            while start < end and folded[start] in _NOT_NAMES:
+                start += 1
+            name = " ".join(tokens[start:end])
+            if len(name) > 2:
+                found.entities.append(name)
+
+        # Relationships: <who> <verb> [to] <whom>, all plain words in a row
+        count = len(tokens)
+        for i in range(count - 2):
+            relation = self.verb_types.get(folded[i + 1])
+            if not relation or not is_word(tokens[i]) or not is_word(tokens[i + 2]):
+                continue
+            target = i + 2
+            if (relation == 'told' and folded[target] == 'to'
+                    and target + 1 < count and is_word(tokens[target + 1])):
+                target += 1
+            found.relations.append((tokens[i], relation, tokens[target]))
+
+        # Loot and places, straight from the shared keyword spotter
+        found.entities.extend(
+            analysis.text[hit.start:hit.end] for hit in analysis.keyword_hits
+            if hit.whole_word and hit.category in ('loot', 'place')
+        )
+
+        return found
+
+    def extract_facts(self, text: Union[str, TextAnalysis]) -> List[str]:
+        """The classic flat fact list for a piece of text"""
+        return self.extract(text).as_fact_strings()
+
+
+# 🔬 One shared fact finder, built once and ready for every turn!
+fact_extractor = FactExtractor()
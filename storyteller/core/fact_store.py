@@ -0,0 +1,205 @@
+# storyteller/core/fact_store.py
+"""
+🗃️ The Fact Cabinet - Room for the Facts That Matter, Not Every Stray Word!
+
+Every turn drops a handful of facts into our cabinet, and over a long campaign
+lots of them are just noise that's never mentioned again. The cabinet has a
+fixed number of drawers: facts that keep coming up (or came up recently) stay,
+while rare, long-forgotten ones get cleared out to make room. It also tidies
+away references to turns we no longer have, so no drawer points at nothing.
+Every fact is filed under its canonical tag, so "Marcus" and "marcus's" open
+the same drawer.
+"""
+
+import heapq
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from ..config import FACT_STORE_CAPACITY, FACT_RECENCY_HALF_LIFE, FACT_EVICTION_SLACK
+from .canonical import FactCanonicalizer, RELATION_ARROW
+
+
+class FactStore(MutableMapping):
+    """🗃️ fact -> turn ids, capped with a frequency/recency (LFU/LRU hybrid) eviction policy
+
+    Works just like the old `fact_database` dict, so `fact in store`,
+    `store[fact]` and `store.keys()` all keep working - with any surface form
+    of a fact, since keys are canonical ids from the FactCanonicalizer.
+    """
+
+    def __init__(self, capacity: int = FACT_STORE_CAPACITY,
+                 half_life: float = FACT_RECENCY_HALF_LIFE,
+                 slack: float = FACT_EVICTION_SLACK,
+                 canonicalizer: Optional[FactCanonicalizer] = None):
+        self.canonicalizer = canonicalizer or FactCanonicalizer()
+        self.capacity = capacity      # The most facts we'll keep (None or 0 = no limit)
+        self.half_life = half_life    # Turns until an unused fact's popularity counts half as much
+        self.slack = slack            # Clear out a little extra so we don't evict on every turn
+        self._postings: Dict[str, List[int]] = {}  # fact -> turns it showed up in
+        self._uses: Dict[str, int] = {}            # fact -> how often it was seen or looked up
+        self._last_used: Dict[str, int] = {}       # fact -> the turn it was last seen or looked up
+        self._by_word: Dict[str, Set[str]] = {}    # word -> facts containing it (so a new alias re-tags only those)
+        self.clock = 0                             # The newest turn we know about
+        self.evictions = 0
+        self.collected_postings = 0
+
+    # 📚 The dict-like side, so everything that used `fact_database` keeps working
+    def __getitem__(self, fact: str) -> List[int]:
+        return self._postings[self.canonicalizer.canonical(fact)]
+
+    def __setitem__(self, fact: str, turn_ids: List[int]):
+        fact = self.canonicalizer.canonical(fact)
+        if fact not in self._postings:
+            self._index_words(fact)
+        self._postings[fact] = turn_ids
+        self._uses[fact] = max(self._uses.get(fact, 0), len(turn_ids))
+        self._last_used[fact] = max(turn_ids, default=self.clock)
+        self._enforce_capacity()
+
+    def __delitem__(self, fact: str):
+        self._forget(self.canonicalizer.canonical(fact))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def __contains__(self, fact: Any) -> bool:
+        return isinstance(fact, str) and self.canonicalizer.canonical(fact) in self._postings
+
+    # 📥 Filing and finding facts
+    def add(self, fact: str, turn_id: int):
+        """File a fact under the turn it showed up in"""
+        fact = self.canonicalizer.canonical(fact)
+        self.clock = max(self.clock, turn_id)
+        if fact not in self._postings:
+            self._index_words(fact)
+        postings = self._postings.setdefault(fact, [])
+        if not postings or postings[-1] != turn_id:
+            postings.append(turn_id)
+        self._uses[fact] = self._uses.get(fact, 0) + 1
+        self._last_used[fact] = self.clock
+        self._enforce_capacity()
+
+    def touch(self, fact: str) -> Optional[List[int]]:
+        """Look a fact up *and* count it as used, so popular facts stay in the cabinet"""
+        fact = self.canonicalizer.canonical(fact)
+        postings = self._postings.get(fact)
+        if postings is not None:
+            self._uses[fact] += 1
+            self._last_used[fact] = self.clock
+        return postings
+
+    def score(self, fact: str) -> float:
+        """How much a fact deserves its drawer: how often it's used, fading the longer it sits idle"""
+        idle = self.clock - self._last_used.get(fact, 0)
+        return self._uses.get(fact, 0) * 0.5 ** (idle / self.half_life)
+
+    def _enforce_capacity(self):
+        """🧹 Over capacity? Clear out the least-used, longest-idle facts in one batch"""
+        if not self.capacity or len(self._postings) <= self.capacity:
+            return
+        target = int(self.capacity * (1 - self.slack))
+        for fact in heapq.nsmallest(len(self._postings) - target, self._postings, key=self.score):
+            self._forget(fact)
+            self.evictions += 1
+
+    @staticmethod
+    def words_of(fact: str) -> List[str]:
+        """The words in a fact's tag (both sides of a relation)"""
+        return fact.replace(RELATION_ARROW, " ").split()
+
+    def _index_words(self, fact: str):
+        for word in self.words_of(fact):
+            self._by_word.setdefault(word, set()).add(fact)
+
+    def _unindex_words(self, fact: str):
+        for word in self.words_of(fact):
+            facts = self._by_word.get(word)
+            if facts is not None:
+                facts.discard(fact)
+                if not facts:
+                    del self._by_word[word]
+
+    def _forget(self, fact: str):
+        """Drop a drawer by its canonical id"""
+        del self._postings[fact]
+        self._uses.pop(fact, None)
+        self._last_used.pop(fact, None)
+        self._unindex_words(fact)
+
+    def _merge_into(self, canonical: str, postings: List[int], uses: int, last_used: int):
+        """Fold a drawer's contents into the drawer for its canonical id"""
+        existing = self._postings.get(canonical)
+        if canonical not in self._postings:
+            self._index_words(canonical)
+        self._postings[canonical] = sorted(set(existing) | set(postings)) if existing else list(postings)
+        self._uses[canonical] = self._uses.get(canonical, 0) + uses if existing else uses
+        self._last_used[canonical] = max(self._last_used.get(canonical, last_used), last_used)
+
+    def recanonicalize(self, words: Optional[Iterable[str]] = None) -> int:
+        """🪪 Re-tag drawers (e.g. after a new NPC joined) and merge the ones that now match
+
+        Pass the new name's words to re-tag only the drawers that contain one of
+        them - everything else can't have changed. Without words, every drawer.
+        """
+        if words is None:
+            facts = list(self._postings)
+        else:
+            facts = sorted(set().union(*(self._by_word.get(word, ()) for word in words)))
+        merged = 0
+        for fact in facts:
+            if fact not in self._postings:
+                continue  # Already merged into another drawer this round
+            canonical = self.canonicalizer.canonical(fact)
+            if canonical != fact:
+                postings, uses, last_used = self._postings.pop(fact), self._uses.pop(fact), self._last_used.pop(fact)
+                self._unindex_words(fact)
+                self._merge_into(canonical, postings, uses, last_used)
+                merged += 1
+        return merged
+
+    def collect_garbage(self, is_live: Callable[[int], bool]) -> int:
+        """🧹 Drop references to turns we no longer have (and facts left with none); returns how many went"""
+        removed = 0
+        for fact in list(self._postings):
+            postings = self._postings[fact]
+            live = [turn_id for turn_id in postings if is_live(turn_id)]
+            if len(live) != len(postings):
+                removed += len(postings) - len(live)
+                if live:
+                    self._postings[fact] = live
+                else:
+                    self._forget(fact)
+        self.collected_postings += removed
+        return removed
+
+    # 💾 Saving and loading
+    def to_dict(self) -> Dict[str, List[int]]:
+        return dict(self._postings)
+
+    def usage_to_dict(self) -> Dict[str, List[int]]:
+        """How popular each fact is ([uses, last used turn]), so eviction picks up where it left off"""
+        return {fact: [self._uses[fact], self._last_used[fact]] for fact in self._postings}
+
+    @classmethod
+    def from_dict(cls, postings: Dict[str, List[int]], usage: Optional[Dict[str, List[int]]] = None,
+                  **settings) -> 'FactStore':
+        """Load saved facts (older saves used raw surface forms - those get merged here)"""
+        store = cls(**settings)
+        usage = usage or {}
+        for fact, turn_ids in postings.items():
+            uses, last_used = usage.get(fact, (len(turn_ids), max(turn_ids, default=0)))
+            store._merge_into(store.canonicalizer.canonical(fact), list(turn_ids), uses, last_used)
+            store.clock = max(store.clock, last_used)
+        store._enforce_capacity()
+        return store
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'facts': len(self._postings),
+            'capacity': self.capacity,
+            'evictions': self.evictions,
+            'collected_postings': self.collected_postings
+        }
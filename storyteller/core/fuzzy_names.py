@@ -0,0 +1,145 @@
+# storyteller/core/fuzzy_names.py
+"""
+🔤 The Spelling Forgiver - "Marcos"? You Must Mean Marcus!
+
+Players (and storytellers!) misspell names all the time. Rather than meeting a
+brand new "Elana" every time someone types Elena's name wrong, the forgiver
+files every known name under its three-letter pieces ("mar", "arc", "rcu"...).
+A misspelled name still shares most of those pieces with the real one, so we
+count shared pieces for the whole roster in one array operation, keep only
+names of about the right length with enough pieces in common, and double-check
+that handful with a letter-by-letter comparison - all of them side by side, so
+it costs the same whether there are three lookalikes or three hundred.
+"""
+
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from ..config import FUZZY_NAME_MAX_EDITS, FUZZY_NAME_MIN_LENGTH
+from .lexicons import NOT_NPC_NAMES
+
+
+def _trigrams(folded: str) -> List[str]:
+    """Three-letter pieces of a name, padded so the first and last letters count extra"""
+    padded = f"  {folded} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _codes(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.int32)
+
+
+def edit_distances(word: str, spellings: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Levenshtein distance from `word` to many spellings at once
+
+    `spellings` holds one spelling per row as character codes, padded on the
+    right (the padding never matters - we read each row's answer at its own
+    length). One row of the classic table is worked out for every spelling
+    together; adding a letter is a running minimum along the row.
+    """
+    count, width = spellings.shape
+    steps = np.arange(width + 1)
+    previous = np.tile(steps, (count, 1))
+    current = np.empty_like(previous)
+    for i, code in enumerate(_codes(word).tolist(), 1):
+        current[:, 0] = i
+        np.minimum(previous[:, :-1] + (spellings != code),   # Swap a letter (or keep it)
+                   previous[:, 1:] + 1,                      # Drop a letter
+                   out=current[:, 1:])
+        current -= steps
+        np.minimum.accumulate(current, axis=1, out=current)  # Add a letter
+        current += steps
+        previous, current = current, previous
+    return previous[np.arange(count), lengths]
+
+
+class FuzzyNameIndex:
+    """🔤 A character-trigram index over the NPC roster with an edit-distance check"""
+
+    def __init__(self, max_edits: int = FUZZY_NAME_MAX_EDITS, min_length: int = FUZZY_NAME_MIN_LENGTH):
+        self.max_edits = max_edits      # The most typos we'll forgive in a long name
+        self.min_length = min_length    # Shorter words are too easy to confuse
+        self._postings: Dict[str, List[int]] = {}    # trigram -> ids of the spellings that contain it
+        self._arrays: Dict[str, np.ndarray] = {}     # ...the same, as arrays (rebuilt when a posting grows)
+        self._spellings: List[str] = []              # id -> spelling (folded)
+        self._lengths = np.zeros(16, dtype=np.int32)       # id -> how long that spelling is
+        self._letters = np.full((16, 16), -1, np.int32)    # id -> its character codes, padded with -1
+        self._names: Dict[str, str] = {}             # spelling -> the NPC it belongs to
+        self._roster: Set[str] = set()               # Every NPC we've filed
+
+    def _file(self, spelling: str, name: str):
+        if spelling in self._names:
+            return
+        self._names[spelling] = name
+        spelling_id = len(self._spellings)
+        self._spellings.append(spelling)
+        for gram in set(_trigrams(spelling)):
+            self._postings.setdefault(gram, []).append(spelling_id)
+            self._arrays.pop(gram, None)
+
+        # Room for one more row (and a longer name), doubling like the NPC table does
+        rows, width = self._letters.shape
+        if spelling_id >= rows or len(spelling) > width:
+            letters = np.full((max(rows, 2 * spelling_id), max(width, 2 * len(spelling))), -1, np.int32)
+            letters[:rows, :width] = self._letters
+            self._letters = letters
+            self._lengths = np.concatenate([self._lengths, np.zeros(len(letters) - rows, np.int32)])
+        self._letters[spelling_id, :len(spelling)] = _codes(spelling)
+        self._lengths[spelling_id] = len(spelling)
+
+    def _posting(self, gram: str) -> Optional[np.ndarray]:
+        array = self._arrays.get(gram)
+        if array is None and gram in self._postings:
+            array = self._arrays[gram] = np.array(self._postings[gram], dtype=np.int32)
+        return array
+
+    def add(self, name: str):
+        """File an NPC's name (and for "Marcus Blackwood", their first name too)"""
+        folded = " ".join(name.lower().split())
+        if not folded:
+            return
+        self._roster.add(name)
+        self._file(folded, name)
+        first = folded.split()[0]
+        if first != folded and first not in NOT_NPC_NAMES and len(first) >= self.min_length:
+            self._file(first, name)
+
+    def allowed_edits(self, length: int) -> int:
+        """One typo in a short name, up to max_edits in longer ones"""
+        return min(self.max_edits, 1 if length <= 6 else 2)
+
+    def resolve(self, text: str) -> Optional[str]:
+        """🔍 The NPC this (possibly misspelled) name most likely means, or None if nobody's close"""
+        folded = " ".join(text.lower().split())
+        if folded in self._names:
+            return self._names[folded]
+        if len(folded) < self.min_length or not self._names:
+            return None
+
+        limit = self.allowed_edits(len(folded))
+        grams = _trigrams(folded)
+        postings = [posting for posting in map(self._posting, grams) if posting is not None]
+        if not postings:
+            return None
+
+        # Shared pieces for every spelling at once. Each typo spoils at most three pieces (and
+        # changes the length by at most one), so anything further off can't be close enough
+        lengths = self._lengths[:len(self._spellings)]
+        shared = np.bincount(np.concatenate(postings), minlength=len(self._spellings))
+        needed = np.maximum(len(grams), lengths + 1) - 3 * limit
+        lookalikes = np.flatnonzero((shared >= needed) & (np.abs(lengths - len(folded)) <= limit))
+        if not len(lookalikes):
+            return None
+
+        width = int(lengths[lookalikes].max())
+        distances = edit_distances(folded, self._letters[lookalikes, :width], lengths[lookalikes])
+        best_distance = int(distances.min())
+        if best_distance > limit:
+            return None
+        closest = {self._names[self._spellings[spelling_id]]
+                   for spelling_id in lookalikes[distances == best_distance].tolist()}
+        return closest.pop() if len(closest) == 1 else None  # When two NPCs are equally close we don't guess
+
+    def __len__(self) -> int:
+        return len(self._roster)
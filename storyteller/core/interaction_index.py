@@ -0,0 +1,86 @@
+# storyteller/core/interaction_index.py
+"""
+📇 The Character Diary - How You've Treated Everyone, Turn by Turn!
+
+When Marcus shows up again, the storyteller should remember that last time you
+threatened him - without searching through every memory we have. The diary
+keeps, for every NPC, the turns they were spoken to or were around for, and
+how you sounded each time. Their last few entries are right at the end of
+their page, so reminding the storyteller costs only as much as what we show -
+and each page only keeps the latest entries, so a regular doesn't fill a book.
+"""
+
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List
+
+from ..config import INTERACTION_SUMMARY_CHARS, NPC_DIARY_MAX_ENTRIES
+
+
+@dataclass
+class Interaction:
+    """📝 One turn in one NPC's diary"""
+
+    turn_id: int
+    tone: str = "Neutral"      # How the player sounded
+    delta: int = 0             # What it did to the relationship
+    mentioned: bool = False    # Spoken to or about (rather than just being around)
+    summary: str = ""          # What the player did, trimmed
+
+    def describe(self) -> str:
+        change = f", {self.delta:+d}" if self.delta else ""
+        how = "you addressed them" if self.mentioned else "they were there"
+        said = f': "{self.summary}"' if self.summary else ""
+        return f"turn {self.turn_id} ({how}, {self.tone}{change}){said}"
+
+
+class InteractionIndex:
+    """📇 NPC -> the latest turns they were mentioned in or present for, with tone, in turn order"""
+
+    def __init__(self, max_entries: int = NPC_DIARY_MAX_ENTRIES):
+        self.max_entries = max_entries  # Per NPC; the oldest entries are dropped first
+        self._by_npc: Dict[str, List[Interaction]] = {}
+
+    @staticmethod
+    def key(name: str) -> str:
+        """The name we file an NPC under (so "Marcus" and "marcus" share a page)"""
+        return name.strip().lower()
+
+    @staticmethod
+    def summarize(action: str, limit: int = INTERACTION_SUMMARY_CHARS) -> str:
+        action = " ".join(action.split())
+        return action if len(action) <= limit else action[:limit - 3].rstrip() + "..."
+
+    def record(self, turn_id: int, mentioned: Iterable[str] = (), present: Iterable[str] = (),
+               tone: str = "Neutral", delta: int = 0, action: str = ""):
+        """✍️ Write this turn into the diary of everyone mentioned or around"""
+        summary = self.summarize(action) if action else ""
+        mentioned = {self.key(name) for name in mentioned}
+        for name in mentioned | {self.key(name) for name in present}:
+            addressed = name in mentioned
+            diary = self._by_npc.setdefault(name, [])
+            diary.append(Interaction(
+                turn_id, tone if addressed else "Neutral", delta if addressed else 0, addressed, summary
+            ))
+            if len(diary) > self.max_entries:
+                del diary[:len(diary) - self.max_entries]
+
+    def recent(self, name: str, k: int) -> List[Interaction]:
+        """The last k entries for an NPC, newest last"""
+        return self._by_npc.get(self.key(name), [])[-k:] if k > 0 else []
+
+    def turns(self, name: str) -> List[int]:
+        """The turns an NPC was mentioned in or around for (as far back as the diary goes)"""
+        return [interaction.turn_id for interaction in self._by_npc.get(self.key(name), [])]
+
+    def to_dict(self) -> Dict[str, List[Dict]]:
+        return {name: [asdict(interaction) for interaction in diary] for name, diary in self._by_npc.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, List[Dict]]) -> 'InteractionIndex':
+        index = cls()
+        for name, diary in data.items():
+            index._by_npc[name] = [Interaction(**interaction) for interaction in diary[-index.max_entries:]]
+        return index
+
+    def __len__(self) -> int:
+        return len(self._by_npc)
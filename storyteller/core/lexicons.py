@@ -0,0 +1,91 @@
+# storyteller/core/lexicons.py
+"""
+📖 The Word Lists - Everything That Looks Like a Name But Isn't!
+
+"The", "Dragon", "Tomorrow" and "Sword" all show up capitalized at the start
+of a sentence, but none of them is a character we should welcome to the story.
+These lists are built once when the module loads (as frozensets, so nobody can
+accidentally change them) and shared by every NPC manager.
+"""
+
+# Pronouns, articles, prepositions and the other little words that glue sentences together
+FUNCTION_WORDS = frozenset({
+    'you', 'your', 'yours', 'yourself', 'we', 'us', 'our', 'ours', 'ourselves',
+    'they', 'them', 'their', 'theirs', 'themselves', 'he', 'him', 'his', 'himself',
+    'she', 'her', 'hers', 'herself', 'it', 'its', 'itself', 'i', 'me', 'my',
+    'mine', 'myself', 'the', 'a', 'an', 'and', 'or', 'but', 'so', 'yet', 'for',
+    'nor', 'to', 'in', 'on', 'at', 'by', 'up', 'of', 'as', 'is', 'am', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can',
+    'this', 'that', 'these', 'those', 'here', 'there', 'where', 'when', 'why',
+    'how', 'what', 'which', 'who', 'whom', 'whose', 'if', 'then', 'else',
+    'while', 'until', 'since', 'because', 'although', 'though', 'unless',
+    'before', 'after', 'during', 'within', 'without', 'between', 'among',
+    'through', 'across', 'over', 'under', 'above', 'below', 'beside', 'behind',
+    'with', 'from', 'into', 'unto', 'upon', 'around', 'inside', 'outside',
+    'yes', 'no', 'not', 'never', 'always', 'sometimes', 'often', 'rarely',
+    'all', 'some', 'any', 'each', 'every', 'both', 'either', 'neither',
+})
+
+# Directions and places in a line ("Left", "North", "Next")
+POSITION_WORDS = frozenset({
+    'front', 'back', 'left', 'right', 'north', 'south', 'east', 'west',
+    'first', 'second', 'third', 'last', 'next', 'previous',
+})
+
+# Common verbs that might be mistaken for names
+COMMON_VERBS = frozenset({
+    'says', 'said', 'tells', 'told', 'asks', 'asked', 'calls', 'called',
+    'walks', 'walked', 'runs', 'ran', 'comes', 'came', 'goes', 'went',
+    'takes', 'took', 'gives', 'gave', 'makes', 'made', 'does', 'did',
+    'looks', 'looked', 'sees', 'saw', 'hears', 'heard', 'feels', 'felt',
+})
+
+# Common adjectives and amounts
+COMMON_ADJECTIVES = frozenset({
+    'old', 'young', 'new', 'big', 'small', 'large', 'little', 'good', 'bad',
+    'great', 'long', 'short', 'high', 'low', 'hot', 'cold', 'other', 'another', 'same',
+    'much', 'many', 'few', 'more', 'most', 'less', 'least',
+})
+
+# People in general, titles and ranks
+PEOPLE_WORDS = frozenset({
+    'man', 'woman', 'person', 'people', 'child', 'boy', 'girl', 'friend', 'enemy',
+    'stranger', 'traveler', 'visitor', 'guest', 'host', 'owner', 'master', 'servant',
+    'lord', 'lady', 'king', 'queen', 'prince', 'princess', 'duke', 'baron',
+    'sir', 'mister', 'miss', 'mrs', 'doctor', 'captain',
+})
+
+# RPG-specific common words: creatures and classes
+RPG_WORDS = frozenset({
+    'player', 'character', 'hero', 'villain', 'monster', 'creature', 'beast',
+    'dragon', 'goblin', 'orc', 'elf', 'dwarf', 'human', 'halfling',
+    'warrior', 'fighter', 'mage', 'wizard', 'priest', 'cleric', 'rogue', 'thief',
+    'archer', 'ranger', 'paladin', 'barbarian', 'monk', 'sorcerer', 'warlock',
+})
+
+# Places and the things in them
+LOCATION_WORDS = frozenset({
+    'town', 'city', 'village', 'castle', 'tower', 'dungeon', 'cave', 'forest',
+    'mountain', 'river', 'lake', 'sea', 'ocean', 'desert', 'plain', 'hill',
+    'road', 'path', 'bridge', 'gate', 'door', 'window', 'wall', 'floor', 'roof',
+})
+
+# Time words
+TIME_WORDS = frozenset({
+    'day', 'night', 'morning', 'evening', 'noon', 'midnight', 'dawn', 'dusk',
+    'today', 'tomorrow', 'yesterday', 'week', 'month', 'year', 'hour', 'minute',
+})
+
+# Game mechanics and loot
+GAME_WORDS = frozenset({
+    'level', 'experience', 'skill', 'ability', 'spell', 'magic', 'item', 'weapon',
+    'armor', 'shield', 'sword', 'bow', 'staff', 'potion', 'scroll', 'book',
+    'gold', 'silver', 'copper', 'coin', 'treasure', 'loot', 'quest', 'mission',
+})
+
+# 🚫 Everything above: words that are never an NPC's name (lowercase)
+NOT_NPC_NAMES = (
+    FUNCTION_WORDS | POSITION_WORDS | COMMON_VERBS | COMMON_ADJECTIVES | PEOPLE_WORDS
+    | RPG_WORDS | LOCATION_WORDS | TIME_WORDS | GAME_WORDS
+)
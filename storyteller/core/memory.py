@@ -11,18 +11,31 @@ stored and can be recalled instantly. It's like having a perfect memory that
 grows more interesting with every adventure you embark upon!
 """
 
+import heapq
 import json
-import re
 import os
+import time
 from datetime import datetime
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterable, Optional, FrozenSet, Set, Union
+from dataclasses import dataclass, field
 
 from ..config import (
-    MEMORY_SAVE_PATH, MAX_CONVERSATION_HISTORY, MAX_RETRIEVAL_RESULTS,
-    ENTITY_PATTERNS, RELATIONSHIP_PATTERNS, IMPORTANCE_KEYWORDS,
-    EMBEDDING_MODEL, VECTOR_DB_COLLECTION
+    MEMORY_SAVE_PATH, MAX_RETRIEVAL_RESULTS,
+    MAX_QUERY_EXPANSIONS, RERANK_KEYWORD_WEIGHT, RERANK_IMPORTANCE_WEIGHT, RERANK_FACT_WEIGHT,
+    EMBEDDING_MODEL, VECTOR_DB_COLLECTION,
+    DUPLICATE_SIMILARITY_THRESHOLD, COLLAPSE_DUPLICATES_IN_ARCHIVE
 )
+from .vector_index import VectorIndex
+from .bitmap_index import BitmapIndex, MemoryFilter
+from .dedup import NearDuplicateIndex
+from .retention import RetentionManager
+from .fact_extractor import fact_extractor
+from .relationship_graph import RelationshipGraph
+from .interaction_index import InteractionIndex
+from .fact_store import FactStore
+from .canonical import FactCanonicalizer
+from ..utils.keywords import KeywordAutomaton
+from ..utils.text import TextAnalysis
 
 # Let's see what magical memory tools we have available!
 try:
@@ -52,6 +65,19 @@ class MemoryEntry:
     dm_response: str        # How did the story unfold?
     extracted_facts: List[str]  # Important things we learned
     importance_score: float     # How epic was this moment?
+    npcs: List[str] = field(default_factory=list)  # Who was around at the time?
+    quest: Optional[int] = None                     # Which quest were we on?
+    duplicate_of: Optional[int] = None              # An earlier turn this one nearly repeats
+    retrieval_hits: int = 0                         # How often this moment has been recalled
+
+
+class RetrievalResult(list):
+    """📋 The memories we found - plus a note of how far the search got before time ran out!"""
+    
+    def __init__(self, memories: Iterable[str] = ()):
+        super().__init__(memories)
+        self.completed_stages: List[str] = []  # e.g. ['keyword', 'vector', 'rerank']
+        self.timed_out = False                 # Did we skip a stage to meet the deadline?
 
 
 class DocumentMemorySystem:
@@ -69,6 +95,9 @@ class DocumentMemorySystem:
             self.embedder = None
             print("📝 Using keyword-based memory search (still works great!)")
         
+        # One packed matrix of embeddings so many questions cost about as much as one
+        self.vector_index = VectorIndex() if self.embedder else None
+        
         # Initialize our fancy memory database (if available)
         if HAS_CHROMADB:
             self.chroma_client = chromadb.Client()
@@ -80,9 +109,18 @@ class DocumentMemorySystem:
             print("📚 Using simple file storage for memories")
         
         # Our memory containers - where all the magic happens!
-        self.conversation_history: List[MemoryEntry] = []  # Every conversation we've had
-        self.fact_database: Dict[str, List[int]] = {}      # Quick lookup: fact -> conversation turns
+        self.conversation_history: List[MemoryEntry] = []  # The conversations we keep close at hand
+        self.fact_aliases = FactCanonicalizer()            # Every way of naming something -> one tag
+        self.fact_database = FactStore(canonicalizer=self.fact_aliases)  # Quick lookup: fact -> turns (capped!)
         self.turn_counter = 0                              # Keeping track of our adventure progress
+        self.metadata_index = BitmapIndex()                # Bitsets of turns by importance, NPC and quest
+        self._turn_importance: Dict[int, int] = {}         # ...and each turn's importance bucket, for ranking
+        self.relationship_graph = RelationshipGraph()      # Who did what to whom, and in which turns
+        self.npc_interactions = InteractionIndex()         # NPC -> the turns they were part of, and your tone
+        self._stage_seconds: Dict[str, float] = {}         # How long each search stage usually takes
+        self._turn_words: Dict[int, FrozenSet[str]] = {}  # Resident turn -> its distinct words
+        self.dedup = NearDuplicateIndex(threshold=DUPLICATE_SIMILARITY_THRESHOLD)  # Spots déjà vu turns
+        self.retention = RetentionManager(os.path.join(self.save_path, "cold_memory.log"))  # Packs older turns away
         
         self._load_existing_memory()  # Bring back all our precious memories!
     
@@ -97,11 +135,42 @@ class DocumentMemorySystem:
                     
                     # Bring back all our amazing conversations
                     for entry_data in data.get('conversations', []):
-                        entry = MemoryEntry(**entry_data)
-                        self.conversation_history.append(entry)
+                        self.conversation_history.append(MemoryEntry(**entry_data))
+                    
+                    # Anything back in our hands doesn't need its packed-away copy
+                    self.retention.forget_resident(entry.turn_id for entry in self.conversation_history)
+                    
+                    # Every turn's fingerprint - the packed-away ones too, so their repeats still fold
+                    if 'dedup' in data:
+                        self.dedup = NearDuplicateIndex.from_dict(data['dedup'], threshold=DUPLICATE_SIMILARITY_THRESHOLD)
+                    else:
+                        self._fingerprint_everything(data.get('duplicate_counts', {}))
+                    self.conversation_history = self.retention.enforce(self.conversation_history)
                     
                     # Rebuild our fact lookup system
-                    self.fact_database = data.get('facts', {})
+                    self.fact_aliases = FactCanonicalizer.from_dict(data.get('fact_aliases', {}))
+                    self.fact_database = FactStore.from_dict(
+                        data.get('facts', {}), data.get('fact_usage'), canonicalizer=self.fact_aliases
+                    )
+                    # Facts may still point at turns that didn't make it into the archive
+                    live_turns = {entry.turn_id for entry in self.conversation_history} | set(self.retention.cold)
+                    self.fact_database.collect_garbage(live_turns.__contains__)
+                    if 'metadata_index' in data:
+                        self.metadata_index = BitmapIndex.from_dict(data['metadata_index'])
+                        for level in range(1, 6):
+                            for turn_id in BitmapIndex.ids(self.metadata_index.get(f"importance:{level}")):
+                                self._turn_importance[turn_id] = level
+                    else:
+                        for entry in self.conversation_history:
+                            self._index_metadata(entry)
+                    if 'npc_interactions' in data:
+                        self.npc_interactions = InteractionIndex.from_dict(data['npc_interactions'])
+                    if 'relationship_graph' in data:
+                        self.relationship_graph = RelationshipGraph.from_dict(data['relationship_graph'])
+                    else:
+                        for entry in self.conversation_history:
+                            relations = fact_extractor.extract(entry.player_action + " " + entry.dm_response).relations
+                            self.relationship_graph.add_relations(relations, entry.turn_id)
                     
                     print(f"🎉 Memory restored! Found {len(self.conversation_history)} conversations and {len(self.fact_database)} facts!")
             except Exception as e:
@@ -109,8 +178,28 @@ class DocumentMemorySystem:
         else:
             print("🆕 Starting with a clean memory palace - let's create some epic memories!")
     
+    def _fingerprint_everything(self, duplicate_counts: Dict[str, int]):
+        """👯 Older saves didn't keep fingerprints: re-read every turn, resident and cold, oldest first"""
+        entries = {entry.turn_id: entry for entry in self.conversation_history}
+        for turn_id in self.retention.cold:
+            entries.setdefault(turn_id, self.retention.peek(turn_id, MemoryEntry))
+        for turn_id in sorted(entries):
+            if entries[turn_id] is not None:
+                self.dedup.add(turn_id, entries[turn_id].player_action + " " + entries[turn_id].dm_response)
+        
+        # Collapsed archives remember how many copies each kept turn stood for
+        for turn_id, count in duplicate_counts.items():
+            turn_id = int(turn_id)
+            if self.dedup.representative(turn_id) == turn_id:
+                self.dedup.group_sizes[turn_id] = max(self.dedup.group_sizes.get(turn_id, 1), count)
+    
     def save_memory(self):
         """Carefully preserve all our precious memories for future adventures!"""
+        entries = self.conversation_history
+        if COLLAPSE_DUPLICATES_IN_ARCHIVE:
+            # Keep just one copy of each near-identical moment (its count is saved below)
+            entries = [entry for entry in entries if entry.duplicate_of is None]
+        
         data = {
             'turn_counter': self.turn_counter,
             'conversations': [
@@ -120,11 +209,21 @@ class DocumentMemorySystem:
                     'player_action': entry.player_action,
                     'dm_response': entry.dm_response,
                     'extracted_facts': entry.extracted_facts,
-                    'importance_score': entry.importance_score
+                    'importance_score': entry.importance_score,
+                    'npcs': entry.npcs,
+                    'quest': entry.quest,
+                    'duplicate_of': entry.duplicate_of,
+                    'retrieval_hits': entry.retrieval_hits
                 }
-                for entry in self.conversation_history
+                for entry in entries
             ],
-            'facts': self.fact_database
+            'facts': self.fact_database.to_dict(),
+            'fact_usage': self.fact_database.usage_to_dict(),
+            'fact_aliases': self.fact_aliases.to_dict(),
+            'metadata_index': self.metadata_index.to_dict(),
+            'relationship_graph': self.relationship_graph.to_dict(),
+            'npc_interactions': self.npc_interactions.to_dict(),
+            'dedup': self.dedup.to_dict()
         }
         
         memory_file = os.path.join(self.save_path, "memory.json")
@@ -135,44 +234,58 @@ class DocumentMemorySystem:
         except Exception as e:
             print(f"⚠️ Couldn't save memories (but they're still in active memory): {e}")
     
-    def extract_facts(self, text: str) -> List[str]:
+    def extract_facts(self, text: Union[str, TextAnalysis]) -> List[str]:
         """🔍 Hunt for important details and cool stuff in the conversation!"""
-        facts = []
-        
-        # Look for interesting names, places, and things
-        for pattern in ENTITY_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            facts.extend([match.strip() for match in matches if len(match.strip()) > 2])
-        
-        # Spot relationships and actions between characters
-        for pattern in RELATIONSHIP_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                facts.append(f"{match[0]} -> {match[1]}")  # Who did what to whom
-        
-        return list(set(facts))  # Keep each fact only once!
+        # Names, places, loot and who-did-what-to-whom, all in a single read
+        return fact_extractor.extract_facts(text)
     
-    def calculate_importance(self, player_action: str, dm_response: str) -> float:
+    def register_entity(self, name: str, aliases: Iterable[str] = ()):
+        """🪪 A new character joined the story - file every way of naming them under one tag"""
+        aliases = list(aliases)
+        self.fact_aliases.register_entity(name, aliases)
+        # Only facts sharing a word with the new name can be re-tagged - no sweep over every fact
+        self.fact_database.recanonicalize(FactCanonicalizer.words_of([name, *aliases]))
+    
+    def calculate_importance(self, player_action: Union[str, TextAnalysis],
+                             dm_response: Union[str, TextAnalysis]) -> float:
         """🌟 Figure out how epic and important this moment was!"""
-        text = (player_action + " " + dm_response).lower()
-        score = 0.0
+        keyword_hits = (TextAnalysis.ensure(player_action).keyword_hits
+                        + TextAnalysis.ensure(dm_response).keyword_hits)
         
-        # Check for epic keywords that make moments memorable
-        for keyword in IMPORTANCE_KEYWORDS:
-            if keyword in text:
-                score += 1.0  # Each epic keyword makes it more important!
+        # Each different epic keyword makes the moment more important!
+        epic_keywords = KeywordAutomaton.by_category(keyword_hits).get('importance', set())
+        score = float(len(epic_keywords))
         
         return min(score, 5.0)  # Maximum epicness level is 5!
     
-    def add_conversation_turn(self, player_action: str, dm_response: str):
-        """📝 Add this awesome moment to our permanent memory collection!"""
+    def add_conversation_turn(self, player_action: Union[str, TextAnalysis],
+                              dm_response: Union[str, TextAnalysis],
+                              npcs: Iterable[str] = None, quest: int = None,
+                              mentioned: Iterable[str] = None, tone: str = "Neutral", tone_delta: int = 0):
+        """📝 Add this awesome moment to our permanent memory collection!
+        
+        Pass the TextAnalysis the engine already made for the action and the
+        response, and every stage below reuses that single read. `mentioned` are
+        the NPCs the player addressed, with the `tone` they used (and what it did
+        to the relationship) - they go in those NPCs' diaries.
+        """
         self.turn_counter += 1
         
+        # Read the action and response once, and share that read with every stage
+        action_analysis = TextAnalysis.ensure(player_action)
+        response_analysis = TextAnalysis.ensure(dm_response)
+        turn_analysis = TextAnalysis.join(action_analysis, response_analysis)
+        player_action, dm_response = action_analysis.text, response_analysis.text
+        
         # Hunt for interesting facts in this conversation
-        facts = self.extract_facts(player_action + " " + dm_response)
+        found = fact_extractor.extract(turn_analysis)
+        facts = found.as_fact_strings()
         
         # Rate how epic this moment was
-        importance = self.calculate_importance(player_action, dm_response)
+        importance = self.calculate_importance(action_analysis, response_analysis)
+        
+        # Have we basically seen this moment before?
+        duplicate_of = self.dedup.add(self.turn_counter, player_action + " " + dm_response)
         
         # Create a beautiful memory entry
         entry = MemoryEntry(
@@ -181,24 +294,39 @@ class DocumentMemorySystem:
             player_action=player_action,
             dm_response=dm_response,
             extracted_facts=facts,
-            importance_score=importance
+            importance_score=importance,
+            npcs=sorted(npcs or []),
+            quest=quest,
+            duplicate_of=duplicate_of
         )
         
         self.conversation_history.append(entry)
+        self._turn_words[entry.turn_id] = turn_analysis.words
+        self._index_metadata(entry)
+        self.relationship_graph.add_relations(found.relations, entry.turn_id)
+        self.npc_interactions.record(
+            entry.turn_id, mentioned=mentioned or [], present=entry.npcs,
+            tone=tone, delta=tone_delta, action=player_action
+        )
         
         # Update fact database
         for fact in facts:
-            if fact not in self.fact_database:
-                self.fact_database[fact] = []
-            self.fact_database[fact].append(self.turn_counter)
+            self.fact_database.add(fact, self.turn_counter)
         
-        # Add to vector database for semantic search (if available)
-        if self.collection and self.embedder:
+        # Add to our vector index for semantic search (if available) - repeats are
+        # already covered by the turn they repeat, so they don't need a row of their own
+        if self.vector_index is not None and duplicate_of is None:
             full_text = f"Turn {self.turn_counter}: {player_action} | {dm_response}"
-            embedding = self.embedder.encode(full_text).tolist()
-            
+            embedding = self.embedder.encode(full_text)
+            self.vector_index.add(
+                self.turn_counter, embedding, full_text,
+                {'turn_id': self.turn_counter, 'importance': importance}
+            )
+        
+        # Mirror into the database too, for anyone who wants to inspect it
+        if self.collection and self.vector_index is not None and duplicate_of is None:
             self.collection.add(
-                embeddings=[embedding],
+                embeddings=[embedding.tolist()],
                 documents=[full_text],
                 ids=[str(self.turn_counter)],
                 metadatas=[{
@@ -208,49 +336,270 @@ class DocumentMemorySystem:
                 }]
             )
         
-        # Keep only last N conversations in memory (while keeping facts)
-        if len(self.conversation_history) > MAX_CONVERSATION_HISTORY:
-            self.conversation_history = self.conversation_history[-MAX_CONVERSATION_HISTORY:]
+        # Keep recent and important conversations resident, pack the rest away (facts stay)
+        self.conversation_history = self.retention.enforce(self.conversation_history)
+        self._forget_packed_words()
         
         self.save_memory()
     
-    def retrieve_relevant_memories(self, query: str, max_results: int = None) -> List[str]:
-        """Retrieve relevant memories based on query"""
+    def _index_metadata(self, entry: MemoryEntry):
+        """🗂️ File this turn under its importance, the NPCs around and the current quest"""
+        self.metadata_index.add(f"importance:{int(entry.importance_score)}", entry.turn_id)
+        self._turn_importance[entry.turn_id] = int(entry.importance_score)
+        for npc in entry.npcs:
+            self.metadata_index.add(f"npc:{npc.lower()}", entry.turn_id)
+        if entry.quest is not None:
+            self.metadata_index.add(f"quest:{entry.quest}", entry.turn_id)
+    
+    def _words_of(self, entry: MemoryEntry) -> FrozenSet[str]:
+        """The distinct words of a resident turn, read once and then remembered"""
+        words = self._turn_words.get(entry.turn_id)
+        if words is None:
+            words = TextAnalysis.of(entry.player_action + " " + entry.dm_response).words
+            self._turn_words[entry.turn_id] = words
+        return words
+    
+    def _forget_packed_words(self):
+        """Only resident turns need their words kept handy"""
+        resident = {entry.turn_id for entry in self.conversation_history}
+        for turn_id in [turn_id for turn_id in self._turn_words if turn_id not in resident]:
+            del self._turn_words[turn_id]
+    
+    def expand_query(self, query: Union[str, TextAnalysis], entities: Iterable[str] = None) -> List[str]:
+        """🧩 Split an action into the whole question plus one lookup per entity it names!"""
+        query_analysis = TextAnalysis.ensure(query)
+        query = query_analysis.text
+        sub_queries = [query]
+        seen = {query.strip().lower()}
+        
+        candidates = [fact for fact in self.extract_facts(query_analysis) if " -> " not in fact]
+        candidates.extend(entities or [])
+        
+        for candidate in candidates:
+            key = candidate.strip().lower()
+            if key and key not in seen:
+                seen.add(key)
+                sub_queries.append(candidate.strip())
+            if len(sub_queries) > MAX_QUERY_EXPANSIONS:
+                break
+        
+        return sub_queries
+    
+    def _has_time_for(self, stage: str, deadline: Optional[float]) -> bool:
+        """⏳ Is there enough time left to run this search stage, judging by how long it usually takes?"""
+        if deadline is None:
+            return True
+        return deadline - time.perf_counter() > self._stage_seconds.get(stage, 0.0)
+    
+    def _record_stage(self, stage: str, started: float):
+        """Remember (as a running average) how long a search stage took"""
+        elapsed = time.perf_counter() - started
+        previous = self._stage_seconds.get(stage)
+        self._stage_seconds[stage] = elapsed if previous is None else 0.8 * previous + 0.2 * elapsed
+    
+    def _keyword_stage(self, query: TextAnalysis, allowed: Optional[Set[int]]) -> Dict[int, float]:
+        """🔤 Cheap first pass: which recent turns share words with the query?"""
+        query_words = query.words
+        if not query_words:
+            return {}
+        
+        candidates = self.conversation_history
+        if allowed is not None:
+            candidates = [entry for entry in candidates if entry.turn_id in allowed]
+        
+        scores = {}
+        for entry in candidates:  # Everything resident - the retention budget keeps this small
+            # Simple keyword matching against the words we read when the turn was stored
+            matches = len(query_words & self._words_of(entry))
+            if matches > 0:
+                scores[entry.turn_id] = matches / len(query_words)
+        return scores
+    
+    def _query_entities(self, query: TextAnalysis, entities: Optional[Iterable[str]]) -> List[str]:
+        """The canonical people, places and loot an action talks about"""
+        named = list(fact_extractor.extract(query).entities)
+        named.extend(entities or [])
+        named.extend(word for word in query.words if word in self.fact_aliases.aliases)  # "ask marcus..."
+        return list(dict.fromkeys(self.fact_aliases.canonical(name) for name in named))
+    
+    def _indexed_importance(self, turn_id: int) -> int:
+        """A turn's importance straight from the catalogue - no need to unpack cold turns"""
+        return self._turn_importance.get(turn_id, 0)
+    
+    def _fact_stage(self, query: TextAnalysis, entities: Optional[Iterable[str]],
+                    allowed: Optional[Set[int]], max_results: int) -> Dict[int, float]:
+        """🗃️ Entity pass: turns where the things this action names showed up (together, ideally!)
+        
+        Reads the fact posting lists instead of any text, so it reaches all the way
+        back through cold storage for the price of a few set operations.
+        """
+        postings = []
+        for entity in self._query_entities(query, entities):
+            turn_ids = self.fact_database.touch(entity)
+            if turn_ids:
+                postings.append(turn_ids)
+        if not postings:
+            return {}
+        
+        # Count how many of the named things each turn shares - turns in the
+        # intersection share them all, the rest of the union shares some
+        overlap: Dict[int, int] = {}
+        for turn_ids in postings:
+            for turn_id in turn_ids:
+                if allowed is None or turn_id in allowed:
+                    overlap[turn_id] = overlap.get(turn_id, 0) + 1
+        
+        best = heapq.nlargest(
+            max_results * 2, overlap,
+            key=lambda turn_id: (overlap[turn_id], self._indexed_importance(turn_id), turn_id)
+        )
+        return {turn_id: overlap[turn_id] / len(postings) for turn_id in best}
+    
+    def _vector_stage(self, query: TextAnalysis, entities: Optional[Iterable[str]],
+                      allowed: Optional[Set[int]], max_results: int) -> Dict[int, float]:
+        """🧭 Semantic pass: encode the action and its entity lookups in one batch and search"""
+        sub_queries = self.expand_query(query, entities)
+        query_embeddings = self.embedder.encode(sub_queries)
+        if allowed is not None:
+            # Repeats live in the index under the turn they repeat
+            allowed = {self.dedup.representative(turn_id) for turn_id in allowed}
+        return dict(self.vector_index.search(query_embeddings, max_results * 2, allowed))
+    
+    def _find_resident(self, turn_id: int) -> Optional[MemoryEntry]:
+        for entry in reversed(self.conversation_history):
+            if entry.turn_id == turn_id:
+                return entry
+        return None
+    
+    def get_entry(self, turn_id: int, promote: bool = False) -> Optional[MemoryEntry]:
+        """📖 Fetch a memory by turn, unpacking it from cold storage if needed"""
+        entry = self._find_resident(turn_id)
+        if entry is not None or turn_id not in self.retention.cold:
+            return entry
+        if not promote:
+            return self.retention.peek(turn_id, MemoryEntry)
+        
+        # Recalled again - it earns its place back among the resident memories
+        entry = self.retention.promote(turn_id, MemoryEntry)
+        position = len(self.conversation_history)
+        while position > 0 and self.conversation_history[position - 1].turn_id > turn_id:
+            position -= 1
+        self.conversation_history.insert(position, entry)
+        return entry
+    
+    def _importance_of(self, turn_id: int) -> float:
+        if self.vector_index is not None and turn_id in self.vector_index.metadata:
+            return self.vector_index.metadata[turn_id].get('importance', 0.0)
+        entry = self.get_entry(turn_id)
+        return entry.importance_score if entry else 0.0
+    
+    def _format_memory(self, turn_id: int, relevance: Dict[int, float], semantic: bool) -> str:
+        """Write a found memory out the way the storyteller expects to read it"""
+        copies = self.dedup.group_size(turn_id)
+        seen = f", Seen {copies} times" if copies > 1 else ""
+        entry = self.get_entry(turn_id, promote=True)
+        if entry is not None:
+            entry.retrieval_hits += 1
+        
+        if semantic:
+            doc = self.vector_index.documents.get(turn_id)
+            if doc is None:
+                doc = f"Turn {turn_id}: {entry.player_action} | {entry.dm_response}"
+            return f"[Turn {turn_id}, Importance: {self._importance_of(turn_id):.1f}{seen}] {doc}"
+        
+        return f"[Turn {turn_id}, Relevance: {relevance[turn_id]:.1f}{seen}] {entry.player_action} | {entry.dm_response}"
+    
+    def retrieve_relevant_memories(self, query: Union[str, TextAnalysis], max_results: int = None,
+                                   entities: Iterable[str] = None,
+                                   memory_filter: MemoryFilter = None,
+                                   deadline: float = None) -> 'RetrievalResult':
+        """Retrieve relevant memories based on query (and any entities it mentions)
+
+        A MemoryFilter narrows the search to matching turns before anything is scored.
+        The search runs in stages - keyword hits, turns sharing the entities the
+        action names (straight from the fact posting lists, cold turns included),
+        then vector candidates, then a rerank - and if a `deadline` (a time.perf_counter() value) is given, any
+        stage that wouldn't finish in time is skipped and the best results so far
+        are returned. The result's `completed_stages` says how far we got.
+        """
         max_results = max_results or MAX_RETRIEVAL_RESULTS
+        query = TextAnalysis.ensure(query)  # Read the query once for every stage
+        bitmap = memory_filter.evaluate(self.metadata_index) if memory_filter else None
+        allowed = None if bitmap is None else set(BitmapIndex.ids(bitmap))  # Unpacked once per query
+        result = RetrievalResult()
+        
+        # Stage 1: cheap keyword hits (always runs, so there's always something to show)
+        started = time.perf_counter()
+        keyword_scores = self._keyword_stage(query, allowed)
+        self._record_stage('keyword', started)
+        result.completed_stages.append('keyword')
+        
+        # Stage 1b: turns sharing the people, places and loot the action names
+        fact_scores: Dict[int, float] = {}
+        if self._has_time_for('facts', deadline):
+            started = time.perf_counter()
+            fact_scores = self._fact_stage(query, entities, allowed, max_results)
+            self._record_stage('facts', started)
+            result.completed_stages.append('facts')
+        else:
+            result.timed_out = True
         
-        # If vector search is available, use it
-        if self.collection and self.embedder and self.collection.count() > 0:
-            # Get embedding for query
-            query_embedding = self.embedder.encode(query).tolist()
-            
-            # Search vector database
-            results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=min(max_results, self.collection.count())
+        # What we can say about a turn from words and named things alone
+        lexical_scores = dict(fact_scores)
+        for turn_id, score in keyword_scores.items():
+            lexical_scores[turn_id] = lexical_scores.get(turn_id, 0.0) + score
+        
+        # Stage 2: semantic vector candidates (if available and there's time)
+        vector_scores: Dict[int, float] = {}
+        semantic = self.vector_index is not None and len(self.vector_index) > 0
+        if semantic:
+            if self._has_time_for('vector', deadline):
+                started = time.perf_counter()
+                vector_scores = self._vector_stage(query, entities, allowed, max_results)
+                self._record_stage('vector', started)
+                result.completed_stages.append('vector')
+            else:
+                semantic = False
+                result.timed_out = True
+        
+        # Stage 3: blend everything we found with how important each moment was
+        primary = vector_scores if semantic else lexical_scores
+        if self._has_time_for('rerank', deadline):
+            started = time.perf_counter()
+            candidates = set(vector_scores) | set(lexical_scores)
+            ranked = sorted(
+                candidates,
+                key=lambda turn_id: (
+                    vector_scores.get(turn_id, 0.0)
+                    + RERANK_KEYWORD_WEIGHT * keyword_scores.get(turn_id, 0.0)
+                    + RERANK_FACT_WEIGHT * fact_scores.get(turn_id, 0.0)
+                    + RERANK_IMPORTANCE_WEIGHT * self._indexed_importance(turn_id)
+                ),
+                reverse=True
             )
-            
-            relevant_memories = []
-            if results['documents']:
-                for doc, metadata in zip(results['documents'][0], results['metadatas'][0]):
-                    turn_id = metadata['turn_id']
-                    importance = metadata['importance']
-                    relevant_memories.append(f"[Turn {turn_id}, Importance: {importance:.1f}] {doc}")
-            
-            return relevant_memories
-        
-        # Fallback: keyword-based search
-        relevant_memories = []
-        query_words = set(query.lower().split())
-        
-        for entry in self.conversation_history[-20:]:  # Search last 20 turns
-            text = (entry.player_action + " " + entry.dm_response).lower()
-            # Simple keyword matching
-            matches = len(query_words.intersection(set(text.split())))
-            if matches > 0:
-                relevance = matches / len(query_words)
-                relevant_memories.append(f"[Turn {entry.turn_id}, Relevance: {relevance:.1f}] {entry.player_action} | {entry.dm_response}")
+            self._record_stage('rerank', started)
+            result.completed_stages.append('rerank')
+        else:
+            result.timed_out = True
+            ranked = sorted(primary, key=primary.get, reverse=True)
         
-        return sorted(relevant_memories, key=lambda x: float(x.split('Relevance: ')[1].split(']')[0]), reverse=True)[:max_results]
+        if not semantic:
+            # Word and fact matches can only be shown for turns we still have the text of
+            ranked = [
+                turn_id for turn_id in ranked
+                if turn_id in lexical_scores and (turn_id in self.retention.cold or self._find_resident(turn_id))
+            ]
+        
+        # Fold near-identical turns together so filler doesn't crowd out the good stuff
+        collapsed, shown_groups = [], set()
+        for turn_id in ranked:
+            group = self.dedup.representative(turn_id)
+            if group not in shown_groups:
+                shown_groups.add(group)
+                collapsed.append(turn_id)
+        
+        result.extend(self._format_memory(turn_id, lexical_scores, semantic) for turn_id in collapsed[:max_results])
+        return result
     
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of current memory state"""
@@ -258,5 +607,12 @@ class DocumentMemorySystem:
             'total_conversations': len(self.conversation_history),
             'total_facts': len(self.fact_database),
             'recent_facts': list(self.fact_database.keys())[-10:] if self.fact_database else [],
-            'turn_counter': self.turn_counter
+            'fact_evictions': self.fact_database.evictions,
+            'fact_postings_collected': self.fact_database.collected_postings,
+            'turn_counter': self.turn_counter,
+            'distinct_turns': len(self.dedup),
+            'relationships': len(self.relationship_graph),
+            'npc_diaries': len(self.npc_interactions),
+            'resident_bytes': self.retention.resident_bytes,
+            'cold_turns': len(self.retention.cold)
         }
\ No newline at end of file
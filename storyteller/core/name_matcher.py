@@ -0,0 +1,74 @@
+# storyteller/core/name_matcher.py
+"""
+🔎 The Name Spotter - Finding Every Character in a Sentence at Once!
+
+Instead of searching the text once per character (which gets slow when your
+campaign has met hundreds of people!), the spotter files every character's
+name into a little word-by-word trie. Then it walks the text's words a single
+time, and wherever a name starts it follows the trie to see who's there.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Union
+
+from ..utils.text import TextAnalysis
+
+_END = ""  # Trie key marking "a whole name ends here" (no real word is empty)
+
+
+@dataclass(frozen=True)
+class NameMention:
+    """📍 One character spotted in the text, and where"""
+
+    name: str         # The character's name as it appears in the roster
+    start: int        # Where the mention starts in the text
+    end: int          # Where it ends (exclusive)
+    first_token: int  # Which of the text's tokens the name starts at
+    last_token: int   # ...and the token it ends at (inclusive)
+
+
+class NameMatcher:
+    """🔎 A token trie over every roster name: one walk over the words finds them all"""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._trie: Dict[str, dict] = {}
+        self.size = 0
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str):
+        """File a name into the trie, word by word (case doesn't matter)"""
+        words = TextAnalysis.of(name).folded
+        if not words:
+            return
+        node = self._trie
+        for word in words:
+            node = node.setdefault(word, {})
+        if _END not in node:
+            self.size += 1
+        node[_END] = name
+
+    def find(self, text: Union[str, TextAnalysis]) -> List[NameMention]:
+        """🔍 Every name in the text, left to right (the longest name wins where two overlap)"""
+        analysis = TextAnalysis.ensure(text)
+        folded, offsets = analysis.folded, analysis.offsets
+        mentions = []
+        i, count = 0, len(folded)
+        while i < count:
+            node = self._trie.get(folded[i])
+            found, found_end = None, i
+            j = i
+            while node is not None:
+                if _END in node:
+                    found, found_end = node[_END], j
+                j += 1
+                node = node.get(folded[j]) if j < count else None
+            if found is not None:
+                mentions.append(NameMention(found, offsets[i][0], offsets[found_end][1], i, found_end))
+                i = found_end + 1
+            else:
+                i += 1
+        return mentions
+
+    def __len__(self) -> int:
+        return self.size
@@ -8,18 +8,128 @@ to how you treat them and remember your interactions, making every conversation
 feel real and meaningful. It's like having a whole world of living characters!
 """
 
+import heapq
 import re
-from typing import Dict, Any, List, Set
-from ..config import LLM_MODEL
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple, Union, Callable
+from ..config import (LLM_MODEL, SCENE_IDLE_UPDATES, NPC_NAME_MEMO_SIZE, NPC_CONTEXT_TOP_K,
+                      NPC_CONTEXT_TOKEN_BUDGET, NPC_SALIENCE_WEIGHTS)
 from ..utils.llm import llm_client
+from ..utils.text import TextAnalysis
+from .name_matcher import NameMatcher, NameMention
+from .scene import SceneScanner, SceneDelta, ARRIVAL
+from .lexicons import NOT_NPC_NAMES
+from .npc_registry import NPCRegistry
+from .tone import ToneAnalyzer, ToneReading
+from .fuzzy_names import FuzzyNameIndex
+
+# Enhanced patterns for better NPC detection (compiled once, shared by everyone)
+_NPC_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Direct introduction patterns
+    r'(?:meet|encounter|see|find|approach)\s+(\w+),?\s+(?:the|a|an)\s+(\w+)',  # "meet Boric, the blacksmith"
+    r'(\w+)\s+the\s+(\w+)(?:\s+(?:approaches?|says?|tells?|greets?|nods?))',    # "Elara the merchant approaches"
+    r'(?:a|an)\s+(\w+)\s+named\s+(\w+)',                         # "a blacksmith named Boric"
+    r'(\w+)\s+named\s+(\w+)(?:\s+(?:approaches?|says?|tells?))?',  # "merchant named Gareth"
+    
+    # Conversation patterns
+    r'(?:talk|speak)\s+(?:to|with)\s+(\w+)(?:\s+the\s+(\w+))?',  # "talk to Marcus the guard"
+    r'(\w+)(?:\s+the\s+(\w+))?\s+(?:says?|tells?|asks?|responds?|replies?)', # "Marcus says" or "Marcus the guard says"
+    r'(\w+)\s+(?:whispers?|shouts?|calls?|announces?)',           # "Marcus whispers"
+    
+    # Action patterns
+    r'(\w+)(?:\s+the\s+(\w+))?\s+(?:walks?|runs?|moves?|steps?)',  # "Marcus walks"
+    r'(\w+)(?:\s+the\s+(\w+))?\s+(?:gives?|hands?|offers?)',       # "Elena gives"
+    r'(\w+)(?:\s+the\s+(\w+))?\s+(?:takes?|grabs?|picks?)',        # "Thorin takes"
+    
+    # Descriptive patterns
+    r'(?:you\s+(?:see|notice|spot|observe))\s+(\w+)(?:\s+the\s+(\w+))?',  # "you see Marcus"
+    r'(?:there\s+(?:is|stands?|sits?))\s+(\w+)(?:\s+the\s+(\w+))?',        # "there is Elena"
+)]
+
+# Additional occupation-specific patterns
+_OCCUPATION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:the\s+)?(\w+)\s+(blacksmith|merchant|guard|innkeeper|wizard|priest|bard|farmer|hunter|knight|captain|librarian|cook|stable\w*|shop\w*)',
+    r'(blacksmith|merchant|guard|innkeeper|wizard|priest|bard|farmer|hunter|knight|captain|librarian|cook)\s+(\w+)',
+)]
+
+# Where the name sits in each pattern's match: first, second ("a blacksmith named Boric") or either
+_NAME_FIRST, _NAME_SECOND, _NAME_EITHER = "first", "second", "either"
+
+
+def _fold_patterns(patterns: List[Tuple[re.Pattern, str]]) -> Tuple[re.Pattern, List[Tuple[int, int, str]]]:
+    """All the patterns as one regex, tried at the start of every word - one read of the text instead of fourteen
+
+    Each pattern sits in a lookahead, so a match never uses up text another
+    pattern (or a later word) might still need. Also hands back, per pattern,
+    where its groups start, how many it has and where the name is.
+    """
+    alternatives, groups, first = [], [], 1
+    for pattern, where in patterns:
+        alternatives.append(f'(?:{pattern.pattern})')
+        groups.append((first, pattern.groups, where))
+        first += pattern.groups
+    return re.compile(r'\b(?=\w)(?=' + '|'.join(alternatives) + ')', re.IGNORECASE), groups
+
+
+_INTRODUCTIONS, _INTRODUCTION_GROUPS = _fold_patterns(
+    [(pattern, _NAME_SECOND if r'named\s' in pattern.pattern else _NAME_FIRST) for pattern in _NPC_PATTERNS]
+    + [(pattern, _NAME_EITHER) for pattern in _OCCUPATION_PATTERNS]
+)
+
+
+# How sure we are someone's in the scene when the text said so vs. when we only saw their name
+_CUED_PRESENCE = 0.8
+_GUESSED_PRESENCE = 0.5
+
+
+def _estimate_tokens(text: str) -> int:
+    """Roughly how many tokens the storyteller will see (about four characters each)"""
+    return max(1, len(text) // 4)
+
+
+@lru_cache(maxsize=NPC_NAME_MEMO_SIZE)
+def _is_valid_npc_name(name: str) -> bool:
+    """Check if a word could be an NPC's name - remembered, since the same words come up again and again"""
+    return bool(
+        name and
+        name.replace("'", "").replace("-", "").isalpha() and  # Allow apostrophes and hyphens in names
+        len(name) >= 2 and 
+        name.lower() not in NOT_NPC_NAMES and
+        name[0].isupper() and  # Should be capitalized like a proper name
+        not name.isupper()     # Avoid all-caps words
+    )
+
+
+@dataclass
+class NPCAnalysis:
+    """📋 Everything one text tells us about the NPCs - worked out in a single pass"""
+
+    text: TextAnalysis
+    mentions: List[NameMention] = field(default_factory=list)  # Every known name, with positions
+    mentioned: List[str] = field(default_factory=list)         # ...as distinct names, in order
+    scene: SceneDelta = field(default_factory=SceneDelta)      # Who arrived, stayed, left or was talked about
+    tone: str = "Neutral"                                      # How the text sounds
+    mood: ToneReading = field(default_factory=ToneReading)     # ...and how strongly, tone by tone
+    new_npcs: Dict[str, str] = field(default_factory=dict)     # Characters being introduced: name -> occupation
 
 
 class NPCManager:
     """🎪 Your Amazing Character Director - Bringing NPCs to Life with Personality!"""
     
-    def __init__(self):
-        self.npcs: Dict[str, Dict[str, Any]] = {}  # Our collection of amazing characters
+    def __init__(self, save_path: Optional[str] = None):
+        self.npcs = NPCRegistry(save_path)          # Our collection of amazing characters (saved if given a path!)
         self.current_npcs: Set[str] = set()         # Who's in the current scene
+        self.roster_listeners: List[Callable[[str], None]] = []  # Told whenever a character joins
+        self.name_matcher = NameMatcher()           # Spots every known name in one read
+        self.fuzzy_names = FuzzyNameIndex()         # ...and forgives misspelled ones
+        self.scene_scanner = SceneScanner(self.name_matcher)  # Who arrived, stayed or left
+        self._scene_clock = 0                       # How many texts the scene has been updated from
+        self._last_seen: Dict[str, int] = {}        # NPC -> when they were last seen in the scene
+        self._states_cache = None                   # (table version, states) from the last get_npc_states
+        self._presence_confidence: Dict[str, float] = {}  # NPC -> how sure we are they're in the scene
+        self._scene_version = 0                     # Bumped whenever who's here (or when we saw them) changes
+        self._context_cache = None                  # (versions, text) from the last get_npc_context
         
         # How different ways of talking affect character relationships
         self.tone_effects = {
@@ -30,31 +140,25 @@ class NPCManager:
             "Threatening": -20, # This really upsets people
             "Aggressive": -15   # Aggression pushes people away
         }
+        self.tone_analyzer = ToneAnalyzer(self.tone_effects)  # Weighs every tone word you use
         
-        # Words we ignore when looking for character names
-        self.excluded_words = {
-            'you', 'your', 'yours', 'yourself', 'we', 'us', 'our', 'ours', 'ourselves',
-            'they', 'them', 'their', 'theirs', 'themselves', 'he', 'him', 'his', 'himself',
-            'she', 'her', 'hers', 'herself', 'it', 'its', 'itself', 'i', 'me', 'my',
-            'mine', 'myself', 'the', 'a', 'an', 'and', 'or', 'but', 'so', 'yet', 'for',
-            'nor', 'to', 'in', 'on', 'at', 'by', 'up', 'of', 'as', 'is', 'am', 'are',
-            'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
-            'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can',
-            'this', 'that', 'these', 'those', 'here', 'there', 'where', 'when', 'why',
-            'how', 'what', 'which', 'who', 'whom', 'whose', 'if', 'then', 'else',
-            'while', 'until', 'since', 'because', 'although', 'though', 'unless',
-            'before', 'after', 'during', 'within', 'without', 'between', 'among',
-            'through', 'across', 'over', 'under', 'above', 'below', 'beside', 'behind',
-            'front', 'back', 'left', 'right', 'north', 'south', 'east', 'west',
-            'yes', 'no', 'not', 'never', 'always', 'sometimes', 'often', 'rarely',
-            'much', 'many', 'few', 'little', 'more', 'most', 'less', 'least',
-            'all', 'some', 'any', 'each', 'every', 'both', 'either', 'neither',
-            'first', 'second', 'third', 'last', 'next', 'previous', 'new', 'old',
-            'good', 'bad', 'big', 'small', 'long', 'short', 'high', 'low', 'hot', 'cold'
-        }
+        # Words we ignore when looking for character names (shared by every manager)
+        self.excluded_words = NOT_NPC_NAMES
+        
+        # Returning characters: we learn their names now and the rest when they come up
+        for name in self.npcs:
+            self.name_matcher.add(name)
+            self.fuzzy_names.add(name)
+    
+    def save(self):
+        """💾 Write down whatever changed about our characters since the last save"""
+        self.npcs.save()
     
     def initialize_npc(self, name: str, occupation: str = "unknown", **attributes):
         """🌟 Welcome a new character to our amazing story world!"""
+        if name not in self.npcs:
+            self.name_matcher.add(name)  # Only a brand new name changes what we look for
+            self.fuzzy_names.add(name)
         self.npcs[name] = {
             "name": name,
             "occupation": occupation,
@@ -65,324 +169,298 @@ class NPCManager:
             **attributes                  # Any other cool traits they have
         }
         print(f"🎭 {name} the {occupation} has joined your story!")
+        for listener in self.roster_listeners:
+            listener(name)
+    
+    def read_player_tone(self, player_input: Union[str, TextAnalysis]) -> ToneReading:
+        """📏 How you're talking to the characters - and how strongly (scores per tone + a graded delta)"""
+        return self.tone_analyzer.read(player_input)
     
-    def analyze_player_tone(self, player_input: str) -> str:
+    def analyze_player_tone(self, player_input: Union[str, TextAnalysis]) -> str:
         """🎯 Figure out how you're talking to the characters - are you being nice?"""
-        input_lower = player_input.lower()
-        
-        # Words that show you're being polite and respectful
-        polite_words = ["please", "thank you", "excuse me", "sorry", "may i", "could you"]
-        # Words that might hurt someone's feelings
-        rude_words = ["shut up", "stupid", "idiot", "get out", "go away"]
-        # Words that would definitely scare someone
-        threatening_words = ["kill", "hurt", "attack", "threaten", "fight", "die"]
-        # Words that show you're being friendly and kind
-        friendly_words = ["hello", "hi", "friend", "help", "kind", "nice"]
-        
-        if any(word in input_lower for word in threatening_words):
-            return "Threatening"  # Yikes! That's scary talk!
-        elif any(word in input_lower for word in rude_words):
-            return "Rude"         # Not very nice...
-        elif any(word in input_lower for word in polite_words):
-            return "Polite"       # Such good manners!
-        elif any(word in input_lower for word in friendly_words):
-            return "Friendly"     # How nice and welcoming!
-        else:
-            return "Neutral"      # Just normal conversation
+        return self.read_player_tone(player_input).tone
     
-    def update_npc_emotion(self, npc_name: str, tone: str, interaction_text: str = ""):
-        """💭 Update how a character feels about you based on your interaction!"""
+    def update_npc_emotion(self, npc_name: str, tone: str, interaction_text: str = "",
+                           delta: Optional[int] = None):
+        """💭 Update how a character feels about you based on your interaction!
+        
+        `delta` is the graded change from a tone reading; without one, the tone's
+        usual effect applies.
+        """
         if npc_name not in self.npcs:
             self.initialize_npc(npc_name)  # Welcome the new character!
         
         npc = self.npcs[npc_name]
         
-        # Characters remember how you treat them
-        score_change = self.tone_effects.get(tone, 0)
-        npc["relationship_score"] += score_change
+        # Characters remember how you treat them - and their emotion follows from the new score
+        score_change = self.tone_effects.get(tone, 0) if delta is None else delta
+        self.npcs.table.adjust_scores([npc_name], score_change)
         npc["last_interaction"] = interaction_text
         
-        # Determine emotional state based on relationship score
-        score = npc["relationship_score"]
-        if score > 50:
-            emotion = "Adoring"
-        elif score > 20:
-            emotion = "Friendly"
-        elif score > 10:
-            emotion = "Pleased"
-        elif score > -10:
-            emotion = "Neutral"
-        elif score > -30:
-            emotion = "Annoyed"
-        elif score > -50:
-            emotion = "Angry"
-        else:
-            emotion = "Hostile"
+        return npc
+    
+    def find_npc_mentions(self, text: Union[str, TextAnalysis]) -> List[NameMention]:
+        """📍 Every known NPC named in the text, with positions - one walk over the words
         
-        npc["emotional_state"] = emotion
+        Capitalized names that aren't quite right ("Marcos") are matched to the
+        NPC they most likely mean.
+        """
+        analysis = TextAnalysis.ensure(text)
+        mentions = self.name_matcher.find(analysis)
+        if not len(self.fuzzy_names):
+            return mentions
         
-        return npc
+        covered = {i for mention in mentions for i in range(mention.first_token, mention.last_token + 1)}
+        near_misses = []
+        for start, end in analysis.capitalized_spans:
+            if any(i in covered for i in range(start, end)):
+                continue
+            # The whole run first ("Old Bridgit"), then word by word
+            tries = [(start, end)] if end - start > 1 else []
+            tries += [(i, i + 1) for i in range(start, end) if _is_valid_npc_name(analysis.tokens[i])]
+            for first, last in tries:
+                name = self.fuzzy_names.resolve(" ".join(analysis.tokens[first:last]))
+                if name is not None:
+                    near_misses.append(NameMention(
+                        name, analysis.offsets[first][0], analysis.offsets[last - 1][1], first, last - 1
+                    ))
+                    if last - first > 1:
+                        break  # The whole run matched - no need to try its words
+        if not near_misses:
+            return mentions
+        return sorted(mentions + near_misses, key=lambda mention: mention.start)
     
-    def get_mentioned_npcs(self, text: str) -> List[str]:
+    def get_mentioned_npcs(self, text: Union[str, TextAnalysis]) -> List[str]:
         """Find NPCs mentioned in text"""
-        mentioned = []
-        for npc_name in self.npcs.keys():
-            if re.search(r'\b' + re.escape(npc_name) + r'\b', text, re.IGNORECASE):
-                mentioned.append(npc_name)
-                # Track that this NPC was mentioned
-                self.npcs[npc_name]["times_mentioned"] += 1
+        mentioned = list(dict.fromkeys(mention.name for mention in self.find_npc_mentions(text)))
+        # Track that these NPCs were mentioned
+        self.npcs.load(mentioned)
+        self.npcs.table.add_mentions(mentioned)
         return mentioned
     
-    def update_current_npcs(self, text: str):
-        """Update which NPCs are currently present in the conversation with enhanced detection"""
-        # Clear current NPCs
-        self.current_npcs.clear()
+    def analyze(self, text: Union[str, TextAnalysis], find_new_npcs: bool = False,
+                in_quote: bool = False) -> NPCAnalysis:
+        """🔍 Everything the NPC side needs from one text, in a single pass
         
-        # Add NPCs that are mentioned in the current text
-        mentioned = self.get_mentioned_npcs(text)
-        self.current_npcs.update(mentioned)
+        Mentions, scene changes and tone all come from one read of the text; with
+        `find_new_npcs` we also look for characters being introduced, and
+        `in_quote` says the text starts inside someone's dialogue. Nothing about
+        the NPCs changes until you `apply` the result.
+        """
+        analysis = TextAnalysis.ensure(text)
+        mentions = self.find_npc_mentions(analysis)
+        mood = self.read_player_tone(analysis)
+        new_npcs = {}
+        if find_new_npcs:
+            named = set()
+            candidates = self._new_npc_candidates(analysis.text, named)
+            new_npcs = {
+                name: occupation for name, occupation in candidates.items()
+                # "Elana" is just Elena - but "a woman named Helena" really is someone new
+                if name not in self.npcs and (name in named or self.fuzzy_names.resolve(name) is None)
+            }
+            # ...so her name isn't a misspelled Elena either
+            mentions = [mention for mention in mentions
+                        if analysis.text[mention.start:mention.end].capitalize() not in new_npcs]
+        return NPCAnalysis(
+            text=analysis,
+            mentions=mentions,
+            mentioned=list(dict.fromkeys(mention.name for mention in mentions)),
+            scene=self.scene_scanner.scan(analysis, mentions, in_quote),
+            tone=mood.tone,
+            mood=mood,
+            new_npcs=new_npcs
+        )
+    
+    def apply(self, result: NPCAnalysis, react_to_tone: bool = False) -> NPCAnalysis:
+        """✅ Bring the NPCs up to date with one analyzed text (exactly once per text!)
         
-        # Enhanced presence indicators with more comprehensive patterns
-        presence_indicators = [
-            # Direct presence/arrival
-            r'(\w+)\s+(?:approaches?|walks?\s+(?:up|over|toward)|comes?\s+(?:forward|closer|over))',
-            r'(\w+)\s+(?:enters?|arrives?|appears?|emerges?|steps?\s+(?:forward|out))',
-            r'(\w+)\s+(?:stands?|sits?|waits?|remains?|stays?)\s+(?:nearby|here|there|close)',
-            
-            # Visual/perceptual presence
-            r'(?:you\s+(?:see|notice|spot|observe|watch))\s+(\w+)',
-            r'(?:there\s+(?:is|stands?|sits?))\s+(\w+)',
-            r'(\w+)\s+(?:is|was)\s+(?:standing|sitting|waiting|here|there|nearby)',
-            
-            # Communication/interaction
-            r'(\w+)\s+(?:says?|tells?|asks?|responds?|replies?|whispers?|shouts?|calls?)',
-            r'(?:talk|speak|chat|converse)\s+(?:to|with)\s+(\w+)',
-            r'(\w+)\s+(?:nods?|smiles?|frowns?|laughs?|sighs?|gestures?)',
-            
-            # Actions indicating presence
-            r'(\w+)\s+(?:gives?|hands?|offers?|shows?|presents?)',
-            r'(\w+)\s+(?:takes?|grabs?|picks?|accepts?|receives?)',
-            r'(\w+)\s+(?:looks?|stares?|glances?|gazes?)\s+(?:at|toward)',
-            r'(\w+)\s+(?:points?|gestures?|waves?|beckons?)',
-            
-            # Movement while present
-            r'(\w+)\s+(?:moves?|shifts?|turns?|leans?|steps?)',
-            r'(\w+)\s+(?:follows?|leads?|accompanies?)',
-            
-            # Departure indicators (remove from current)
-            r'(\w+)\s+(?:leaves?|departs?|goes?\s+away|walks?\s+away|disappears?)',
-            r'(\w+)\s+(?:exits?|retreats?|flees?|runs?\s+away)',
-        ]
+        New characters join (and arrive in the scene), mention counts go up, the
+        scene changes, and with `react_to_tone` everyone mentioned reacts to how
+        the player spoke.
+        """
+        for name, occupation in result.new_npcs.items():
+            if name not in self.npcs:
+                self.initialize_npc(name, occupation)
+                print(f"🆕 Detected new NPC: {name} the {occupation}")
+            if name not in result.scene.departed:
+                result.scene.arrived.add(name)  # Introduced right here in the scene
+            if name not in result.mentioned:
+                result.mentioned.append(name)
         
-        departure_patterns = [
-            r'(\w+)\s+(?:leaves?|departs?|goes?\s+away|walks?\s+away|disappears?)',
-            r'(\w+)\s+(?:exits?|retreats?|flees?|runs?\s+away)',
-            r'(\w+)\s+(?:is\s+gone|has\s+left|vanishes?)',
-        ]
+        # Track that these NPCs were mentioned
+        self.npcs.load(result.mentioned)
+        self.npcs.table.add_mentions(result.mentioned)
         
-        # Check for departing NPCs first (to remove them)
-        departing_npcs = set()
-        for pattern in departure_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                name = match if isinstance(match, str) else match[0] if match else ""
-                if name and name.capitalize() in self.npcs:
-                    departing_npcs.add(name.capitalize())
+        self._apply_scene(result.scene)
         
-        # Check for present NPCs
-        for pattern in presence_indicators:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                name = match if isinstance(match, str) else match[0] if match else ""
-                
-                if name and len(name) > 2:
-                    name = name.capitalize()
-                    # Only add if it's a known NPC and not departing
-                    if name in self.npcs and name not in departing_npcs:
-                        self.current_npcs.add(name)
+        if react_to_tone:
+            for npc_name in result.mentioned:
+                self.update_npc_emotion(npc_name, result.tone, result.text.text, delta=result.mood.delta)
+        return result
+    
+    def _apply_scene(self, delta: SceneDelta):
+        """🎬 Move the scene along; anyone we haven't heard from in a while quietly drifts out"""
+        self._scene_clock += 1
+        here = delta.arrived | delta.present
+        for npc_name in here:
+            self._last_seen[npc_name] = self._scene_clock
         
-        # Remove departing NPCs from current set
-        self.current_npcs -= departing_npcs
+        # How sure are we they're really here? A clear cue beats a guess
+        confidence = {}
+        for event in delta.events:
+            if event.name in here:
+                value = 1.0 if event.kind == ARRIVAL else _CUED_PRESENCE if event.cued else _GUESSED_PRESENCE
+                confidence[event.name] = max(confidence.get(event.name, 0.0), value)
+        for npc_name in here:
+            self._presence_confidence[npc_name] = confidence.get(npc_name, 1.0)  # Introduced right here
         
-        # Also check for NPCs being referenced in dialogue or actions
-        dialogue_patterns = [
-            r'\"[^\"]*(\w+)[^\"]*\"',  # NPCs mentioned in quoted dialogue
-            r'(?:about|regarding|concerning)\s+(\w+)',  # "talking about Marcus"
-            r'(?:with|alongside|beside)\s+(\w+)',  # "standing with Elena"
-        ]
+        # Nobody's mentioned them for a while? They've wandered off
+        for npc_name in self.current_npcs - delta.arrived - delta.present:
+            if self._scene_clock - self._last_seen.get(npc_name, 0) > SCENE_IDLE_UPDATES:
+                delta.departed.add(npc_name)
         
-        for pattern in dialogue_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                name = match if isinstance(match, str) else match[0] if match else ""
-                if name and name.capitalize() in self.npcs:
-                    self.current_npcs.add(name.capitalize())
+        delta.apply(self.current_npcs)
+        if here or delta.departed:
+            self._scene_version += 1
+    
+    def update_current_npcs(self, text: Union[str, TextAnalysis]) -> SceneDelta:
+        """🎬 Update who's in the scene from what the text says happened - and report the changes"""
+        return self.apply(self.analyze(text)).scene
     
     def get_current_npc_states(self) -> Dict[str, Dict[str, Any]]:
-        """Get states of only currently present NPCs for UI display"""
-        return {
-            name: {
-                "score": self.npcs[name]["relationship_score"],
-                "emotion": self.npcs[name]["emotional_state"],
-                "occupation": self.npcs[name].get("occupation", "Unknown")
-            }
-            for name in self.current_npcs if name in self.npcs
-        }
+        """Get states of only currently present NPCs for UI display (only they are read from disk)"""
+        self.npcs.load(self.current_npcs)
+        table = self.npcs.table
+        present = sorted(self.current_npcs, key=lambda name: table.rows.get(name, -1))  # In roster order
+        return self._with_occupations(table.columns_for(present))
+    
+    def npc_salience(self, name: str, newest: Optional[int] = None) -> float:
+        """⭐ How much an NPC deserves a spot in the storyteller's notes right now
+        
+        Recently talked about, strong feelings (either way) and being clearly
+        in the scene all count - see NPC_SALIENCE_WEIGHTS.
+        """
+        newest = self._scene_clock if newest is None else newest
+        recency = 1.0 / (1 + newest - self._last_seen.get(name, 0))
+        relationship = min(abs(self.npcs[name]["relationship_score"]), 100) / 100
+        presence = self._presence_confidence.get(name, _GUESSED_PRESENCE)
+        return (
+            NPC_SALIENCE_WEIGHTS['recency'] * recency
+            + NPC_SALIENCE_WEIGHTS['relationship'] * relationship
+            + NPC_SALIENCE_WEIGHTS['presence'] * presence
+        )
     
-    def get_npc_context(self) -> str:
-        """Get formatted context of currently present NPCs"""
+    def salient_npcs(self, k: int = NPC_CONTEXT_TOP_K) -> List[str]:
+        """🏆 The k most salient NPCs in the scene, best first (a heap pick, not a full sort)"""
+        present = [name for name in self.current_npcs if name in self.npcs]
+        # Recency is measured from the latest sighting in the scene, so it only moves when the scene does
+        newest = max((self._last_seen.get(name, 0) for name in present), default=0)
+        return heapq.nlargest(k, sorted(present), key=lambda name: self.npc_salience(name, newest))
+    
+    def get_npc_context(self, k: int = NPC_CONTEXT_TOP_K, token_budget: int = NPC_CONTEXT_TOKEN_BUDGET) -> str:
+        """Get formatted context of the most salient NPCs present, within a token budget
+        
+        Remembered until an NPC's numbers or the scene actually change.
+        """
         if not self.current_npcs:
             return "No NPCs currently present."
         
-        contexts = []
-        for name in self.current_npcs:
-            if name in self.npcs:
-                data = self.npcs[name]
-                contexts.append(f"{name} ({data['occupation']}): {data['emotional_state']} (Relationship: {data['relationship_score']})")
+        key = (self.npcs.table.version, self._scene_version, k, token_budget)
+        if self._context_cache is not None and self._context_cache[0] == key:
+            return self._context_cache[1]
+        
+        contexts, used = [], 0
+        chosen = self.salient_npcs(k)
+        for name in chosen:
+            data = self.npcs[name]
+            line = f"{name} ({data['occupation']}): {data['emotional_state']} (Relationship: {data['relationship_score']})"
+            cost = _estimate_tokens(line)
+            if contexts and used + cost > token_budget:
+                break
+            contexts.append(line)
+            used += cost
         
-        return "\n".join(contexts)
+        others = len(self.current_npcs) - len(contexts)
+        if others > 0:
+            contexts.append(f"...and {others} other{'s' if others > 1 else ''} nearby")
+        context = "\n".join(contexts)
+        self._context_cache = (key, context)
+        return context
     
-    def get_npc_states(self) -> Dict[str, Dict[str, Any]]:
-        """Get all NPC states for reference (backward compatibility)"""
-        return {
-            name: {
-                "score": data["relationship_score"],
-                "emotion": data["emotional_state"],
-                "occupation": data.get("occupation", "Unknown")
-            }
-            for name, data in self.npcs.items()
-        }
+    def get_npc_states(self, wake_everyone: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Get NPC states for reference (backward compatibility)
+        
+        Read straight from the table's columns, and reused until something about
+        an NPC actually changes - the GUI can ask as often as it likes. That's
+        every NPC awake this session; characters still asleep on disk are only
+        read in with `wake_everyone` (the whole roster can be thousands!).
+        """
+        if wake_everyone:
+            self.npcs.load(self.npcs)
+        table = self.npcs.table
+        if self._states_cache is None or self._states_cache[0] != table.version:
+            self._states_cache = (table.version, self._with_occupations(table.columns_for()))
+        return {name: dict(state) for name, state in self._states_cache[1].items()}
     
-    def is_valid_npc_name(self, name: str) -> bool:
-        """Check if a name is valid for an NPC (not a common word)"""
-        if not name or len(name) < 2:
-            return False
-            
-        name_lower = name.lower()
+    def _with_occupations(self, states: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        for name, state in states.items():
+            state["occupation"] = self.npcs[name].get("occupation", "Unknown")
+        return states
+    
+    def decay_relationships(self, factor: float, wake_everyone: bool = False):
+        """🌫️ Time heals (and fades): every awake relationship drifts toward neutral in one go
         
-        # Enhanced exclusion list
-        excluded_words = {
-            # Common words that aren't names
-            'the', 'and', 'you', 'your', 'they', 'them', 'their', 'this', 'that', 'these', 'those',
-            'here', 'there', 'where', 'when', 'what', 'who', 'why', 'how', 'which',
-            'with', 'from', 'into', 'unto', 'upon', 'over', 'under', 'above', 'below',
-            'before', 'after', 'during', 'while', 'since', 'until', 'through', 'across',
-            'around', 'between', 'among', 'within', 'without', 'inside', 'outside',
-            
-            # Common verbs that might be mistaken for names
-            'says', 'said', 'tells', 'told', 'asks', 'asked', 'calls', 'called',
-            'walks', 'walked', 'runs', 'ran', 'comes', 'came', 'goes', 'went',
-            'takes', 'took', 'gives', 'gave', 'makes', 'made', 'does', 'did',
-            'looks', 'looked', 'sees', 'saw', 'hears', 'heard', 'feels', 'felt',
-            
-            # Common adjectives
-            'old', 'young', 'new', 'big', 'small', 'large', 'little', 'good', 'bad',
-            'great', 'long', 'short', 'high', 'low', 'right', 'left', 'first', 'last',
-            'next', 'few', 'many', 'much', 'more', 'most', 'other', 'another', 'same',
-            
-            # Common nouns that aren't names
-            'man', 'woman', 'person', 'people', 'child', 'boy', 'girl', 'friend', 'enemy',
-            'stranger', 'traveler', 'visitor', 'guest', 'host', 'owner', 'master', 'servant',
-            'lord', 'lady', 'king', 'queen', 'prince', 'princess', 'duke', 'baron',
-            
-            # RPG-specific common words
-            'player', 'character', 'hero', 'villain', 'monster', 'creature', 'beast',
-            'dragon', 'goblin', 'orc', 'elf', 'dwarf', 'human', 'halfling',
-            'warrior', 'fighter', 'mage', 'wizard', 'priest', 'cleric', 'rogue', 'thief',
-            'archer', 'ranger', 'paladin', 'barbarian', 'monk', 'sorcerer', 'warlock',
-            
-            # Common titles and occupations (general)
-            'sir', 'lord', 'lady', 'master', 'mister', 'miss', 'mrs', 'doctor', 'captain',
-            
-            # Location words
-            'town', 'city', 'village', 'castle', 'tower', 'dungeon', 'cave', 'forest',
-            'mountain', 'river', 'lake', 'sea', 'ocean', 'desert', 'plain', 'hill',
-            'road', 'path', 'bridge', 'gate', 'door', 'window', 'wall', 'floor', 'roof',
-            
-            # Time words
-            'day', 'night', 'morning', 'evening', 'noon', 'midnight', 'dawn', 'dusk',
-            'today', 'tomorrow', 'yesterday', 'week', 'month', 'year', 'hour', 'minute',
-            
-            # Game mechanics
-            'level', 'experience', 'skill', 'ability', 'spell', 'magic', 'item', 'weapon',
-            'armor', 'shield', 'sword', 'bow', 'staff', 'potion', 'scroll', 'book',
-            'gold', 'silver', 'copper', 'coin', 'treasure', 'loot', 'quest', 'mission',
-        }
+        With `wake_everyone`, characters still asleep on disk fade too.
+        """
+        if wake_everyone:
+            self.npcs.load(self.npcs)
+        self.npcs.table.decay(factor)
+    
+    def top_npcs(self, n: int, by: str = "relationship_score", lowest: bool = False,
+                 wake_everyone: bool = False) -> List[str]:
+        """🏆 Who likes you most (or least, or comes up most often) - `by` is a column name
         
-        return (
-            name.replace("'", "").replace("-", "").isalpha() and  # Allow apostrophes and hyphens in names
-            len(name) >= 2 and 
-            name_lower not in excluded_words and
-            name[0].isupper() and  # Should be capitalized like a proper name
-            not name.isupper()     # Avoid all-caps words
-        )
+        Ranks the NPCs awake this session; `wake_everyone` ranks the whole roster.
+        """
+        if wake_everyone:
+            self.npcs.load(self.npcs)
+        return self.npcs.table.top(n, by, lowest)
     
-    def process_dm_response_for_npcs(self, dm_response: str):
-        """Extract and initialize NPCs from DM response with enhanced filtering"""
-        # Enhanced patterns for better NPC detection
-        npc_patterns = [
-            # Direct introduction patterns
-            r'(?:meet|encounter|see|find|approach)\s+(\w+),?\s+(?:the|a|an)\s+(\w+)',  # "meet Boric, the blacksmith"
-            r'(\w+)\s+the\s+(\w+)(?:\s+(?:approaches?|says?|tells?|greets?|nods?))',    # "Elara the merchant approaches"
-            r'(?:a|an)\s+(\w+)\s+named\s+(\w+)',                         # "a blacksmith named Boric"
-            r'(\w+)\s+named\s+(\w+)(?:\s+(?:approaches?|says?|tells?))?',  # "merchant named Gareth"
-            
-            # Conversation patterns
-            r'(?:talk|speak)\s+(?:to|with)\s+(\w+)(?:\s+the\s+(\w+))?',  # "talk to Marcus the guard"
-            r'(\w+)(?:\s+the\s+(\w+))?\s+(?:says?|tells?|asks?|responds?|replies?)', # "Marcus says" or "Marcus the guard says"
-            r'(\w+)\s+(?:whispers?|shouts?|calls?|announces?)',           # "Marcus whispers"
-            
-            # Action patterns
-            r'(\w+)(?:\s+the\s+(\w+))?\s+(?:walks?|runs?|moves?|steps?)',  # "Marcus walks"
-            r'(\w+)(?:\s+the\s+(\w+))?\s+(?:gives?|hands?|offers?)',       # "Elena gives"
-            r'(\w+)(?:\s+the\s+(\w+))?\s+(?:takes?|grabs?|picks?)',        # "Thorin takes"
+    def is_valid_npc_name(self, name: str) -> bool:
+        """Check if a name is valid for an NPC (not a common word)"""
+        return _is_valid_npc_name(name)
+    
+    def process_dm_response_for_npcs(self, dm_response: Union[str, TextAnalysis]) -> NPCAnalysis:
+        """Extract and initialize NPCs from DM response, and update the scene - one pass"""
+        return self.apply(self.analyze(dm_response, find_new_npcs=True))
+    
+    def _introductions(self, dm_response: str) -> Iterator[Tuple[str, Optional[str], bool]]:
+        """Every (name, occupation or None, named outright?) the text offers, in order - one read"""
+        for match in _INTRODUCTIONS.finditer(dm_response):
+            # The first pattern (in list order) that fits at this word is the one that matched
+            for first, count, where in _INTRODUCTION_GROUPS:
+                if match.group(first) is not None:
+                    break
+            words = match.groups()[first - 1:first - 1 + count]
+            one, other = words[0], words[1] if count > 1 else None
             
-            # Descriptive patterns
-            r'(?:you\s+(?:see|notice|spot|observe))\s+(\w+)(?:\s+the\s+(\w+))?',  # "you see Marcus"
-            r'(?:there\s+(?:is|stands?|sits?))\s+(\w+)(?:\s+the\s+(\w+))?',        # "there is Elena"
-        ]
-        
-        # Additional occupation-specific patterns
-        occupation_patterns = [
-            r'(?:the\s+)?(\w+)\s+(blacksmith|merchant|guard|innkeeper|wizard|priest|bard|farmer|hunter|knight|captain|librarian|cook|stable\w*|shop\w*)',
-            r'(blacksmith|merchant|guard|innkeeper|wizard|priest|bard|farmer|hunter|knight|captain|librarian|cook)\s+(\w+)',
-        ]
+            if where != _NAME_SECOND and self.is_valid_npc_name(one):
+                yield one.capitalize(), other, False
+            elif where != _NAME_FIRST and other and self.is_valid_npc_name(other):
+                yield other.capitalize(), one, where == _NAME_SECOND  # "a woman named Helena"
+    
+    def _new_npc_candidates(self, dm_response: str, named: Optional[Set[str]] = None) -> Dict[str, str]:
+        """Characters the text seems to introduce: name -> occupation (one read of the text)
         
+        Pass a set as `named` to learn which of them were introduced by name
+        outright ("a woman named Helena") rather than just seen doing something.
+        """
         detected_npcs = {}
+        for name, occupation, named_outright in self._introductions(dm_response):
+            if occupation or name not in detected_npcs:  # "Fenwick walks" doesn't make the wizard a "person"
+                detected_npcs[name] = occupation.lower() if occupation else "person"
+            if named_outright and named is not None:
+                named.add(name)
         
-        # Process main NPC patterns
-        for pattern in npc_patterns:
-            matches = re.findall(pattern, dm_response, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple) and len(match) >= 1:
-                    name = match[0] if match[0] else None
-                    occupation = match[1] if len(match) > 1 and match[1] else "person"
-                    
-                    if name and self.is_valid_npc_name(name):
-                        name = name.capitalize()
-                        occupation = occupation.lower() if occupation else "person"
-                        detected_npcs[name] = occupation
-        
-        # Process occupation-specific patterns
-        for pattern in occupation_patterns:
-            matches = re.findall(pattern, dm_response, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple) and len(match) >= 2:
-                    # Handle both "Name occupation" and "occupation Name" patterns
-                    if match[0] and self.is_valid_npc_name(match[0]):
-                        name, occupation = match[0].capitalize(), match[1].lower()
-                    elif match[1] and self.is_valid_npc_name(match[1]):
-                        name, occupation = match[1].capitalize(), match[0].lower()
-                    else:
-                        continue
-                    
-                    detected_npcs[name] = occupation
-        
-        # Initialize new NPCs
-        for name, occupation in detected_npcs.items():
-            if name not in self.npcs:
-                self.initialize_npc(name, occupation)
-                print(f"🆕 Detected new NPC: {name} the {occupation}")
-        
-        # Update current NPCs based on the DM response
-        self.update_current_npcs(dm_response)
\ No newline at end of file
+        return detected_npcs
\ No newline at end of file
@@ -0,0 +1,254 @@
+# storyteller/core/npc_registry.py
+"""
+📒 The Character Ledger - Every NPC Remembered Between Adventures!
+
+Characters shouldn't forget you just because you closed the game. The ledger
+keeps every NPC in the memory docs as a journal: whenever a character is
+introduced or their feelings change, one small line is added to the end of
+the event log (so saving only costs as much as what actually changed). Every
+so often the journal is tidied into a snapshot, one character per line, plus
+a little index of where each character's line starts. While the game runs,
+the numbers (scores, emotions, mentions) of every NPC we've woken up live in
+one shared NPCTable, so whole-world updates are single array operations.
+
+On startup we only read that index and the (short) log since the last
+snapshot - a character's full details are read the first time the story
+actually needs them, so a world with thousands of NPCs still starts instantly.
+"""
+
+import copy
+import json
+import os
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..config import NPC_SNAPSHOT_EVERY
+from .npc_table import NPCTable, NPCRecord
+
+INTRODUCE, UPDATE, REMOVE = "introduce", "update", "remove"
+
+_INDEX_FILE = "npc_registry.json"  # Which snapshot is current, and where each NPC's line starts
+_LOG_FILE = "npc_events.log"       # Append-only journal of changes since that snapshot
+
+
+class NPCRegistry(MutableMapping):
+    """📒 name -> NPC state, saved as an append-only event log plus periodic snapshots
+
+    Works like the plain dict `NPCManager.npcs` used to be (each NPC is an
+    NPCRecord that reads like a dict). With no save path it's simply an
+    in-memory roster.
+    """
+
+    def __init__(self, save_path: Optional[str] = None, snapshot_every: int = NPC_SNAPSHOT_EVERY):
+        self.save_path = save_path
+        self.snapshot_every = snapshot_every   # Events in the log before we tidy into a new snapshot
+        self.generation = 0                    # Bumped with every snapshot; older log lines are ignored
+        self.events_since_snapshot = 0
+        self.loads = 0                         # How many NPCs we've had to read from disk
+        self._snapshot_file: Optional[str] = None
+        self._snapshot_index: Dict[str, Tuple[int, int]] = {}  # name -> (offset, length) in the snapshot
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}   # name -> logged events not yet applied
+        self.table = NPCTable()                               # The numbers of every NPC we've woken up
+                                                              # (its `dirty` set: who changed since the last save)
+        self._loaded: Dict[str, NPCRecord] = {}               # NPCs we've woken up this session
+        self._saved: Dict[str, Dict[str, Any]] = {}           # What the disk knows about each loaded NPC
+        self._removed: Set[str] = set()                       # Gone since the last save
+        if save_path:
+            self._load_index()
+
+    # 📂 Finding our way around the files
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.save_path, filename)
+
+    def _load_index(self):
+        """Read where everyone is - but not who they are (that waits until they're needed)"""
+        try:
+            if os.path.exists(self._path(_INDEX_FILE)):
+                with open(self._path(_INDEX_FILE), 'r') as f:
+                    index = json.load(f)
+                self.generation = index.get('generation', 0)
+                self._snapshot_file = index.get('snapshot')
+                self._snapshot_index = {name: tuple(span) for name, span in index.get('npcs', {}).items()}
+            if os.path.exists(self._path(_LOG_FILE)):
+                with open(self._path(_LOG_FILE), 'r') as f:
+                    for line in f:
+                        event = json.loads(line)
+                        if event.get('gen') == self.generation:  # Older lines are already in the snapshot
+                            self._pending.setdefault(event['npc'], []).append(event)
+                            self.events_since_snapshot += 1
+                # Whoever was removed last is simply gone - not a name waiting to be woken up
+                for name, events in list(self._pending.items()):
+                    if events[-1]['op'] == REMOVE:
+                        del self._pending[name]
+                        self._snapshot_index.pop(name, None)
+        except Exception as e:
+            print(f"⚠️ Couldn't read the NPC ledger (some characters may be forgotten): {e}")
+
+    def _read_snapshot(self, name: str) -> Optional[Dict[str, Any]]:
+        span = self._snapshot_index.get(name)
+        if span is None or not self._snapshot_file:
+            return None
+        offset, length = span
+        with open(self._path(self._snapshot_file), 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def _wake(self, name: str) -> Optional[Dict[str, Any]]:
+        """📖 Read one NPC from the snapshot and replay their logged changes"""
+        state = self._read_snapshot(name)
+        for event in self._pending.pop(name, []):
+            if event['op'] == INTRODUCE:
+                state = event['state']
+            elif event['op'] == REMOVE:
+                state = None
+            elif state is not None:
+                state.update(event.get('changes', {}))
+                state['relationship_score'] = state.get('relationship_score', 0) + event.get('score_delta', 0)
+        self._snapshot_index.pop(name, None)
+        if state is None:
+            return None
+        self.loads += 1
+        record = self._loaded[name] = NPCRecord.adopt(self.table, name, state)
+        self.table.dirty.discard(name)  # Waking up isn't a change
+        self._saved[name] = copy.deepcopy(record.to_dict())
+        return record
+
+    # 📚 The dict-like side, so everything that used `npcs` keeps working
+    def __getitem__(self, name: str) -> NPCRecord:
+        state = self._loaded.get(name)
+        if state is None:
+            state = self._wake(name) if name in self else None
+            if state is None:
+                raise KeyError(name)
+        return state
+
+    def __setitem__(self, name: str, state: Dict[str, Any]):
+        if name not in self._loaded and name in self:
+            self._wake(name)  # So saving knows what changed
+        self._removed.discard(name)
+        self._loaded[name] = NPCRecord.adopt(self.table, name, dict(state))
+
+    def __delitem__(self, name: str):
+        if name not in self:
+            raise KeyError(name)
+        if self._loaded.pop(name, None) is not None:
+            self.table.remove(name)
+        self._saved.pop(name, None)
+        self._snapshot_index.pop(name, None)
+        self._pending.pop(name, None)
+        self._removed.add(name)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self._loaded or name in self._snapshot_index or name in self._pending
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(dict.fromkeys([*self._loaded, *self._snapshot_index, *self._pending])))
+
+    def __len__(self) -> int:
+        return len(set(self._loaded) | set(self._snapshot_index) | set(self._pending))
+
+    @property
+    def loaded(self) -> int:
+        """How many NPCs are awake in memory right now"""
+        return len(self._loaded)
+
+    def load(self, names: Iterable[str]):
+        """Make sure these NPCs are awake (so their rows are in the table)"""
+        for name in names:
+            if name not in self._loaded and name in self:
+                self._wake(name)
+
+    # 💾 Saving
+    def _changes(self) -> List[Dict[str, Any]]:
+        """One event per NPC that changed since the last save (only those are even looked at)"""
+        events = [{'op': REMOVE, 'npc': name} for name in self._removed]
+        for name in self.table.dirty:
+            record = self._loaded.get(name)
+            if record is None:
+                continue
+            state = record.to_dict()
+            before = self._saved.get(name)
+            if before is None:
+                events.append({'op': INTRODUCE, 'npc': name, 'state': state})
+                continue
+            changes = {key: value for key, value in state.items()
+                       if key != 'relationship_score' and before.get(key) != value}
+            score_delta = state.get('relationship_score', 0) - before.get('relationship_score', 0)
+            if changes or score_delta:
+                event = {'op': UPDATE, 'npc': name, 'changes': changes}
+                if score_delta:
+                    event['score_delta'] = score_delta
+                events.append(event)
+        return events
+
+    def save(self):
+        """📝 Append what changed to the log (and tidy into a snapshot every so often)"""
+        if not self.save_path:
+            return
+        events = self._changes()
+        if events:
+            try:
+                with open(self._path(_LOG_FILE), 'a') as f:
+                    for event in events:
+                        f.write(json.dumps({**event, 'gen': self.generation}) + "\n")
+            except Exception as e:
+                print(f"⚠️ Couldn't save NPCs (but they're still in active memory): {e}")
+                return
+            self._removed.clear()
+            for event in events:
+                if event['npc'] in self._loaded:
+                    self._saved[event['npc']] = copy.deepcopy(self._loaded[event['npc']].to_dict())
+            self.events_since_snapshot += len(events)
+        self.table.dirty.clear()
+        if self.events_since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self):
+        """📸 Write everyone to a fresh snapshot and start a new, empty log
+
+        The new snapshot and index are in place before the log is cleared, and
+        the log lines carry the snapshot generation, so a crash halfway through
+        never replays a change twice.
+        """
+        if not self.save_path:
+            return
+        for name in list(self._pending):
+            self._wake(name)  # Only NPCs with logged changes need reading; the rest are copied as-is
+
+        generation = self.generation + 1
+        snapshot_file = f"npc_snapshot.{generation}.jsonl"
+        index = {}
+        try:
+            untouched = {}
+            if self._snapshot_index:
+                with open(self._path(self._snapshot_file), 'rb') as old:
+                    for name, (offset, length) in self._snapshot_index.items():
+                        old.seek(offset)
+                        untouched[name] = old.read(length)
+            with open(self._path(snapshot_file), 'wb') as f:
+                for name in self:
+                    line = untouched[name] if name in untouched else json.dumps(self._loaded[name].to_dict()).encode()
+                    index[name] = (f.tell(), len(line))
+                    f.write(line + b"\n")
+            with open(self._path(_INDEX_FILE + ".tmp"), 'w') as f:
+                json.dump({'generation': generation, 'snapshot': snapshot_file, 'npcs': index}, f)
+            os.replace(self._path(_INDEX_FILE + ".tmp"), self._path(_INDEX_FILE))
+        except Exception as e:
+            print(f"⚠️ Couldn't write an NPC snapshot (the event log still has everything): {e}")
+            return
+
+        previous, self._snapshot_file, self.generation = self._snapshot_file, snapshot_file, generation
+        self._snapshot_index = {name: span for name, span in index.items() if name not in self._loaded}
+        self.events_since_snapshot = 0
+        open(self._path(_LOG_FILE), 'w').close()
+        if previous and previous != snapshot_file and os.path.exists(self._path(previous)):
+            os.remove(self._path(previous))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'npcs': len(self),
+            'loaded': self.loaded,
+            'loads_from_disk': self.loads,
+            'events_since_snapshot': self.events_since_snapshot,
+            'generation': self.generation
+        }
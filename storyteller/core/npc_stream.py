@@ -0,0 +1,159 @@
+# storyteller/core/npc_stream.py
+"""
+📡 The Live Character Spotter - Meeting NPCs While the Story Is Still Being Told!
+
+When the storyteller's reply arrives a few words at a time, there's no need to
+wait for the very last word before noticing that "you meet Gareth, the
+merchant". The live spotter reads each finished sentence as soon as it's
+complete, welcomes new characters right away and reports who showed up, stayed
+or left - holding back only the sentence that's still being written, so a name
+split across two pieces ("Gar" + "eth") is never missed.
+
+When the reply is done, everything it read is handed to the NPC manager as one
+analyzed text, exactly as if the whole reply had been read at the end.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
+
+from ..config import NPC_STREAM_CARRY_CHARS
+from ..utils.text import TextAnalysis
+from .name_matcher import NameMention
+from .npc import NPCAnalysis, NPCManager
+from .scene import SceneDelta, SceneEvent, REFERENCE, quoted_tokens, sentence_numbers
+
+INTRODUCTION = "introduction"
+
+# A sentence is finished once its closing mark (and any closing quote) is followed by a space
+_SENTENCE_END = re.compile(r'[.!?…]+["”’\')\]]*\s+|\n\s*')
+_SPACE = re.compile(r'\s+')
+
+
+@dataclass(frozen=True)
+class NPCStreamEvent:
+    """📣 Something we noticed about a character while the reply was streaming in"""
+
+    kind: str              # introduction, or a scene cue: arrival / presence / departure
+    name: str
+    start: int             # Where in the whole reply (so far) it happened
+    end: int
+    occupation: str = ""   # For introductions
+
+
+class NPCStreamScanner:
+    """📡 Feed it the reply piece by piece; get NPC events as soon as each sentence is finished
+
+    New characters join the roster the moment they're introduced (so the next
+    sentence already knows their name). Mention counts and the scene are only
+    updated once, in `finish`, so a streamed reply counts as one text just like
+    a whole one.
+    """
+
+    def __init__(self, npc_manager: NPCManager, carry_chars: int = NPC_STREAM_CARRY_CHARS):
+        self.npc_manager = npc_manager
+        self.carry_chars = carry_chars  # An unfinished sentence longer than this gets read anyway
+        self._pending = ""              # The sentence still being written
+        self._offset = 0                # Where the pending text starts in the whole reply
+        self._in_quote = False          # Whether the pending text starts inside someone's dialogue
+        self._pieces: List[Tuple[int, NPCAnalysis]] = []  # (offset, analysis) of every settled piece
+        self._introduced: Dict[str, str] = {}             # Characters this reply introduced
+        self._reported: Set[Tuple[str, str]] = set()      # (name, kind) events already handed out
+        self.events: List[NPCStreamEvent] = []            # Every event so far, including the last sentence's
+
+    @property
+    def text(self) -> str:
+        """Everything fed in so far"""
+        return "".join(piece.text.text for _, piece in self._pieces) + self._pending
+
+    def feed(self, chunk: str) -> List[NPCStreamEvent]:
+        """🍽️ Take the next piece of the reply and report anything new in the sentences it finished"""
+        self._pending += chunk
+        cut = 0
+        for match in _SENTENCE_END.finditer(self._pending):
+            cut = match.end()
+        if not cut and len(self._pending) > self.carry_chars:
+            # A very long sentence: read up to its last space rather than holding on forever
+            for match in _SPACE.finditer(self._pending):
+                cut = match.end()
+        if not cut:
+            return []
+        settled, self._pending = self._pending[:cut], self._pending[cut:]
+        return self._read(settled)
+
+    def finish(self) -> NPCAnalysis:
+        """✅ The reply is complete: read what's left and bring the NPCs up to date, once
+
+        The last sentence's events land in `events` along with all the others.
+        """
+        if self._pending:
+            self._read(self._pending)
+            self._pending = ""
+        result = self._combined()
+        self.npc_manager.apply(result)
+        return result
+
+    def _read(self, settled: str) -> List[NPCStreamEvent]:
+        """Analyze one settled piece, welcome newcomers and turn what we found into events"""
+        offset = self._offset
+        self._offset += len(settled)
+        # Dialogue often runs over several sentences - a name in its third one is still just talk
+        piece = self.npc_manager.analyze(settled, find_new_npcs=True, in_quote=self._in_quote)
+        self._pieces.append((offset, piece))
+        quoted = quoted_tokens(piece.text.folded, self._in_quote)
+        if quoted:
+            self._in_quote = quoted[-1]
+
+        events = []
+        for name, occupation in piece.new_npcs.items():
+            if name not in self.npc_manager.npcs:
+                self.npc_manager.initialize_npc(name, occupation)
+                print(f"🆕 Detected new NPC: {name} the {occupation}")
+            self._introduced.setdefault(name, occupation)
+            position = settled.find(name)
+            start = offset + max(position, 0)
+            events.append(NPCStreamEvent(INTRODUCTION, name, start, start + len(name), occupation))
+
+        for event in piece.scene.events:
+            if event.kind == REFERENCE or (event.name, event.kind) in self._reported:
+                continue
+            self._reported.add((event.name, event.kind))
+            events.append(NPCStreamEvent(event.kind, event.name, offset + event.start, offset + event.end))
+        events.sort(key=lambda event: event.start)
+        self.events += events
+        return events
+
+    def _combined(self) -> NPCAnalysis:
+        """Stitch the settled pieces back into one analysis of the whole reply"""
+        if not self._pieces:
+            return NPCAnalysis(text=TextAnalysis.of(""))
+        text = self._pieces[0][1].text
+        mentions, events = [], []
+        sentences = 0  # Sentences in the pieces before this one
+        for offset, piece in self._pieces:
+            if piece is not self._pieces[0][1]:
+                text = TextAnalysis.join(text, piece.text, separator="")
+            tokens = len(text.tokens) - len(piece.text.tokens)
+            mentions += [
+                NameMention(mention.name, mention.start + offset, mention.end + offset,
+                            mention.first_token + tokens, mention.last_token + tokens)
+                for mention in piece.mentions
+            ]
+            events += [
+                SceneEvent(event.name, event.kind, event.start + offset, event.end + offset, event.cued,
+                           event.sentence + sentences)
+                for event in piece.scene.events
+            ]
+            numbers = sentence_numbers(piece.text.folded)
+            if numbers:
+                sentences += numbers[-1] + 1
+        mood = self.npc_manager.read_player_tone(text)
+        return NPCAnalysis(
+            text=text,
+            mentions=mentions,
+            mentioned=list(dict.fromkeys(mention.name for mention in mentions)),
+            scene=SceneDelta.from_events(events),
+            tone=mood.tone,
+            mood=mood,
+            new_npcs=dict(self._introduced)
+        )
@@ -0,0 +1,243 @@
+# storyteller/core/npc_table.py
+"""
+📊 The Character Spreadsheet - Every NPC's Feelings in a Few Tidy Columns!
+
+Instead of each character carrying their own little dictionary of numbers, the
+spreadsheet keeps one column per number - relationship scores, emotions (as
+small codes) and how often they've been mentioned - with one row per NPC.
+Working out everyone's emotion is a single lookup over the whole score column,
+and "everyone calms down a little" or "who likes us most?" are one array
+operation each, no matter how many characters your world has.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+import numpy as np
+
+# Feelings from worst to best; a score above the i-th threshold means at least EMOTIONS[i + 1]
+EMOTIONS = ("Hostile", "Angry", "Annoyed", "Neutral", "Pleased", "Friendly", "Adoring")
+EMOTION_THRESHOLDS = np.array([-50, -30, -10, 10, 20, 50], dtype=np.int32)
+_EMOTION_CODES = {emotion: code for code, emotion in enumerate(EMOTIONS)}
+NEUTRAL = _EMOTION_CODES["Neutral"]
+
+# The numbers that live in columns rather than in each NPC's own details
+COLUMNS = ("relationship_score", "emotional_state", "times_mentioned")
+
+
+def emotion_codes(scores) -> np.ndarray:
+    """🎭 Emotion codes for a whole column of scores at once (one sorted-threshold lookup)"""
+    return np.searchsorted(EMOTION_THRESHOLDS, scores, side='left').astype(np.int8)
+
+
+def emotion_for(score: int) -> str:
+    """How a character with this relationship score feels"""
+    return EMOTIONS[int(np.searchsorted(EMOTION_THRESHOLDS, score, side='left'))]
+
+
+class NPCTable:
+    """📊 Struct-of-arrays NPC numbers: score, emotion code and mention count per row"""
+
+    def __init__(self, initial_capacity: int = 64):
+        self.scores = np.zeros(initial_capacity, dtype=np.int32)
+        self.emotions = np.full(initial_capacity, NEUTRAL, dtype=np.int8)
+        self.mentions = np.zeros(initial_capacity, dtype=np.int32)
+        self.names: List[str] = []        # Which NPC each row belongs to
+        self.rows: Dict[str, int] = {}    # And which row each NPC lives in
+        self.version = 0                  # Bumped on every change, so callers can cache what they read
+        self.dirty: Set[str] = set()      # Characters changed since whoever saves us last looked
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self.rows
+
+    def _grow(self):
+        """Double the room so adding characters stays cheap on average"""
+        capacity = len(self.scores) * 2
+        for column, fill in (("scores", 0), ("emotions", NEUTRAL), ("mentions", 0)):
+            old = getattr(self, column)
+            grown = np.full(capacity, fill, dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, column, grown)
+
+    def add(self, name: str, score: int = 0, mentions: int = 0, emotion: Optional[str] = None) -> int:
+        """📌 Give a character a row (or reset theirs) and return it"""
+        row = self.rows.get(name)
+        if row is None:
+            if len(self.names) == len(self.scores):
+                self._grow()
+            row = len(self.names)
+            self.names.append(name)
+            self.rows[name] = row
+        self.scores[row] = score
+        self.emotions[row] = _EMOTION_CODES[emotion] if emotion in _EMOTION_CODES else emotion_codes(score)
+        self.mentions[row] = mentions
+        self.version += 1
+        self.dirty.add(name)
+        return row
+
+    def remove(self, name: str):
+        """Drop a character's row (the last row moves into the gap)"""
+        row = self.rows.pop(name)
+        last = len(self.names) - 1
+        if row != last:
+            moved = self.names[last]
+            self.names[row] = moved
+            self.rows[moved] = row
+            for column in (self.scores, self.emotions, self.mentions):
+                column[row] = column[last]
+        self.names.pop()
+        self.dirty.discard(name)
+        self.version += 1
+
+    def _rows_of(self, names: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self.rows[name] for name in names), dtype=np.intp)
+
+    # 🔍 Reading one character
+    def score(self, name: str) -> int:
+        return int(self.scores[self.rows[name]])
+
+    def emotion(self, name: str) -> str:
+        return EMOTIONS[self.emotions[self.rows[name]]]
+
+    def mention_count(self, name: str) -> int:
+        return int(self.mentions[self.rows[name]])
+
+    # ✏️ Changing characters
+    def set_score(self, name: str, score: int):
+        row = self.rows[name]
+        self.scores[row] = score
+        self.emotions[row] = emotion_codes(score)
+        self.version += 1
+        self.dirty.add(name)
+
+    def set_emotion(self, name: str, emotion: str):
+        self.emotions[self.rows[name]] = _EMOTION_CODES[emotion]
+        self.version += 1
+        self.dirty.add(name)
+
+    def set_mentions(self, name: str, mentions: int):
+        self.mentions[self.rows[name]] = mentions
+        self.version += 1
+        self.dirty.add(name)
+
+    def adjust_scores(self, names: Iterable[str], deltas) -> None:
+        """💞 Nudge several relationships at once, and update those characters' emotions"""
+        names = list(names)
+        rows = self._rows_of(names)
+        if not len(rows):
+            return
+        np.add.at(self.scores, rows, np.broadcast_to(np.asarray(deltas, dtype=np.int32), rows.shape))
+        self.emotions[rows] = emotion_codes(self.scores[rows])
+        self.version += 1
+        self.dirty.update(names)
+
+    def add_mentions(self, names: Iterable[str]):
+        """📣 Count one more mention for each of these characters"""
+        names = list(names)
+        rows = self._rows_of(names)
+        if len(rows):
+            np.add.at(self.mentions, rows, 1)
+            self.version += 1
+            self.dirty.update(names)
+
+    # 🌍 Whole-world operations - one array op each
+    def decay(self, factor: float):
+        """🌫️ Let every relationship drift back toward neutral (scores shrink toward zero)"""
+        size = len(self.names)
+        decayed = np.trunc(self.scores[:size] * factor).astype(np.int32)
+        feelings = emotion_codes(decayed)
+        changed = np.flatnonzero((decayed != self.scores[:size]) | (feelings != self.emotions[:size]))
+        self.scores[:size] = decayed
+        self.emotions[:size] = feelings
+        self.version += 1
+        self.dirty.update(self.names[row] for row in changed.tolist())  # Neutral characters stay clean
+
+    def top(self, n: int, column: str = "relationship_score", lowest: bool = False) -> List[str]:
+        """🏆 The n characters with the highest (or lowest) score or mention count"""
+        size = len(self.names)
+        n = min(n, size)
+        if n <= 0:
+            return []
+        values = (self.scores if column == "relationship_score" else self.mentions)[:size]
+        keys = values if lowest else -values.astype(np.int64)
+        best = np.argpartition(keys, n - 1)[:n] if n < size else np.arange(size)
+        best = best[np.argsort(keys[best], kind='stable')]
+        return [self.names[row] for row in best]
+
+    def columns_for(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Scores and emotions for many characters at once (everyone, by default)"""
+        if names is None:
+            names, rows = self.names, np.arange(len(self.names))
+        else:
+            names = [name for name in names if name in self.rows]
+            rows = self._rows_of(names)
+        scores = self.scores[rows].tolist()
+        emotions = [EMOTIONS[code] for code in self.emotions[rows].tolist()]
+        return {name: {"score": score, "emotion": emotion} for name, score, emotion in zip(names, scores, emotions)}
+
+
+class NPCRecord(MutableMapping):
+    """🎭 One NPC's details, looking just like the old dict - the numbers live in the table"""
+
+    __slots__ = ("table", "name", "details")
+
+    def __init__(self, table: NPCTable, name: str, details: Dict[str, Any]):
+        self.table = table
+        self.name = name
+        self.details = details  # Everything that isn't a column: occupation, last words, ...
+
+    @classmethod
+    def adopt(cls, table: NPCTable, name: str, state: Dict[str, Any]) -> 'NPCRecord':
+        """Move a plain dict's numbers into the table and wrap what's left"""
+        table.add(
+            name,
+            score=int(state.get("relationship_score", 0)),
+            mentions=int(state.get("times_mentioned", 0)),
+            emotion=state.get("emotional_state")
+        )
+        return cls(table, name, {key: value for key, value in state.items() if key not in COLUMNS})
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "relationship_score":
+            return self.table.score(self.name)
+        if key == "emotional_state":
+            return self.table.emotion(self.name)
+        if key == "times_mentioned":
+            return self.table.mention_count(self.name)
+        return self.details[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if key == "relationship_score":
+            self.table.set_score(self.name, value)
+        elif key == "emotional_state":
+            self.table.set_emotion(self.name, value)
+        elif key == "times_mentioned":
+            self.table.set_mentions(self.name, value)
+        else:
+            self.details[key] = value
+            self.table.version += 1
+            self.table.dirty.add(self.name)
+
+    def __delitem__(self, key: str):
+        if key in COLUMNS:
+            raise KeyError(f"{key} always exists for an NPC")
+        del self.details[key]
+        self.table.version += 1
+        self.table.dirty.add(self.name)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.details
+        yield from COLUMNS
+
+    def __len__(self) -> int:
+        return len(self.details) + len(COLUMNS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """A plain dict copy, ready for saving"""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"NPCRecord({self.to_dict()!r})"
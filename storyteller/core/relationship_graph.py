@@ -0,0 +1,137 @@
+# storyteller/core/relationship_graph.py
+"""
+🕸️ The Web of Relationships - Who Did What to Whom, Always at Hand!
+
+Every time someone gives, tells, attacks or helps someone else, a new thread
+gets woven into this web. Threads remember what kind of deed it was, how many
+times it happened and in which turns, so when Marcus walks into the scene we
+can instantly ask "what do we know about Marcus?" by looking only at his own
+threads - no digging through every fact we've ever stored!
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+
+# Let's see if our relationship-weaving tool is around!
+try:
+    import networkx as nx
+    HAS_NETWORKX = True
+except ImportError:
+    HAS_NETWORKX = False
+    print("📝 Note: Relationship web disabled (install networkx to track who did what to whom!)")
+
+
+@dataclass
+class Relationship:
+    """🧵 One thread in the web: who did what to whom, and how often"""
+
+    subject: str
+    relation: str                     # gave / told / attacked / helped
+    obj: str
+    weight: int = 1                   # How many times it happened
+    turns: List[int] = field(default_factory=list)  # The turns it happened in
+
+    def describe(self) -> str:
+        times = f" ({self.weight} times)" if self.weight > 1 else ""
+        return f"{self.subject} {self.relation} {self.obj}{times}"
+
+
+class RelationshipGraph:
+    """🕸️ A directed multigraph of entities with typed, weighted edges, grown one turn at a time"""
+
+    def __init__(self):
+        self.enabled = HAS_NETWORKX
+        self.graph = nx.MultiDiGraph() if HAS_NETWORKX else None
+
+    @staticmethod
+    def node_key(entity: str) -> str:
+        """The name we file an entity under (so "Marcus" and "marcus" are the same person)"""
+        return entity.strip().lower()
+
+    def add_relation(self, subject: str, relation: str, obj: str, turn_id: int):
+        """🧵 Weave one deed into the web (or thicken the thread if it happened before)"""
+        if not self.enabled:
+            return
+        source, target = self.node_key(subject), self.node_key(obj)
+        if not source or not target:
+            return
+        for key, label in ((source, subject), (target, obj)):
+            if key not in self.graph:
+                self.graph.add_node(key, label=label.strip())
+
+        if self.graph.has_edge(source, target, key=relation):
+            data = self.graph[source][target][relation]
+            data['weight'] += 1
+            if data['turns'][-1] != turn_id:
+                data['turns'].append(turn_id)
+        else:
+            self.graph.add_edge(source, target, key=relation, weight=1, turns=[turn_id])
+
+    def add_relations(self, relations: Iterable[Tuple[str, str, str]], turn_id: int):
+        """Weave every (who, did what, to whom) from one turn"""
+        for subject, relation, obj in relations:
+            self.add_relation(subject, relation, obj, turn_id)
+
+    def _relationship(self, source: str, target: str, relation: str, data: Dict[str, Any]) -> Relationship:
+        nodes = self.graph.nodes
+        return Relationship(
+            nodes[source]['label'], relation, nodes[target]['label'],
+            data['weight'], list(data['turns'])
+        )
+
+    def neighbours(self, entity: str, relation: Optional[str] = None) -> List[Relationship]:
+        """🔍 Every thread touching this entity, both ways - only its own edges are looked at"""
+        key = self.node_key(entity)
+        if not self.enabled or key not in self.graph:
+            return []
+        found = []
+        for source, target, kind, data in self.graph.out_edges(key, keys=True, data=True):
+            if relation is None or kind == relation:
+                found.append(self._relationship(source, target, kind, data))
+        for source, target, kind, data in self.graph.in_edges(key, keys=True, data=True):
+            if source != target and (relation is None or kind == relation):
+                found.append(self._relationship(source, target, kind, data))
+        return found
+
+    def relations_around(self, entities: Iterable[str], limit: Optional[int] = None) -> List[Relationship]:
+        """🎭 The strongest (then most recent) threads around everyone in the scene"""
+        seen, found = set(), []
+        for entity in entities:
+            for relationship in self.neighbours(entity):
+                edge = (self.node_key(relationship.subject), relationship.relation, self.node_key(relationship.obj))
+                if edge not in seen:
+                    seen.add(edge)
+                    found.append(relationship)
+        found.sort(key=lambda relationship: (relationship.weight, relationship.turns[-1]), reverse=True)
+        return found[:limit] if limit is not None else found
+
+    def to_dict(self) -> Dict[str, Any]:
+        """📦 Compact adjacency: a node list plus [source, target, relation, weight, turns] rows"""
+        if not self.enabled:
+            return {'nodes': [], 'edges': []}
+        index = {key: i for i, key in enumerate(self.graph.nodes)}
+        return {
+            'nodes': [self.graph.nodes[key]['label'] for key in self.graph.nodes],
+            'edges': [
+                [index[source], index[target], relation, data['weight'], data['turns']]
+                for source, target, relation, data in self.graph.edges(keys=True, data=True)
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RelationshipGraph':
+        web = cls()
+        if not web.enabled:
+            return web
+        keys = []
+        for label in data.get('nodes', []):
+            key = cls.node_key(label)
+            web.graph.add_node(key, label=label)
+            keys.append(key)
+        for source, target, relation, weight, turns in data.get('edges', []):
+            web.graph.add_edge(keys[source], keys[target], key=relation, weight=weight, turns=list(turns))
+        return web
+
+    def __len__(self) -> int:
+        """How many distinct threads (entity pair + kind of deed) we know about"""
+        return self.graph.number_of_edges() if self.enabled else 0
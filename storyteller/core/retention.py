@@ -0,0 +1,193 @@
+# storyteller/core/retention.py
+"""
+🧳 The Memory Packing Assistant - Deciding What Stays Close at Hand!
+
+We can't keep every single moment of a marathon adventure in RAM, but we also
+don't want to forget the big plot twists just because they happened a while ago.
+This assistant keeps the most recent turns plus the most important older ones
+ready to go, and neatly packs everything else away into a compressed cold store.
+If a search needs a packed-away memory again, out it comes!
+"""
+
+import base64
+import json
+import os
+import zlib
+from dataclasses import asdict
+from typing import Dict, List, Optional, Callable, Any, Tuple, Union
+
+from ..config import (MEMORY_RAM_BUDGET_BYTES, RECENT_TURNS_RESIDENT, RETRIEVAL_HIT_SALIENCE,
+                      COLD_LOG_COMPACT_BYTES)
+
+
+class RetentionManager:
+    """🧳 Keeps a RAM budget: recent tail + most salient older turns stay resident!
+
+    Packed-away turns live in the cold log on disk - RAM only holds where each
+    one is. Without a cold path (handy for tests) they're kept packed in RAM.
+    """
+
+    def __init__(self, cold_path: Optional[str] = None,
+                 budget_bytes: int = MEMORY_RAM_BUDGET_BYTES,
+                 recent_turns: int = RECENT_TURNS_RESIDENT,
+                 compact_bytes: int = COLD_LOG_COMPACT_BYTES):
+        self.cold_path = cold_path       # Log of packed-away turns (tidied up now and then)
+        self.budget_bytes = budget_bytes
+        self.recent_turns = recent_turns
+        self.compact_bytes = compact_bytes  # Dead log bytes we tolerate before tidying up
+        # turn id -> (offset, length) of its line in the cold log, or the packed bytes without a log
+        self.cold: Dict[int, Union[Tuple[int, int], bytes]] = {}
+        self.resident_bytes = 0
+        self.demotions = 0
+        self.promotions = 0
+        self.compactions = 0
+        self._live_bytes = 0             # Log bytes still pointed at by `cold`
+        self._dead_bytes = 0             # Log bytes for turns that came back (or were packed again)
+        self._load_cold_log()
+
+    def _load_cold_log(self):
+        """Find out what's in cold storage and where (later lines win)"""
+        if not self.cold_path or not os.path.exists(self.cold_path):
+            return
+        try:
+            offset = 0
+            with open(self.cold_path, 'rb') as f:
+                for line in f:
+                    turn_id, _, blob = line.strip().partition(b"\t")
+                    if blob:
+                        self._forget(int(turn_id))
+                        self.cold[int(turn_id)] = (offset, len(line))
+                        self._live_bytes += len(line)
+                    else:
+                        self._dead_bytes += len(line)
+                    offset += len(line)
+        except Exception as e:
+            print(f"⚠️ Couldn't read the cold memory store (older memories may be missing): {e}")
+
+    def _forget(self, turn_id: int):
+        """Take a turn out of cold storage - its log line becomes dead"""
+        location = self.cold.pop(turn_id, None)
+        if location is not None and not isinstance(location, bytes):
+            self._live_bytes -= location[1]
+            self._dead_bytes += location[1]
+
+    def _drop(self, turn_id: int) -> Optional[bytes]:
+        """Take a turn out of cold storage and hand back its packed bytes"""
+        location = self.cold.get(turn_id)
+        blob = location if location is None or isinstance(location, bytes) else self._read(location)
+        self._forget(turn_id)
+        return blob
+
+    def _read(self, location: Tuple[int, int]) -> Optional[bytes]:
+        try:
+            with open(self.cold_path, 'rb') as f:
+                f.seek(location[0])
+                line = f.read(location[1])
+            return base64.b64decode(line.strip().partition(b"\t")[2])
+        except Exception as e:
+            print(f"⚠️ Couldn't read a packed-away memory: {e}")
+            return None
+
+    def _store(self, turn_id: int, blob: bytes):
+        """Write a packed turn to the end of the cold log (or keep it in RAM if there's no log)"""
+        self._forget(turn_id)
+        if not self.cold_path:
+            self.cold[turn_id] = blob
+            return
+        line = f"{turn_id}\t{base64.b64encode(blob).decode()}\n".encode()
+        try:
+            with open(self.cold_path, 'ab') as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(line)
+            self.cold[turn_id] = (offset, len(line))
+            self._live_bytes += len(line)
+        except Exception as e:
+            print(f"⚠️ Couldn't write to the cold memory store (still packed in RAM): {e}")
+            self.cold[turn_id] = blob
+
+    def compact(self):
+        """🧹 Rewrite the cold log with only the turns still in it"""
+        if not self.cold_path or not os.path.exists(self.cold_path):
+            return
+        temp_path = self.cold_path + ".tmp"
+        try:
+            moved, offset = {}, 0
+            with open(self.cold_path, 'rb') as old, open(temp_path, 'wb') as new:
+                on_disk = [(turn_id, location) for turn_id, location in self.cold.items()
+                           if not isinstance(location, bytes)]
+                for turn_id, location in sorted(on_disk, key=lambda item: item[1][0]):
+                    old.seek(location[0])
+                    line = old.read(location[1])
+                    new.write(line)
+                    moved[turn_id] = (offset, len(line))
+                    offset += len(line)
+            os.replace(temp_path, self.cold_path)
+            self.cold.update(moved)
+            self._live_bytes, self._dead_bytes = offset, 0
+            self.compactions += 1
+        except Exception as e:
+            print(f"⚠️ Couldn't tidy up the cold memory store (it still works, just bigger): {e}")
+
+    def _maybe_compact(self):
+        if self._dead_bytes > max(self.compact_bytes, self._live_bytes):
+            self.compact()
+
+    @staticmethod
+    def estimate_size(entry) -> int:
+        """Roughly how many bytes this memory takes up while it's resident"""
+        text_bytes = len(entry.player_action) + len(entry.dm_response) + len(entry.timestamp)
+        fact_bytes = sum(len(fact) + 56 for fact in entry.extracted_facts)
+        return text_bytes + fact_bytes + 200  # plus the object itself
+
+    @staticmethod
+    def salience(entry) -> float:
+        """How much an older memory deserves to stay close at hand"""
+        return entry.importance_score + RETRIEVAL_HIT_SALIENCE * entry.retrieval_hits
+
+    def demote(self, entry):
+        """📦 Pack a memory away into the compressed cold store"""
+        self._store(entry.turn_id, zlib.compress(json.dumps(asdict(entry)).encode()))
+        self.demotions += 1
+
+    def promote(self, turn_id: int, factory: Callable[..., Any]):
+        """📤 Unpack a cold memory so it's resident again (None if we don't have it)"""
+        blob = self._drop(turn_id)
+        if blob is None:
+            return None
+        self.promotions += 1
+        self._maybe_compact()
+        return factory(**json.loads(zlib.decompress(blob)))
+
+    def peek(self, turn_id: int, factory: Callable[..., Any]):
+        """Read a cold memory without moving it back into RAM"""
+        location = self.cold.get(turn_id)
+        if location is None:
+            return None
+        blob = location if isinstance(location, bytes) else self._read(location)
+        return factory(**json.loads(zlib.decompress(blob))) if blob is not None else None
+
+    def enforce(self, history: List) -> List:
+        """⚖️ Fit the resident memories into our budget, packing away the least salient"""
+        tail = history[-self.recent_turns:] if self.recent_turns else []
+        older = history[:len(history) - len(tail)]
+        used = sum(self.estimate_size(entry) for entry in tail)
+
+        kept = []
+        for entry in sorted(older, key=self.salience, reverse=True):
+            size = self.estimate_size(entry)
+            if used + size <= self.budget_bytes:
+                kept.append(entry)
+                used += size
+            else:
+                self.demote(entry)
+
+        self.resident_bytes = used
+        self._maybe_compact()
+        kept.sort(key=lambda entry: entry.turn_id)
+        return kept + tail
+
+    def forget_resident(self, turn_ids):
+        """Drop cold copies of turns that are resident anyway (e.g. after a restart)"""
+        for turn_id in turn_ids:
+            self._forget(turn_id)
+        self._maybe_compact()
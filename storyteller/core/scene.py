@@ -0,0 +1,228 @@
+# storyteller/core/scene.py
+"""
+🎬 The Stage Manager - Who Just Walked In, Who's Still Here, Who Left?
+
+Rather than forgetting the whole scene every time someone speaks and rebuilding
+it from scratch, the stage manager reads the text once, looks at the words
+right before and right after every character's name ("Marcus *approaches*",
+"*you see* Elena", "Thorin *leaves*", "talking *about* Marcus") and reports
+what changed: arrivals, characters still around, departures and characters
+who were only talked about.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from ..utils.text import TextAnalysis
+from .name_matcher import NameMatcher, NameMention
+
+ARRIVAL, PRESENCE, DEPARTURE, REFERENCE = "arrival", "presence", "departure", "reference"
+
+# When one name gets several cues in the same sentence, the strongest one wins
+_STRENGTH = {REFERENCE: 0, PRESENCE: 1, ARRIVAL: 2, DEPARTURE: 3}
+
+_SENTENCE_MARKS = frozenset(".!?…")
+
+_END = ""
+
+
+def _verb(base: str) -> Tuple[str, str]:
+    """Both "approach" and "approaches" (and "walk"/"walks", "reply"/"replies")"""
+    if base.endswith("y") and base[-2] not in "aeiou":
+        return base, base[:-1] + "ies"
+    return base, base + ("es" if base.endswith(("s", "sh", "ch", "x", "z", "o")) else "s")
+
+
+def _phrases(verbs: Iterable[str], *followers: Tuple[str, ...]) -> List[str]:
+    """Every verb form, optionally followed by any of the given words"""
+    forms = [form for verb in verbs for form in _verb(verb)]
+    if not followers:
+        return forms
+    return [f"{form} {follower}" for form in forms for group in followers for follower in group]
+
+
+# Words right AFTER a name ("Marcus approaches", "Elena walks away")
+_AFTER_NAME = {
+    ARRIVAL: (
+        _phrases(["approach", "enter", "arrive", "appear", "emerge"])
+        + _phrases(["walk"], ("up", "over", "toward"))
+        + _phrases(["come"], ("forward", "closer", "over"))
+        + _phrases(["step"], ("forward", "out"))
+    ),
+    PRESENCE: (
+        _phrases(["stand", "sit", "wait", "remain", "stay"], ("nearby", "here", "there", "close"))
+        + [f"{verb} {state}" for verb in ("is", "was")
+           for state in ("standing", "sitting", "waiting", "here", "there", "nearby")]
+        + _phrases(["say", "tell", "ask", "respond", "reply", "whisper", "shout", "call"])
+        + _phrases(["nod", "smile", "frown", "laugh", "sigh", "gesture"])
+        + _phrases(["give", "hand", "offer", "show", "present"])
+        + _phrases(["take", "grab", "pick", "accept", "receive"])
+        + _phrases(["look", "stare", "glance", "gaze"], ("at", "toward"))
+        + _phrases(["point", "wave", "beckon"])
+        + _phrases(["move", "shift", "turn", "lean", "step"])
+        + _phrases(["follow", "lead", "accompany"])
+    ),
+    DEPARTURE: (
+        _phrases(["leave", "depart", "disappear", "exit", "retreat", "flee", "vanish"])
+        + _phrases(["go", "walk", "run"], ("away",))
+        + ["is gone", "has left"]
+    ),
+}
+
+# Words right BEFORE a name ("you see Elena", "talking about Marcus")
+_BEFORE_NAME = {
+    PRESENCE: (
+        [f"you {verb}" for verb in ("see", "notice", "spot", "observe", "watch")]
+        + [f"there {verb}" for verb in ("is", "stands", "sits")]
+        + [f"{verb} {prep}" for verb in ("talk", "speak", "chat", "converse") for prep in ("to", "with")]
+        + ["with", "alongside", "beside"]
+    ),
+    REFERENCE: ["about", "regarding", "concerning"],
+}
+
+
+def _build_trie(phrases_by_kind: Dict[str, List[str]], reverse: bool = False) -> Dict[str, dict]:
+    trie: Dict[str, dict] = {}
+    for kind, phrases in phrases_by_kind.items():
+        for phrase in phrases:
+            words = phrase.split()
+            node = trie
+            for word in (reversed(words) if reverse else words):
+                node = node.setdefault(word, {})
+            node[_END] = kind
+    return trie
+
+
+def _longest_match(trie: Dict[str, dict], folded: List[str], start: int, step: int) -> Optional[str]:
+    """Follow the trie from `start` (forwards or backwards) and return the longest phrase's kind"""
+    node, found, i = trie, None, start
+    while 0 <= i < len(folded):
+        node = node.get(folded[i])
+        if node is None:
+            break
+        found = node.get(_END, found)
+        i += step
+    return found
+
+
+def sentence_numbers(folded: List[str]) -> List[int]:
+    """Which sentence each token belongs to (the closing mark still counts as part of its sentence)"""
+    numbers, sentence = [], 0
+    for token in folded:
+        numbers.append(sentence)
+        if token in _SENTENCE_MARKS:
+            sentence += 1
+    return numbers
+
+
+def quoted_tokens(folded: List[str], in_quote: bool = False) -> List[bool]:
+    """Which tokens sit inside quoted dialogue (start `in_quote` if the text opens mid-quote)"""
+    quoted = []
+    for token in folded:
+        if token == '"':
+            in_quote = not in_quote
+        elif token in ('“', '”'):
+            in_quote = token == '“'
+        quoted.append(in_quote)
+    return quoted
+
+
+@dataclass(frozen=True)
+class SceneEvent:
+    """🎬 One cue about one character"""
+
+    name: str
+    kind: str      # arrival / presence / departure / reference
+    start: int     # Where the name was in the text
+    end: int
+    cued: bool = True  # False when nothing around the name said what they did (we guessed "here")
+    sentence: int = 0  # Which sentence of the text it was in
+
+
+@dataclass
+class SceneDelta:
+    """📋 What changed in the scene, character by character"""
+
+    arrived: Set[str] = field(default_factory=set)
+    present: Set[str] = field(default_factory=set)     # Here, but we already knew (or didn't say how they came)
+    departed: Set[str] = field(default_factory=set)
+    referenced: Set[str] = field(default_factory=set)  # Only talked about - doesn't change who's here
+    events: List[SceneEvent] = field(default_factory=list)
+
+    @classmethod
+    def from_events(cls, events: List[SceneEvent]) -> 'SceneDelta':
+        """Sort cues into arrivals, presences, departures and references
+
+        The story moves on, so a character's last real cue wins ("Marcus leaves.
+        Later, Marcus approaches." - he's back), and someone who arrived and then
+        spoke still counts as an arrival. Cues in the same sentence are read
+        weakest first, so the strongest one has the last word. Guesses and
+        references never undo a real cue - they only count for names nothing
+        else was said about.
+        """
+        delta = cls(events=list(events))
+        latest: Dict[str, str] = {}
+        guessed: Dict[str, str] = {}
+        positional = []
+        for event in delta.events:
+            if event.cued and event.kind != REFERENCE:
+                positional.append(event)
+            elif _STRENGTH[event.kind] >= _STRENGTH.get(guessed.get(event.name), -1):
+                guessed[event.name] = event.kind
+        for event in sorted(positional, key=lambda event: (event.sentence, _STRENGTH[event.kind])):
+            still_arriving = event.kind == PRESENCE and latest.get(event.name) == ARRIVAL
+            latest[event.name] = ARRIVAL if still_arriving else event.kind
+        for name, kind in guessed.items():
+            latest.setdefault(name, kind)
+        for name, kind in latest.items():
+            {ARRIVAL: delta.arrived, PRESENCE: delta.present,
+             DEPARTURE: delta.departed, REFERENCE: delta.referenced}[kind].add(name)
+        return delta
+
+    def apply(self, current: Set[str]) -> Set[str]:
+        """Update a set of present characters in place (and hand it back)"""
+        current -= self.departed
+        current |= self.arrived | self.present
+        return current
+
+    def __bool__(self) -> bool:
+        return bool(self.events)
+
+
+class SceneScanner:
+    """🎬 One read of the text, every character's cue classified - no regex pile!"""
+
+    def __init__(self, name_matcher: NameMatcher):
+        self.name_matcher = name_matcher
+        self._after = _build_trie(_AFTER_NAME)
+        self._before = _build_trie(_BEFORE_NAME, reverse=True)
+
+    def scan(self, text: Union[str, TextAnalysis], mentions: Optional[List[NameMention]] = None,
+             in_quote: bool = False) -> SceneDelta:
+        """🔍 Find every known character and work out what the text says about them
+
+        Pass the name matcher's mentions if you already have them for this text,
+        and `in_quote` if the text picks up in the middle of someone's dialogue.
+        """
+        analysis = TextAnalysis.ensure(text)
+        folded = analysis.folded
+        if mentions is None:
+            mentions = self.name_matcher.find(analysis)
+        if not mentions:
+            return SceneDelta()
+
+        quoted = quoted_tokens(folded, in_quote)
+        sentences = sentence_numbers(folded)
+
+        events = []
+        for mention in mentions:
+            after = _longest_match(self._after, folded, mention.last_token + 1, 1)
+            before = _longest_match(self._before, folded, mention.first_token - 1, -1)
+            if quoted[mention.first_token] and not after:
+                kind = REFERENCE  # Just a name dropped in someone's dialogue
+            else:
+                kind = max((after, before), key=lambda cue: _STRENGTH.get(cue, -1)) or PRESENCE
+            cued = bool(after or before)
+            events.append(SceneEvent(mention.name, kind, mention.start, mention.end, cued,
+                                     sentences[mention.first_token]))
+        return SceneDelta.from_events(events)
@@ -0,0 +1,115 @@
+# storyteller/core/tone.py
+"""
+💬 The Tone Reader - Not Just *What* Mood, But *How Much*!
+
+Saying "please" once is polite; "thank you, I'm really sorry, could you please
+help?" is *very* polite. The tone reader adds up every whole tone word in what
+you said (so "hi" hiding inside "this" or "die" inside "soldier" doesn't
+count), weighs each one, gives a boost when an intensifier like "really" comes
+right before it, and turns the result into a graded change in how much an NPC
+likes you. It rides on the shared keyword spotter, so it costs no extra read -
+and a whole transcript can be read in one go.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from ..config import (TONE_KEYWORDS, TONE_KEYWORD_WEIGHTS, TONE_INTENSIFIER_BOOST,
+                      TONE_MAX_STRENGTH)
+from ..utils.keywords import KeywordHit, lexicon_automaton
+from ..utils.text import TextAnalysis
+
+_TONE_PREFIX = "tone:"
+
+
+@dataclass
+class ToneReading:
+    """📏 How one text sounds: a score per tone, the strongest tone, and what it does to a relationship"""
+
+    scores: Dict[str, float] = field(default_factory=dict)  # Tone -> strength, 1.0 = one plain word (only tones we heard)
+    tone: str = "Neutral"                                   # The one that moves the relationship most
+    delta: int = 0                                          # Relationship change for the NPCs it's aimed at
+
+
+class ToneAnalyzer:
+    """💬 Weighted, whole-word tone scores from the shared keyword hits"""
+
+    def __init__(self, tone_effects: Dict[str, int], weights: Optional[Dict[str, float]] = None,
+                 boost: float = TONE_INTENSIFIER_BOOST, max_strength: float = TONE_MAX_STRENGTH):
+        self.tone_effects = tone_effects      # Tone -> relationship change for one plain tone word
+        self.weights = TONE_KEYWORD_WEIGHTS if weights is None else weights
+        self.boost = boost
+        self.max_strength = max_strength
+        # Equal effects go to the tone listed first (scary talk beats rudeness, and so on)
+        self._priority = {tone: rank for rank, tone in enumerate(TONE_KEYWORDS)}
+
+    def read_hits(self, text: str, hits: Iterable[KeywordHit]) -> ToneReading:
+        """Turn one text's keyword hits into a tone reading
+
+        A tone's strongest word counts once - so a lone "kill" or "please" has
+        exactly the tone's usual effect, however heavy the word - and every
+        other word adds its weight on top. An intensifier multiplies the word
+        it comes right before. The tone that moves the relationship most (in
+        the direction it actually moves) is the one we report.
+        """
+        totals: Dict[str, float] = {}      # Tone -> sum of its words' (boosted) weights
+        strongest: Dict[str, Tuple[float, float]] = {}   # Tone -> (weight, boost) of its heaviest word
+        boosted_until = -1  # An intensifier boosts a tone word starting right after it
+        for hit in hits:
+            if not hit.whole_word:
+                continue
+            if hit.category == "intensifier":
+                boosted_until = hit.end
+                continue
+            if not hit.category.startswith(_TONE_PREFIX):
+                continue
+            boost = 1.0
+            if boosted_until >= 0 and not text[boosted_until:hit.start].strip():
+                boost = self.boost
+            weight = self.weights.get(hit.keyword, 1.0) * boost
+            tone = hit.category[len(_TONE_PREFIX):]
+            totals[tone] = totals.get(tone, 0.0) + weight
+            if weight > strongest.get(tone, (0.0, 1.0))[0]:
+                strongest[tone] = (weight, boost)
+
+        if not totals:
+            return ToneReading()
+        # The heaviest word counts as one plain word (boosted if it was), the rest at their weight
+        scores = {name: total - strongest[name][0] + strongest[name][1] for name, total in totals.items()}
+        effects = {
+            name: self.tone_effects.get(name, 0) * min(score, self.max_strength) for name, score in scores.items()
+        }
+        delta = int(round(sum(effects.values())))
+        # Only a tone pulling the same way as the total can name it ("sorry... I'd never kill you" isn't Polite at -5)
+        candidates = [name for name in effects if delta * effects[name] > 0] or list(effects)
+        tone = max(candidates,
+                   key=lambda name: (abs(effects[name]), -self._priority.get(name, len(self._priority))))
+        return ToneReading(scores=scores, tone=tone, delta=delta)
+
+    def read(self, text: Union[str, TextAnalysis]) -> ToneReading:
+        """🎯 How one text sounds (reusing its keyword hits if it's already been read)"""
+        analysis = TextAnalysis.ensure(text)
+        return self.read_hits(analysis.text, analysis.keyword_hits)
+
+    def read_many(self, texts: List[str]) -> List[ToneReading]:
+        """📚 How each of many texts sounds - the whole batch in one pass of the keyword spotter
+
+        Handy for replaying a saved transcript.
+        """
+        if not texts:
+            return []
+        starts, position = [], 0
+        for text in texts:
+            starts.append(position)
+            position += len(text) + 1  # The newline between texts keeps words apart
+        joined = "\n".join(texts)
+
+        grouped: List[List[KeywordHit]] = [[] for _ in texts]
+        for hit in lexicon_automaton.scan(joined):
+            index = bisect_right(starts, hit.start) - 1
+            offset = starts[index]
+            grouped[index].append(
+                KeywordHit(hit.start - offset, hit.end - offset, hit.keyword, hit.category, hit.whole_word)
+            )
+        return [self.read_hits(text, hits) for text, hits in zip(texts, grouped)]
@@ -0,0 +1,89 @@
+# storyteller/core/vector_index.py
+"""
+🧭 The Memory Compass - Finding Similar Moments in a Single Sweep!
+
+This little helper keeps every memory's embedding in one tightly packed matrix.
+Instead of asking the database one question at a time, we can ask several
+questions at once and score them all against every memory with a single
+matrix multiplication - several lookups for roughly the price of one!
+"""
+
+from typing import Collection, List, Dict, Any, Tuple, Optional
+
+import numpy as np
+
+
+class VectorIndex:
+    """🧭 A compact matrix of memory embeddings, searched with one big multiply!"""
+
+    def __init__(self, initial_capacity: int = 64):
+        self._matrix: Optional[np.ndarray] = None  # Rows are unit-length embeddings
+        self._capacity = initial_capacity
+        self._size = 0
+        self.turn_ids: List[int] = []               # Which turn each row belongs to
+        self._rows: Dict[int, int] = {}             # And which row each turn lives in
+        self.documents: Dict[int, str] = {}         # The text we show for each turn
+        self.metadata: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """Scale vectors to unit length so a dot product is a cosine similarity"""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def add(self, turn_id: int, vector, document: str, metadata: Dict[str, Any] = None):
+        """📌 Pin a new memory onto our compass!"""
+        vector = self._normalize(np.asarray(vector, dtype=np.float32).reshape(1, -1))[0]
+
+        if self._matrix is None:
+            self._matrix = np.zeros((self._capacity, vector.shape[0]), dtype=np.float32)
+        elif self._size == self._matrix.shape[0]:
+            # Double the room so adding memories stays cheap on average
+            grown = np.zeros((self._matrix.shape[0] * 2, self._matrix.shape[1]), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+
+        self._matrix[self._size] = vector
+        self._size += 1
+        self.turn_ids.append(turn_id)
+        self._rows[turn_id] = self._size - 1
+        self.documents[turn_id] = document
+        self.metadata[turn_id] = metadata or {}
+
+    def search(self, query_vectors, top_k: int, allowed: Optional[Collection[int]] = None) -> List[Tuple[int, float]]:
+        """🔍 Score every query against every memory at once and merge the results!
+
+        Each memory keeps its best score across all the queries, so a memory
+        that matches any one of the entities in the question can still win.
+        If `allowed` is given (a set of turn ids), only those rows get scored at all.
+        Returns (turn_id, score) pairs, best first.
+        """
+        if self._size == 0 or top_k <= 0:
+            return []
+
+        if allowed is None:
+            rows = None
+            candidates = self._matrix[:self._size]
+        else:
+            rows = np.fromiter(
+                (self._rows[turn_id] for turn_id in allowed if turn_id in self._rows),
+                dtype=np.int64
+            )
+            if rows.size == 0:
+                return []
+            candidates = self._matrix[rows]
+
+        queries = self._normalize(np.atleast_2d(np.asarray(query_vectors, dtype=np.float32)))
+        scores = queries @ candidates.T  # (queries x memories) in one go
+        merged = scores.max(axis=0)
+
+        top_k = min(top_k, merged.shape[0])
+        best = np.argpartition(-merged, top_k - 1)[:top_k]
+        best = best[np.argsort(-merged[best])]
+        if rows is not None:
+            return [(self.turn_ids[rows[i]], float(merged[i])) for i in best]
+        return [(self.turn_ids[row], float(merged[row])) for row in best]
@@ -35,6 +35,7 @@ class StorytellerGUI(ctk.CTk):
             "- Chat with fascinating characters, explore mysterious places, engage in epic battles\n"
             "- Make important decisions that will determine your hero's fate\n"
             "- At the start of each quest, you'll see beautiful pixel art that sets the scene\n"
+            "- Finished a quest? Type 'next quest' to move on to the next one\n"
             "- When dragons appear, you'll see incredible fire-breathing pixel art!\n"
             "- Your AI Dungeon Master will guide you, but YOU control your own epic story\n"
             "- Most importantly: Have fun and let your imagination run wild!\n"
@@ -269,9 +270,8 @@ class StorytellerGUI(ctk.CTk):
         self.show_status("Starting adventure...")
         def start_thread():
             try:
-                quests = self.engine.get_plot()
-                first_quest = quests[0]
-                self.display_quest_name(first_quest)
+                quests = {quest["number"]: quest for quest in self.engine.get_plot()}
+                self.display_quest_name(quests[self.engine.current_quest])
                 intro = self.engine.start_adventure()
                 self.ui_queue.put(("dm_response", intro))
                 self.ui_queue.put(("adventure_started", True))
@@ -300,6 +300,14 @@ class StorytellerGUI(ctk.CTk):
             return
         
         self.entry.delete(0, "end")
+        if message.lower() == "next quest":
+            upcoming = self.engine.advance_quest()
+            if upcoming:
+                self.display_quest_name(upcoming)
+            else:
+                self.display_message("🏆 That was the final quest - your legend is complete!\n\n", "dm")
+            return
+        
         self.send_button.configure(state="disabled")
         self.show_status("DM is thinking...")
         
@@ -309,8 +317,11 @@ class StorytellerGUI(ctk.CTk):
         
         def process_thread():
             try:
-                response = self.engine.process_player_action(message)
-                self.ui_queue.put(("dm_response", response))
+                # Show the DM's words as they're written, piece by piece
+                self.ui_queue.put(("dm_stream_start", None))
+                for piece in self.engine.process_player_action_stream(message):
+                    self.ui_queue.put(("dm_chunk", piece))
+                self.ui_queue.put(("dm_stream_end", None))
                 self.ui_queue.put(("update_npcs", None))
             except Exception as e:
                 self.ui_queue.put(("error", f"Error: {e}"))
@@ -359,6 +370,14 @@ class StorytellerGUI(ctk.CTk):
                     dm_prefix = "🟢 DM: "  # Green circle to indicate DM
                     self.display_message(f"{dm_prefix}{content}\n\n", "dm")
                     self.hide_status()
+                elif message_type == "dm_stream_start":
+                    self.display_message("🟢 DM: ", "dm")
+                elif message_type == "dm_chunk":
+                    self.display_message(content, "dm")
+                    self.show_status("DM is telling the story...")
+                elif message_type == "dm_stream_end":
+                    self.display_message("\n\n", "dm")
+                    self.hide_status()
                 elif message_type == "adventure_started":
                     self.adventure_started = True
                     self.start_btn.configure(text="Adventure in Progress", state="disabled")
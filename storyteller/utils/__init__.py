@@ -7,6 +7,21 @@ work smoothly behind the scenes. Think of it as the toolshed that keeps
 your storytelling machine running perfectly!
 """
 
-from .llm import LLMClient
+from .llm import (LLMClient, TextStream, StreamResult, AsyncLLMClient, AsyncTextStream, get_async_llm_client,
+                  close_async_llm_client)
+from .keywords import KeywordAutomaton, KeywordHit, lexicon_automaton
+from .text import TextAnalysis
 
-__all__ = ['LLMClient']  # Your amazing AI communication friend!
\ No newline at end of file
+__all__ = [
+    'LLMClient',          # Your amazing AI communication friend!
+    'TextStream',         # ...and its replies, word by word
+    'StreamResult',
+    'AsyncLLMClient',     # Many adventures at once over one connection pool
+    'AsyncTextStream',
+    'get_async_llm_client',
+    'close_async_llm_client',
+    'KeywordAutomaton',   # Spots every special word in one read
+    'KeywordHit',
+    'lexicon_automaton',
+    'TextAnalysis'        # One shared read of a piece of text
+]
\ No newline at end of file
@@ -0,0 +1,126 @@
+# storyteller/utils/keywords.py
+"""
+🔑 The Keyword Spotter - Every Special Word, Found in One Read!
+
+Lots of parts of our storyteller look for special words: epic keywords that
+make a moment important, polite or threatening words that change how NPCs feel,
+loot and places worth remembering. Instead of each of them searching the text
+again and again, this spotter builds one Aho-Corasick automaton from every
+word list and reads the text a single time, reporting each hit with its category.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set, Tuple
+
+from ..config import IMPORTANCE_KEYWORDS, TONE_KEYWORDS, TONE_INTENSIFIERS, LOOT_WORDS, PLACE_WORDS
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """✨ One special word we spotted, where we spotted it, and what kind it is"""
+
+    start: int          # Where the word starts in the text
+    end: int            # Where it ends (exclusive)
+    keyword: str        # The word itself (lowercase)
+    category: str       # e.g. "importance", "tone:Polite", "loot", "place", "intensifier"
+    whole_word: bool    # False when it's hiding inside a longer word ("hi" in "this")
+
+
+class KeywordAutomaton:
+    """🔑 An Aho-Corasick automaton over every configured lexicon at once!"""
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str]]] = [[]]  # state -> (keyword, category) pairs ending here
+
+        for category, words in lexicons.items():
+            for word in words:
+                self._insert(word.lower(), category)
+
+        self._alphabet = frozenset(ch for state in self._goto for ch in state)
+        self._build_failure_links()
+
+    def _insert(self, word: str, category: str):
+        state = 0
+        for ch in word:
+            if ch not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = len(self._goto) - 1
+            state = self._goto[state][ch]
+        if (word, category) not in self._output[state]:
+            self._output[state].append((word, category))
+
+    def _build_failure_links(self):
+        """Breadth-first: each state learns where to fall back when the next letter doesn't fit"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                if state:
+                    fallback = self._fail[state]
+                    while fallback and ch not in self._goto[fallback]:
+                        fallback = self._fail[fallback]
+                    self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._output[child].extend(
+                    pair for pair in self._output[self._fail[child]] if pair not in self._output[child]
+                )
+
+    def scan(self, text: str) -> List[KeywordHit]:
+        """🔍 Read the text once and report every keyword hit (case doesn't matter)"""
+        folded = text.lower()
+        goto, fail, output, alphabet = self._goto, self._fail, self._output, self._alphabet
+        hits = []
+        state = 0
+
+        for i, ch in enumerate(folded):
+            if ch not in alphabet:
+                state = 0  # No keyword contains this character, so start afresh
+                continue
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for keyword, category in output[state]:
+                start = i - len(keyword) + 1
+                whole_word = (
+                    (start == 0 or not _is_word_char(folded[start - 1]))
+                    and (i + 1 == len(folded) or not _is_word_char(folded[i + 1]))
+                )
+                hits.append(KeywordHit(start, i + 1, keyword, category, whole_word))
+
+        return hits
+
+    @staticmethod
+    def by_category(hits: Iterable[KeywordHit], whole_words_only: bool = False) -> Dict[str, Set[str]]:
+        """Group hits into category -> distinct keywords"""
+        grouped: Dict[str, Set[str]] = {}
+        for hit in hits:
+            if whole_words_only and not hit.whole_word:
+                continue
+            grouped.setdefault(hit.category, set()).add(hit.keyword)
+        return grouped
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+def _configured_lexicons() -> Dict[str, List[str]]:
+    lexicons = {
+        'importance': IMPORTANCE_KEYWORDS,
+        'loot': LOOT_WORDS,
+        'place': PLACE_WORDS,
+        'intensifier': TONE_INTENSIFIERS,
+    }
+    for tone, words in TONE_KEYWORDS.items():
+        lexicons[f"tone:{tone}"] = words
+    return lexicons
+
+
+# 🔑 One shared spotter built from every configured word list - ready for every turn!
+lexicon_automaton = KeywordAutomaton(_configured_lexicons())
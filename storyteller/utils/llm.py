@@ -5,17 +5,29 @@
 This is the bridge between our storytelling system and the incredibly smart AI
 that generates all the amazing stories, characters, and plot twists. Think of
 it as a translator that helps us have amazing conversations with our AI buddy!
+
+Running lots of adventures at once? The async client shares one pool of warm
+connections between all of them, so many stories can be told side by side from
+a single event loop - no extra thread per request.
 """
 
+import asyncio
+import inspect
 import json
+import time
+import weakref
 import httpx
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import (List, Dict, Any, Optional, Callable, Iterable, Iterator, Generator, AsyncGenerator,
+                    AsyncIterable, AsyncIterator, Awaitable)
 
-from ..config import LLM_MODEL, GROQ_API_KEY
+from ..config import (LLM_MODEL, GROQ_API_KEY, LLM_TIMEOUT_SECONDS, LLM_CONNECT_TIMEOUT_SECONDS, LLM_RETRIES,
+                      LLM_MAX_CONNECTIONS, LLM_MAX_KEEPALIVE_CONNECTIONS, LLM_KEEPALIVE_SECONDS,
+                      LLM_MAX_CONCURRENT_REQUESTS)
 
 # Let's see if we have our AI communication tools ready!
 try:
-    from groq import Groq, DefaultHttpxClient
+    from groq import Groq, AsyncGroq, DefaultHttpxClient, DefaultAsyncHttpxClient
     HAS_GROQ = True
     print("🎉 AI communication tools are ready!")
 except ImportError:
@@ -23,6 +35,251 @@ except ImportError:
     print("📝 Note: Install groq package for AI storytelling features")
 
 
+_USAGE_FIELDS = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+# What we say when the AI can't answer (or has nothing to say)
+_NAP_MESSAGE = "🤖 AI storyteller is taking a nap - please check your connection and API key!"
+_INTRO_FALLBACK = "🏰 Welcome to your amazing adventure! You find yourself at the entrance to a mysterious tavern, with sounds of laughter and adventure calling from within. The wooden sign creaks in the wind, and you can smell fresh bread and hear tales of distant lands. What would you like to do?"
+_STORY_FALLBACK = "🌟 The story continues as you take action, with the world responding to your choices in amazing ways..."
+
+
+def _issue_message(error: Exception) -> str:
+    return f"🤖 AI storyteller encountered an issue: {error}"
+
+
+def _intro_messages(character_info: str) -> List[Dict[str, str]]:
+    """The storyteller's instructions for the very first scene"""
+    prompt = f"""You are the most amazing Dungeon Master ever, starting a brand new adventure! Create an engaging, exciting opening scene for this incredible hero:
+
+{character_info}
+
+Make it immersive, exciting, and full of possibilities! Give the player some really interesting choices to make.
+Just tell the story - no technical stuff, just pure storytelling magic!"""
+    
+    return [{"role": "user", "content": prompt}]
+
+
+def _story_messages(character_info: str, memory_context: str, recent_context: str,
+                    player_action: str, npc_context: str = "") -> List[Dict[str, str]]:
+    """The storyteller's instructions for the next part of the adventure"""
+    npc_section = f"\n\nWHO'S HERE:\n{npc_context}" if npc_context else ""
+    prompt = f"""You are the best Dungeon Master in the world, continuing an amazing ongoing adventure! 
+
+OUR HERO:
+{character_info}{npc_section}
+
+WHAT JUST HAPPENED:
+{recent_context}
+
+IMPORTANT THINGS TO REMEMBER:
+{memory_context}
+
+WHAT THE HERO DOES NOW: {player_action}
+
+Continue this epic story! Remember everything that happened before, make it exciting and consistent, and give our hero some great choices for what to do next.
+
+Just tell the amazing story - pure narrative magic, no technical stuff!"""
+    
+    return [{"role": "user", "content": prompt}]
+
+
+@dataclass
+class StreamResult:
+    """📦 What a streamed reply added up to, once it's finished"""
+    
+    text: str = ""                               # The whole reply (exactly the pieces we handed out)
+    usage: Dict[str, int] = field(default_factory=dict)  # prompt_tokens / completion_tokens / total_tokens
+    finish_reason: Optional[str] = None          # Why the AI stopped ("stop", "length", ...)
+    error: Optional[str] = None                  # What went wrong, if anything did
+    time_to_first_token: Optional[float] = None  # Seconds until the first words showed up
+    total_time: float = 0.0                      # Seconds for the whole reply
+
+
+def _usage_of(chunk: Any) -> Optional[Dict[str, int]]:
+    """Token counts from a stream chunk, if it carries them (Groq tucks them into x_groq on the last one)"""
+    usage = getattr(chunk, "usage", None) or getattr(getattr(chunk, "x_groq", None), "usage", None)
+    if usage is None:
+        return None
+    return {name: getattr(usage, name) for name in _USAGE_FIELDS if getattr(usage, name, None) is not None}
+
+
+class _StreamAssembler:
+    """🧩 Turns the AI's stream chunks into tidy pieces of text and keeps score in a StreamResult"""
+    
+    def __init__(self, result: StreamResult):
+        self.result = result
+        self.pieces: List[str] = []
+        self.held = ""  # Whitespace at the end is held until we know more text follows
+        self.started_at = time.perf_counter()
+    
+    def deliver(self, delta: str) -> Optional[str]:
+        """The next piece to hand out (None if it's only whitespace so far)"""
+        text = self.held + delta
+        body = text.rstrip()
+        self.held = text[len(body):]
+        if not self.pieces:
+            body = body.lstrip()
+        if not body:
+            return None
+        if self.result.time_to_first_token is None:
+            self.result.time_to_first_token = time.perf_counter() - self.started_at
+        self.pieces.append(body)
+        return body
+    
+    def take(self, chunk: Any) -> Optional[str]:
+        """Read one stream chunk: note its usage and finish reason, and hand back its text"""
+        usage = _usage_of(chunk)
+        if usage:
+            self.result.usage = usage
+        if not chunk.choices:
+            return None
+        choice = chunk.choices[0]
+        if choice.finish_reason:
+            self.result.finish_reason = choice.finish_reason
+        return self.deliver(choice.delta.content or "")
+    
+    def fall_back(self, fallback: str) -> Optional[str]:
+        """The stream ended without a word - hand out the fallback instead of nothing"""
+        return self.deliver(fallback) if fallback and not self.pieces else None
+    
+    def fail(self, error: Exception) -> Optional[str]:
+        """The stream broke - say so in the reply, just like generate_text would"""
+        self.result.error = str(error)
+        return self.deliver(("\n\n" if self.pieces else "") + _issue_message(error))
+    
+    def close(self):
+        self.result.text = "".join(self.pieces)
+        self.result.total_time = time.perf_counter() - self.started_at
+
+
+class TextStream:
+    """🌊 A reply arriving piece by piece - loop over it for the new text, then read `result`
+    
+    Leading and trailing whitespace never gets handed out, so the pieces add up
+    to exactly `result.text`. If the AI sends nothing at all, the `fallback`
+    is handed out instead; stop looping early and `close()` hangs up on the AI.
+    """
+    
+    def __init__(self, open_stream: Optional[Callable[[], Iterable[Any]]] = None, text: str = "",
+                 fallback: str = ""):
+        self._open_stream = open_stream  # Starts the AI's stream (None: just hand out `text`)
+        self._text = text
+        self._fallback = fallback
+        self._pieces: Optional[Generator[str, None, None]] = None
+        self.result = StreamResult()
+    
+    def __iter__(self) -> Iterator[str]:
+        if self._pieces is not None:
+            raise RuntimeError("A reply can only be streamed once - use .result.text afterwards")
+        # The pieces don't hold on to us, so a loop that simply stops early still hangs up right away
+        self._pieces = self._stream(self._open_stream, self._text, self._fallback, self.result)
+        return self._pieces
+    
+    def close(self):
+        """👋 Stop streaming: the AI's stream is closed right away"""
+        if self._pieces is not None:
+            self._pieces.close()
+    
+    @staticmethod
+    def _stream(open_stream: Optional[Callable[[], Iterable[Any]]], text: str, fallback: str,
+                result: StreamResult) -> Generator[str, None, None]:
+        assembler = _StreamAssembler(result)
+        chunks = None
+        try:
+            if open_stream is None:
+                piece = assembler.deliver(text)
+                if piece:
+                    yield piece
+                return
+            chunks = open_stream()
+            for chunk in chunks:
+                piece = assembler.take(chunk)
+                if piece:
+                    yield piece
+            piece = assembler.fall_back(fallback)
+            if piece:
+                yield piece
+        except Exception as e:
+            piece = assembler.fail(e)
+            if piece:
+                yield piece
+        finally:
+            # Hang up on the AI even if the reader stopped listening halfway
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            assembler.close()
+
+
+class AsyncTextStream:
+    """⚡🌊 The async twin of TextStream - `async for` over it, then read `result`
+    
+    It holds one of the client's request slots from the first piece to the
+    last. Stopping early? Python can't tidy up an async loop on its own, so
+    `await stream.aclose()` (or stream inside `async with stream:`) to hang up
+    on the AI and hand the slot back straight away.
+    """
+    
+    def __init__(self, open_stream: Optional[Callable[[], Awaitable[AsyncIterable[Any]]]] = None,
+                 text: str = "", slots: Optional[asyncio.Semaphore] = None, fallback: str = ""):
+        self._open_stream = open_stream  # Starts the AI's stream (None: just hand out `text`)
+        self._text = text
+        self._slots = slots
+        self._fallback = fallback
+        self._pieces: Optional[AsyncGenerator[str, None]] = None
+        self.result = StreamResult()
+    
+    def __aiter__(self) -> AsyncIterator[str]:
+        if self._pieces is not None:
+            raise RuntimeError("A reply can only be streamed once - use .result.text afterwards")
+        self._pieces = self._stream()
+        return self._pieces
+    
+    async def _stream(self) -> AsyncGenerator[str, None]:
+        assembler = _StreamAssembler(self.result)
+        if self._open_stream is None:
+            piece = assembler.deliver(self._text)
+            assembler.close()
+            if piece:
+                yield piece
+            return
+        
+        async with self._slots:
+            chunks = None
+            try:
+                chunks = await self._open_stream()
+                async for chunk in chunks:
+                    piece = assembler.take(chunk)
+                    if piece:
+                        yield piece
+                piece = assembler.fall_back(self._fallback)
+                if piece:
+                    yield piece
+            except Exception as e:
+                piece = assembler.fail(e)
+                if piece:
+                    yield piece
+            finally:
+                # Hang up on the AI even if the reader stopped listening halfway
+                close = getattr(chunks, "aclose", None) or getattr(chunks, "close", None)
+                if close is not None:
+                    closing = close()
+                    if inspect.isawaitable(closing):
+                        await closing
+                assembler.close()
+    
+    async def aclose(self):
+        """👋 Stop streaming: the AI's stream is closed and the request slot handed back"""
+        if self._pieces is not None:
+            await self._pieces.aclose()
+    
+    async def __aenter__(self) -> 'AsyncTextStream':
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
 class LLMClient:
     """🌟 Your Personal AI Storytelling Assistant - Ready to Create Magic!"""
     
@@ -32,8 +289,8 @@ class LLMClient:
         
         if HAS_GROQ and GROQ_API_KEY:
             # Set up a reliable connection to our AI friend
-            timeout = httpx.Timeout(30.0, connect=10.0)  # Give it time to think of great stories
-            transport = httpx.HTTPTransport(retries=3)    # Try again if connection hiccups
+            timeout = httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT_SECONDS)
+            transport = httpx.HTTPTransport(retries=LLM_RETRIES)  # Try again if connection hiccups
             
             custom_httpx_client = DefaultHttpxClient(
                 timeout=timeout,
@@ -52,7 +309,7 @@ class LLMClient:
     def generate_text(self, messages: List[Dict[str, str]], **kwargs) -> Optional[str]:
         """💬 Have an amazing conversation with our AI storytelling friend!"""
         if not self.client:
-            return "🤖 AI storyteller is taking a nap - please check your connection and API key!"
+            return _NAP_MESSAGE
         
         try:
             # Ask our AI friend to weave some storytelling magic!
@@ -63,42 +320,159 @@ class LLMClient:
             )
             return response.choices[0].message.content.strip()
         except Exception as e:
-            return f"🤖 AI storyteller encountered an issue: {e}"
+            return _issue_message(e)
+    
+    def generate_text_stream(self, messages: List[Dict[str, str]], fallback: str = "", **kwargs) -> TextStream:
+        """🌊 Like generate_text, but the reply arrives word by word as the AI writes it
+        
+        Loop over the stream for each new piece of text; afterwards `stream.result`
+        has the whole reply and how many tokens it took. `fallback` stands in for
+        a reply that comes back empty.
+        """
+        if not self.client:
+            return TextStream(text=_NAP_MESSAGE)
+        
+        return TextStream(lambda: self.client.chat.completions.create(
+            messages=messages,
+            model=self.model,
+            stream=True,
+            **kwargs
+        ), fallback=fallback)
     
     def generate_story_intro(self, character_info: str) -> str:
         """🌟 Create an amazing opening scene for your hero's first adventure!"""
-        prompt = f"""You are the most amazing Dungeon Master ever, starting a brand new adventure! Create an engaging, exciting opening scene for this incredible hero:
+        return self.generate_text(_intro_messages(character_info)) or _INTRO_FALLBACK
+    
+    def continue_story(self, character_info: str, memory_context: str, recent_context: str, player_action: str,
+                       npc_context: str = "") -> str:
+        """📖 Continue the epic story based on what your hero chooses to do (and who's around to see it)!"""
+        messages = _story_messages(character_info, memory_context, recent_context, player_action, npc_context)
+        return self.generate_text(messages) or _STORY_FALLBACK
+    
+    def continue_story_stream(self, character_info: str, memory_context: str, recent_context: str,
+                              player_action: str, npc_context: str = "") -> TextStream:
+        """📖🌊 Continue the story, word by word as it's written"""
+        messages = _story_messages(character_info, memory_context, recent_context, player_action, npc_context)
+        return self.generate_text_stream(messages, fallback=_STORY_FALLBACK)
 
-{character_info}
 
-Make it immersive, exciting, and full of possibilities! Give the player some really interesting choices to make.
-Just tell the story - no technical stuff, just pure storytelling magic!"""
+class AsyncLLMClient:
+    """⚡ The Storyteller for Many Tables at Once - async, pooled and polite!
+    
+    Every request goes over one shared pool of keep-alive connections, and at
+    most `max_concurrent_requests` of them are in flight at a time (the rest
+    wait their turn). Use it from one event loop - `get_async_llm_client()`
+    hands out the shared one for the loop you're in.
+    """
+    
+    def __init__(self, max_concurrent_requests: int = LLM_MAX_CONCURRENT_REQUESTS,
+                 max_connections: int = LLM_MAX_CONNECTIONS,
+                 max_keepalive_connections: int = LLM_MAX_KEEPALIVE_CONNECTIONS,
+                 keepalive_seconds: float = LLM_KEEPALIVE_SECONDS):
+        self.model = LLM_MODEL
+        self.client = None
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self.max_concurrent_requests = max_concurrent_requests
+        self._slots = asyncio.Semaphore(max_concurrent_requests)  # One per request in flight
+        
+        if HAS_GROQ and GROQ_API_KEY:
+            # One pool of warm connections for every adventure using this client
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_seconds,
+            )
+            self.http_client = DefaultAsyncHttpxClient(
+                timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT_SECONDS),
+                transport=httpx.AsyncHTTPTransport(retries=LLM_RETRIES, limits=limits),
+            )
+            self.client = AsyncGroq(
+                api_key=GROQ_API_KEY,
+                http_client=self.http_client,
+            )
+    
+    async def generate_text(self, messages: List[Dict[str, str]], **kwargs) -> Optional[str]:
+        """💬 generate_text, without blocking the event loop while the AI thinks"""
+        if not self.client:
+            return _NAP_MESSAGE
         
-        messages = [{"role": "user", "content": prompt}]
-        return self.generate_text(messages) or "🏰 Welcome to your amazing adventure! You find yourself at the entrance to a mysterious tavern, with sounds of laughter and adventure calling from within. The wooden sign creaks in the wind, and you can smell fresh bread and hear tales of distant lands. What would you like to do?"
+        async with self._slots:
+            try:
+                response = await self.client.chat.completions.create(
+                    messages=messages,
+                    model=self.model,
+                    **kwargs
+                )
+                return response.choices[0].message.content.strip()
+            except Exception as e:
+                return _issue_message(e)
+    
+    def generate_text_stream(self, messages: List[Dict[str, str]], fallback: str = "",
+                             **kwargs) -> AsyncTextStream:
+        """🌊 The reply word by word: `async with client.generate_text_stream(...) as stream:`
+        then `async for piece in stream` (`fallback` is handed out if the AI sends nothing)"""
+        if not self.client:
+            return AsyncTextStream(text=_NAP_MESSAGE)
+        
+        return AsyncTextStream(lambda: self.client.chat.completions.create(
+            messages=messages,
+            model=self.model,
+            stream=True,
+            **kwargs
+        ), slots=self._slots, fallback=fallback)
+    
+    async def generate_story_intro(self, character_info: str) -> str:
+        """🌟 Create an amazing opening scene for your hero's first adventure!"""
+        return await self.generate_text(_intro_messages(character_info)) or _INTRO_FALLBACK
+    
+    async def continue_story(self, character_info: str, memory_context: str, recent_context: str,
+                             player_action: str, npc_context: str = "") -> str:
+        """📖 Continue the epic story based on what your hero chooses to do (and who's around to see it)!"""
+        messages = _story_messages(character_info, memory_context, recent_context, player_action, npc_context)
+        return await self.generate_text(messages) or _STORY_FALLBACK
+    
+    def continue_story_stream(self, character_info: str, memory_context: str, recent_context: str,
+                              player_action: str, npc_context: str = "") -> AsyncTextStream:
+        """📖🌊 Continue the story, word by word as it's written"""
+        messages = _story_messages(character_info, memory_context, recent_context, player_action, npc_context)
+        return self.generate_text_stream(messages, fallback=_STORY_FALLBACK)
     
-    def continue_story(self, character_info: str, memory_context: str, recent_context: str, player_action: str) -> str:
-        """📖 Continue the epic story based on what your hero chooses to do!"""
-        prompt = f"""You are the best Dungeon Master in the world, continuing an amazing ongoing adventure! 
+    async def aclose(self):
+        """👋 Hang up every pooled connection"""
+        if self.client is not None:
+            await self.client.close()
+    
+    async def __aenter__(self) -> 'AsyncLLMClient':
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
-OUR HERO:
-{character_info}
 
-WHAT JUST HAPPENED:
-{recent_context}
+# One shared async client per event loop (connections can't move between loops)
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncLLMClient]" = weakref.WeakKeyDictionary()
 
-IMPORTANT THINGS TO REMEMBER:
-{memory_context}
 
-WHAT THE HERO DOES NOW: {player_action}
+def get_async_llm_client() -> AsyncLLMClient:
+    """⚡ The shared async client for the running event loop - made the first time it's asked for
+    
+    Its connections stay open until you hang up: `await close_async_llm_client()`
+    before your event loop finishes (say, at the end of the coroutine you
+    hand to `asyncio.run`).
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncLLMClient()
+    return client
 
-Continue this epic story! Remember everything that happened before, make it exciting and consistent, and give our hero some great choices for what to do next.
 
-Just tell the amazing story - pure narrative magic, no technical stuff!"""
-        
-        messages = [{"role": "user", "content": prompt}]
-        return self.generate_text(messages) or "🌟 The story continues as you take action, with the world responding to your choices in amazing ways..."
+async def close_async_llm_client():
+    """👋 Hang up the running event loop's shared client (the next request gets a fresh one)"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
 
 
 # 🌟 Our amazing AI storytelling friend - ready whenever you need epic stories!
-llm_client = LLMClient()
\ No newline at end of file
+llm_client = LLMClient()
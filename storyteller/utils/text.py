@@ -0,0 +1,123 @@
+# storyteller/utils/text.py
+"""
+📜 The Text Reader - Read Every Line Once, Share It With Everyone!
+
+Lots of parts of the storyteller want to look at the same words: the fact
+finder, the importance rater, the NPC tracker, the tone reader and the memory
+search. Rather than each of them lowercasing, splitting and scanning the text
+all over again, we read each player action and each DM response exactly once
+into a TextAnalysis and hand that around to everybody who needs it.
+"""
+
+import re
+from functools import cached_property
+from typing import FrozenSet, List, Tuple, Union
+
+from .keywords import KeywordHit, lexicon_automaton
+
+# Words or punctuation marks, in reading order
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def is_name_word(token: str) -> bool:
+    """Looks like a proper name: one capital letter followed by lowercase letters"""
+    return (
+        len(token) > 1 and token.isascii() and token.isalpha()
+        and token[0].isupper() and token[1:].islower()
+    )
+
+
+def is_word(token: str) -> bool:
+    """A real word rather than a punctuation mark"""
+    return token[0].isalnum() or token[0] == '_'
+
+
+class TextAnalysis:
+    """📜 One careful read of a piece of text, ready to share with every stage!"""
+
+    def __init__(self, text: str, tokens: List[str], offsets: List[Tuple[int, int]],
+                 keyword_hits: List[KeywordHit] = None, boundaries: Tuple[int, ...] = ()):
+        self.text = text
+        self.tokens = tokens              # Words and punctuation, in order
+        self.offsets = offsets            # (start, end) of each token in the text
+        self.boundaries = boundaries      # Token indices where a joined-on text begins
+        self.folded = [token.lower() for token in tokens]  # Case-folded tokens
+        self._keyword_hits = keyword_hits
+
+    @classmethod
+    def of(cls, text: str) -> 'TextAnalysis':
+        """📖 Read a piece of text once"""
+        tokens, offsets = [], []
+        for match in _TOKEN_RE.finditer(text):
+            tokens.append(match.group())
+            offsets.append(match.span())
+        return cls(text, tokens, offsets)
+
+    @classmethod
+    def ensure(cls, text: Union[str, 'TextAnalysis']) -> 'TextAnalysis':
+        """Use an existing read if we were given one, otherwise read the text now"""
+        return text if isinstance(text, TextAnalysis) else cls.of(text)
+
+    @classmethod
+    def join(cls, first: 'TextAnalysis', second: 'TextAnalysis', separator: str = " ") -> 'TextAnalysis':
+        """Glue two reads together (e.g. action + response) without reading anything again"""
+        shift = len(first.text) + len(separator)
+        hits = None
+        if first._keyword_hits is not None and second._keyword_hits is not None:
+            hits = first._keyword_hits + [
+                KeywordHit(hit.start + shift, hit.end + shift, hit.keyword, hit.category, hit.whole_word)
+                for hit in second._keyword_hits
+            ]
+        return cls(
+            first.text + separator + second.text,
+            first.tokens + second.tokens,
+            first.offsets + [(start + shift, end + shift) for start, end in second.offsets],
+            hits,
+            first.boundaries + (len(first.tokens),) + tuple(i + len(first.tokens) for i in second.boundaries)
+        )
+
+    @cached_property
+    def lowered(self) -> str:
+        """The whole text in lowercase"""
+        return self.text.lower()
+
+    @cached_property
+    def words(self) -> FrozenSet[str]:
+        """Every distinct (case-folded) word, punctuation left out"""
+        return frozenset(token for token in self.folded if is_word(token))
+
+    @cached_property
+    def capitalized_spans(self) -> List[Tuple[int, int]]:
+        """Token ranges [start, end) of runs of Capitalized words with only spaces between
+
+        Runs never cross from one joined text into the next ("... Marcus" + "Marcus says ...").
+        """
+        spans = []
+        run_start = None
+        boundaries = set(self.boundaries)
+        for i, token in enumerate(self.tokens):
+            if i in boundaries and run_start is not None:
+                spans.append((run_start, i))
+                run_start = None
+            if is_name_word(token):
+                if run_start is None:
+                    run_start = i
+            elif run_start is not None:
+                spans.append((run_start, i))
+                run_start = None
+        if run_start is not None:
+            spans.append((run_start, len(self.tokens)))
+        return spans
+
+    @property
+    def keyword_hits(self) -> List[KeywordHit]:
+        """Every lexicon keyword in the text, from one pass of the shared automaton"""
+        if self._keyword_hits is None:
+            self._keyword_hits = lexicon_automaton.scan(self.text)
+        return self._keyword_hits
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        return len(self.text)
@@ -34,6 +34,16 @@ class MemoryTests:
             self.test_fact_extraction(engine)
             self.test_memory_persistence(engine)
             self.test_memory_search_accuracy(engine)
+            self.test_multi_query_retrieval(engine)
+            self.test_filtered_retrieval(engine)
+            self.test_deadline_retrieval(engine)
+            self.test_duplicate_collapse(engine)
+            self.test_retention_policy(engine)
+            self.test_relationship_graph(engine)
+            self.test_fact_store_eviction(engine)
+            self.test_fact_canonicalization(engine)
+            self.test_entity_triggered_retrieval(engine)
+            self.test_npc_interaction_index(engine)
             
         finally:
             # Cleanup
@@ -277,6 +287,458 @@ class MemoryTests:
         
         self.results['search_accuracy'] = run_test_safely(search_accuracy_test)
 
+    
+    def test_multi_query_retrieval(self, engine):
+        """Test query expansion and batched vector scoring"""
+        print("  🧩 Testing multi-query retrieval...")
+        
+        def multi_query_test():
+            import numpy as np
+            from storyteller.core.vector_index import VectorIndex
+            
+            # Entities named in the action become their own lookups
+            sub_queries = engine.memory.expand_query(
+                "ask Marcus about the chalice", entities=["Marcus", "Elena"]
+            )
+            
+            # Three memories pointing in three different directions
+            index = VectorIndex(initial_capacity=2)
+            index.add(1, [1.0, 0.0, 0.0], "Turn 1: Marcus", {'importance': 1.0})
+            index.add(2, [0.0, 1.0, 0.0], "Turn 2: chalice", {'importance': 2.0})
+            index.add(3, [0.0, 0.0, 1.0], "Turn 3: filler", {'importance': 0.0})
+            
+            # Two queries scored together should surface both matching memories
+            results = index.search(np.array([[1.0, 0.1, 0.0], [0.0, 1.0, 0.1]]), top_k=2)
+            found_turns = sorted(turn_id for turn_id, _ in results)
+            
+            assert sub_queries[0] == "ask Marcus about the chalice" and "Elena" in sub_queries, \
+                f"the whole action then one lookup per entity, got {sub_queries}"
+            assert found_turns == [1, 2] and len(index) == 3, f"batched search found turns {found_turns}"
+            
+            return {
+                'sub_queries': sub_queries,
+                'found_turns': found_turns,
+            }
+        
+        self.results['multi_query_retrieval'] = run_test_safely(multi_query_test)
+    
+    def test_filtered_retrieval(self, engine):
+        """Test bitmap-filtered retrieval by importance, NPC and quest"""
+        print("  🗂️ Testing filtered retrieval...")
+        
+        def filtered_retrieval_test():
+            import contextlib
+            import io
+            import shutil
+            import tempfile
+            from storyteller.core.bitmap_index import BitmapIndex, MemoryFilter
+            from storyteller.core.memory import DocumentMemorySystem
+            
+            # A memory of its own, so lantern turns left by earlier runs can't slip through the filters
+            save_path = tempfile.mkdtemp(prefix="filtered_retrieval_test_")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    memory = DocumentMemorySystem(save_path)
+                    memory.add_conversation_turn("I ask Marcus about the lantern", "Marcus shrugs", npcs=["Marcus"], quest=2)
+                    memory.add_conversation_turn("I ask Elena about the lantern", "An ancient cursed secret quest", npcs=["Elena"], quest=2)
+                    memory.add_conversation_turn("I polish the lantern", "It gleams", quest=3)
+                
+                marcus_only = memory.retrieve_relevant_memories("lantern", memory_filter=MemoryFilter(npcs=("Marcus",)))
+                important_only = memory.retrieve_relevant_memories("lantern", memory_filter=MemoryFilter(min_importance=3))
+                quest_three = memory.retrieve_relevant_memories("lantern", memory_filter=MemoryFilter(quest=3))
+                nobody = memory.retrieve_relevant_memories("lantern", memory_filter=MemoryFilter(npcs=("Marcus",), quest=3))
+                
+                assert len(marcus_only) == 1 and "Marcus" in marcus_only[0], f"NPC filter gave {marcus_only}"
+                assert len(important_only) == 1 and "Elena" in important_only[0], f"importance filter gave {important_only}"
+                assert len(quest_three) == 1 and "polish" in quest_three[0], f"quest filter gave {quest_three}"
+                assert nobody == [], f"no turn has Marcus in quest 3, got {nobody}"
+                assert BitmapIndex.ids((1 << 5000) | 0b101) == [0, 2, 5000], "bitsets should unpack to their turn ids"
+                
+                return {
+                    'marcus_only': marcus_only,
+                    'important_only': important_only,
+                    'quest_three': quest_three,
+                }
+            finally:
+                shutil.rmtree(save_path, ignore_errors=True)
+        
+        self.results['filtered_retrieval'] = run_test_safely(filtered_retrieval_test)
+    
+    def test_deadline_retrieval(self, engine):
+        """Test that retrieval returns partial results when its deadline has passed"""
+        print("  ⏳ Testing deadline-aware retrieval...")
+        
+        def deadline_test():
+            memory = engine.memory
+            memory.add_conversation_turn("I hide the silver key under the rug", "The key is hidden")
+            
+            unhurried = memory.retrieve_relevant_memories("silver key")
+            
+            # A deadline that has already passed still gets the cheap keyword hits
+            start = time.perf_counter()
+            rushed = memory.retrieve_relevant_memories("silver key", deadline=start)
+            rushed_seconds = time.perf_counter() - start
+            
+            assert any("silver key" in memory_text for memory_text in rushed), \
+                "the keyword stage should still find the key when the deadline has passed"
+            assert rushed.timed_out and 'rerank' not in rushed.completed_stages, \
+                f"a passed deadline still ran {rushed.completed_stages}"
+            assert 'rerank' in unhurried.completed_stages and not unhurried.timed_out, \
+                f"without a deadline every stage should run, got {unhurried.completed_stages}"
+            
+            return {
+                'unhurried_stages': unhurried.completed_stages,
+                'rushed_stages': rushed.completed_stages,
+                'rushed_seconds': rushed_seconds,
+            }
+        
+        self.results['deadline_retrieval'] = run_test_safely(deadline_test)
+    
+    def test_duplicate_collapse(self, engine):
+        """Test that near-identical filler turns collapse into one memory"""
+        print("  👯 Testing near-duplicate collapse...")
+        
+        def duplicate_test():
+            import contextlib
+            import io
+            import shutil
+            import tempfile
+            from storyteller.core.memory import DocumentMemorySystem
+            
+            # A memory of its own - torch turns from earlier runs would pile onto the count
+            save_path = tempfile.mkdtemp(prefix="duplicate_test_")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    memory = DocumentMemorySystem(save_path)
+                    for _ in range(5):
+                        memory.add_conversation_turn("I count my remaining torches", "You have three torches left in your pack")
+                    memory.add_conversation_turn("I count the stars above the tower", "A comet streaks across the sky")
+                
+                results = memory.retrieve_relevant_memories("count torches", max_results=5)
+                torch_results = [r for r in results if "torches" in r]
+                distinct_turns = memory.get_summary()['distinct_turns']
+                assert len(torch_results) == 1 and "Seen 5 times" in torch_results[0], \
+                    f"five torch counts should show up once, got {torch_results}"
+                assert distinct_turns == 2, f"{distinct_turns} distinct turns for torches and stars"
+                
+                # After a restart the (packed away) torch turn still catches its repeats
+                torch_turn = memory.dedup.representative(1)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    memory.retention.recent_turns = 1
+                    memory.retention.budget_bytes = 0  # Everything but the latest turn gets packed away
+                    memory.add_conversation_turn("I rest by the fire", "The embers glow")
+                    restarted = DocumentMemorySystem(save_path)
+                    restarted.add_conversation_turn("I count my remaining torches", "You have three torches left in your pack")
+                assert torch_turn in restarted.retention.cold, "the torch turn should be in cold storage"
+                assert restarted.conversation_history[-1].duplicate_of == torch_turn, \
+                    "a repeat of a cold turn should fold into its group after a restart"
+                assert restarted.dedup.group_size(torch_turn) == 6 and len(restarted.dedup) == 3, \
+                    f"group of {restarted.dedup.group_size(torch_turn)}, {len(restarted.dedup)} distinct turns"
+                
+                return {
+                    'results': results,
+                    'torch_results': len(torch_results),
+                    'distinct_turns': distinct_turns,
+                    'group_after_restart': restarted.dedup.group_size(torch_turn),
+                }
+            finally:
+                shutil.rmtree(save_path, ignore_errors=True)
+        
+        self.results['duplicate_collapse'] = run_test_safely(duplicate_test)
+    
+    def test_retention_policy(self, engine):
+        """Test that important old turns stay resident under a tight RAM budget"""
+        print("  🧳 Testing importance-aware retention...")
+        
+        def retention_test():
+            import contextlib
+            import io
+            import os
+            import shutil
+            import tempfile
+            from storyteller.core.memory import DocumentMemorySystem
+            
+            # A memory of its own, so turns left behind by other tests can't crowd the budget
+            save_path = tempfile.mkdtemp(prefix="retention_test_")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    memory = DocumentMemorySystem(save_path)
+                retention = memory.retention
+                retention.recent_turns = 3
+                retention.budget_bytes = 2000
+                retention.compact_bytes = 0  # Tidy the cold log as soon as stale lines outweigh live ones
+                
+                memory.add_conversation_turn("I learn the ancient prophecy", "A cursed secret: the dragon is your brother")
+                prophecy_turn = memory.turn_counter
+                for i in range(10):
+                    memory.add_conversation_turn(f"I walk down corridor {i}", f"Corridor {i} is empty")
+                resident_turns = [entry.turn_id for entry in memory.conversation_history]
+                filler_was_cold = bool(retention.cold)
+                cold_filler = min(retention.cold) if retention.cold else prophecy_turn + 1
+                packed_on_disk = all(not isinstance(location, bytes) for location in retention.cold.values())
+                promoted = memory.get_entry(cold_filler, promote=True)
+                promotion_working = filler_was_cold and promoted is not None and cold_filler not in retention.cold
+                
+                # Recall old turns and move on, again and again: stale log lines must get tidied away
+                appended_bytes = os.path.getsize(retention.cold_path)
+                for _ in range(12):
+                    before = os.path.getsize(retention.cold_path)
+                    memory.get_entry(min(retention.cold), promote=True)
+                    memory.conversation_history = retention.enforce(memory.conversation_history)  # ...and packed again
+                    appended_bytes += max(0, os.path.getsize(retention.cold_path) - before)
+                log_bytes = os.path.getsize(retention.cold_path)
+                all_readable = all(memory.get_entry(turn_id) is not None for turn_id in retention.cold)
+                
+                assert prophecy_turn in resident_turns, "the salient prophecy turn was packed away"
+                assert filler_was_cold and packed_on_disk, "old filler turns should be packed away on disk"
+                assert retention.compactions > 0 and log_bytes < appended_bytes, "the cold log was never compacted"
+                assert all_readable, "a cold turn became unreadable after compaction"
+                assert promotion_working, "a recalled cold turn should move back into resident memory"
+                assert resident_turns[-3:] == list(range(prophecy_turn + 8, prophecy_turn + 11)), \
+                    f"the three latest turns should stay resident, got {resident_turns}"
+                assert memory.get_summary()['resident_bytes'] <= retention.budget_bytes, "resident memory is over budget"
+                
+                return {
+                    'resident_turns': resident_turns,
+                    'resident_bytes': memory.get_summary()['resident_bytes'],
+                    'prophecy_resident': prophecy_turn in resident_turns,
+                    'recent_tail_resident': resident_turns[-3:] == list(range(memory.turn_counter - 2, memory.turn_counter + 1)),
+                    'within_budget': memory.get_summary()['resident_bytes'] <= retention.budget_bytes,
+                    'promotion_working': promotion_working,
+                    'cold_on_disk': packed_on_disk and retention.compactions > 0 and all_readable,
+                }
+            finally:
+                shutil.rmtree(save_path, ignore_errors=True)
+        
+        self.results['retention_policy'] = run_test_safely(retention_test)
+    
+    def test_relationship_graph(self, engine):
+        """Test that typed relationships are woven into the graph and survive a save/load"""
+        print("  🕸️ Testing the relationship graph...")
+        
+        def relationship_test():
+            import contextlib
+            import io
+            import shutil
+            import tempfile
+            from storyteller.core.memory import DocumentMemorySystem
+            from storyteller.core.relationship_graph import HAS_NETWORKX, RelationshipGraph
+            
+            # A memory of its own, so gifts seen in earlier runs don't add to the weight
+            save_path = tempfile.mkdtemp(prefix="relationship_test_")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    memory = DocumentMemorySystem(save_path)
+                    memory.add_conversation_turn("I watch the square", "Marcus gave Elena a silver ring")
+                    first_turn = memory.turn_counter
+                    memory.add_conversation_turn("I keep watching", "Later, Marcus gave Elena a bundle of letters")
+                    memory.add_conversation_turn("I step closer", "Bandits attacked Marcus near the well")
+                
+                around_marcus = memory.relationship_graph.neighbours("marcus")
+                gifts = memory.relationship_graph.neighbours("Elena", relation='gave')
+                reloaded = RelationshipGraph.from_dict(memory.relationship_graph.to_dict())
+                
+                if HAS_NETWORKX:
+                    assert len(gifts) == 1 and gifts[0].weight == 2, f"two gifts should make one edge of weight 2, got {gifts}"
+                    assert gifts[0].turns == [first_turn, first_turn + 1], f"gift turns {gifts[0].turns}"
+                    assert any(r.relation == 'attacked' and r.obj == 'Marcus' for r in around_marcus), \
+                        "the bandits' attack should be around Marcus"
+                    assert len(reloaded) == len(memory.relationship_graph), "the graph should survive a save/load"
+                
+                return {
+                    'networkx_available': HAS_NETWORKX,
+                    'around_marcus': [relationship.describe() for relationship in around_marcus],
+                    'gift_weight': gifts[0].weight if gifts else 0,
+                    'gift_turns': gifts[0].turns if gifts else [],
+                }
+            finally:
+                shutil.rmtree(save_path, ignore_errors=True)
+        
+        self.results['relationship_graph'] = run_test_safely(relationship_test)
+    
+    def test_fact_store_eviction(self, engine):
+        """Test that the fact store stays under its cap, keeps popular facts and tidies dead postings"""
+        print("  🗃️ Testing the bounded fact store...")
+        
+        def fact_store_test():
+            from storyteller.core.fact_store import FactStore
+            
+            store = FactStore(capacity=100, half_life=20)
+            for turn_id in range(1, 501):
+                store.add(f"Noise {turn_id}", turn_id)       # Stray words, seen once
+                if turn_id % 10 == 0:
+                    store.add("Marcus", turn_id)              # A recurring character
+            store.add("Elena", 1)
+            for _ in range(3):
+                store.touch("Elena")                          # Looked up, but long ago
+            
+            collected = store.collect_garbage(lambda turn_id: turn_id > 250)
+            summary = engine.memory.get_summary()
+            
+            assert len(store) <= 100 and store.evictions > 0, f"{len(store)} facts kept with a cap of 100"
+            assert "Marcus" in store, "a recurring character's fact should survive eviction"
+            assert "Noise 1" not in store and "Noise 500" in store, "the oldest stray facts should go first"
+            assert all(turn_id > 250 for turn_id in store["Marcus"]), "postings to dead turns should be collected"
+            assert 'fact_evictions' in summary and 'fact_postings_collected' in summary, \
+                "the memory summary should report the fact store's counters"
+            
+            return {
+                'size': len(store),
+                'evictions': store.evictions,
+                'collected_postings': collected,
+                'marcus_turns': len(store.get("Marcus", [])),
+            }
+        
+        self.results['fact_store_eviction'] = run_test_safely(fact_store_test)
+    
+    def test_fact_canonicalization(self, engine):
+        """Test that every surface form of a name shares one fact entry once the NPC is known"""
+        print("  🪪 Testing fact canonicalization...")
+        
+        def canonicalization_test():
+            from storyteller.core.fact_store import FactStore
+            
+            store = FactStore()
+            surface_forms = ["Marcus", "marcus", "Marcus's", "Old Marcus", "Marcus -> Elena", "marcus -> elena's"]
+            for turn_id, fact in enumerate(surface_forms, start=1):
+                store.add(fact, turn_id)
+            for turn_id in range(500):
+                store.add(f"Lantern {turn_id}", 10 + turn_id)  # Facts a new name can't possibly change
+            size_before = len(store)
+            
+            store.canonicalizer.register_entity("Marcus")  # The NPC roster tells us who Marcus is
+            retagged = []
+            canonical = store.canonicalizer.canonical
+            store.canonicalizer.canonical = lambda fact: retagged.append(fact) or canonical(fact)
+            store.recanonicalize(store.canonicalizer.words_of(["Marcus"]))
+            store.canonicalizer.canonical = canonical
+            assert len(retagged) <= len(surface_forms), f"re-tagged {len(retagged)} facts for one new name"
+            
+            # The engine wires the NPC roster into the memory system's alias desk
+            engine.npc_manager.initialize_npc("Thessaly", "oracle")
+            engine_resolves = engine.memory.fact_aliases.resolve("Lady Thessaly's") == "thessaly"
+            
+            assert len(store) == 502, f"every way of naming Marcus should share one entry, {len(store)} keys"
+            assert store["Captain Marcus"] == [1, 2, 3, 4], f"Marcus's turns: {store['Captain Marcus']}"
+            assert store["Marcus's -> Elena"] == [5, 6], "his relation to Elena should share one entry too"
+            assert engine_resolves, "a new NPC should reach the memory system's alias desk"
+            
+            return {
+                'keys': sorted(store.keys()),
+                'size_before': size_before,
+                'size_after': len(store),
+                'marcus_turns': store.get("MARCUS", []),
+                'facts_retagged': len(retagged),
+            }
+        
+        self.results['fact_canonicalization'] = run_test_safely(canonicalization_test)
+    
+    def test_entity_triggered_retrieval(self, engine):
+        """Test that turns sharing the action's entities are found through the fact index, even when cold"""
+        print("  🗃️ Testing entity-triggered retrieval...")
+        
+        def entity_retrieval_test():
+            import contextlib
+            import io
+            import shutil
+            import tempfile
+            from storyteller.core.memory import DocumentMemorySystem
+            
+            # A memory of its own with a tiny budget, so the buried turn really goes cold
+            save_path = tempfile.mkdtemp(prefix="entity_retrieval_test_")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    memory = DocumentMemorySystem(save_path)
+                retention = memory.retention
+                retention.recent_turns = 3
+                retention.budget_bytes = 600
+                
+                memory.add_conversation_turn("I follow Brannoc", "Brannoc buries a sword under the old mill")
+                buried_turn = memory.turn_counter
+                memory.add_conversation_turn("I greet Brannoc", "Brannoc waves back")
+                memory.add_conversation_turn("I inspect my sword", "The blade is notched")
+                for i in range(8):
+                    memory.add_conversation_turn(f"I wait by well {i}", f"Nothing stirs at well {i}")
+                was_cold = buried_turn in retention.cold
+                
+                start = time.perf_counter()
+                results = memory.retrieve_relevant_memories("Where is it hidden?", entities=["Brannoc", "sword"])
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                
+                assert was_cold, "the buried turn should be in cold storage before we go looking for it"
+                assert 'facts' in results.completed_stages, f"the fact stage didn't run: {results.completed_stages}"
+                assert results and results[0].startswith(f"[Turn {buried_turn},"), \
+                    f"the turn sharing Brannoc and the sword should come first, got {list(results)[:1]}"
+                assert buried_turn not in retention.cold, "a recalled turn should be resident again"
+                
+                return {
+                    'results': list(results),
+                    'stages': results.completed_stages,
+                    'elapsed_ms': elapsed_ms,
+                }
+            finally:
+                shutil.rmtree(save_path, ignore_errors=True)
+        
+        self.results['entity_triggered_retrieval'] = run_test_safely(entity_retrieval_test)
+    
+    def test_npc_interaction_index(self, engine):
+        """Test that every NPC's diary records their turns and tone, newest last, and survives a save/load"""
+        print("  📇 Testing the per-NPC interaction index...")
+        
+        def interaction_index_test():
+            import contextlib
+            import io
+            from storyteller.core.interaction_index import InteractionIndex
+            
+            memory = engine.memory
+            memory.add_conversation_turn("Thank you, Marcus", "Marcus smiles.", npcs=["Marcus", "Elena"],
+                                         mentioned=["Marcus"], tone="Polite", tone_delta=8)
+            first_turn = memory.turn_counter
+            memory.add_conversation_turn("I glare at Marcus", "He looks away.", npcs=["Marcus"],
+                                         mentioned=["Marcus"], tone="Threatening", tone_delta=-20)
+            memory.add_conversation_turn("I leave the forge", "The street is quiet.", npcs=["Marcus"])
+            
+            recent = memory.npc_interactions.recent("Marcus", 2)
+            reloaded = InteractionIndex.from_dict(memory.npc_interactions.to_dict())
+            
+            # A regular's diary keeps only the latest entries
+            capped = InteractionIndex(max_entries=3)
+            for turn in range(1, 11):
+                capped.record(turn, mentioned=["Brannoc"], action=f"I buy round {turn}")
+            assert capped.turns("Brannoc") == [8, 9, 10], f"diary not capped: {capped.turns('Brannoc')}"
+            
+            # A crowded scene reminds the storyteller about the most salient few, not everyone
+            from storyteller.config import NPC_CONTEXT_TOP_K
+            manager = engine.npc_manager
+            scene_before = set(manager.current_npcs)
+            with contextlib.redirect_stdout(io.StringIO()):
+                for i in range(20):
+                    manager.initialize_npc(f"Patron{i}", "villager")
+                    memory.npc_interactions.record(memory.turn_counter, mentioned=[f"Patron{i}"], action="Cheers!")
+                manager.current_npcs |= {f"Patron{i}" for i in range(20)}
+                _, _, memory_context, _ = engine._prepare_turn("I look around the crowded hall")
+            manager.current_npcs = scene_before
+            past_interactions = memory_context.split("Past Interactions:\n")[-1].splitlines()
+            assert len(past_interactions) <= NPC_CONTEXT_TOP_K, \
+                f"{len(past_interactions)} NPCs' diaries in the prompt"
+            
+            marcus_turns = memory.npc_interactions.turns("Marcus")
+            assert marcus_turns[-3:] == [first_turn, first_turn + 1, first_turn + 2], \
+                f"Marcus's diary should hold all three turns in order, got {marcus_turns[-3:]}"
+            assert [interaction.tone for interaction in recent] == ["Threatening", "Neutral"], \
+                f"recent tones: {[interaction.tone for interaction in recent]}"
+            assert recent[0].delta == -20 and recent[0].mentioned and not recent[1].mentioned, \
+                "the glare names Marcus and costs 20, leaving the forge doesn't"
+            assert memory.npc_interactions.turns("Elena")[-1] == first_turn, "Elena was only there for the thanks"
+            assert reloaded.turns("Marcus") == marcus_turns, "diary changed across a save/load"
+            
+            return {
+                'marcus_recent': [interaction.describe() for interaction in recent],
+                'elena_turns': memory.npc_interactions.turns("elena"),
+                'diaries_in_crowded_prompt': len(past_interactions),
+            }
+        
+        self.results['npc_interaction_index'] = run_test_safely(interaction_index_test)
 
 def run_memory_tests():
     """Run all memory tests and return results"""
@@ -307,5 +769,36 @@ if __name__ == "__main__":
             elif test_name == 'search_accuracy':
                 print(f"  🎯 Search accuracy: {test_result['overall_accuracy']:.2%}")
                 print(f"  ✅ Threshold met: {test_result['accuracy_threshold_met']}")
+            elif test_name == 'entity_triggered_retrieval':
+                print(f"  🗃️ Found: {test_result['results'][:1]}")
+                print(f"  ⏱️ {test_result['elapsed_ms']:.2f}ms through stages {test_result['stages']}")
+            elif test_name == 'fact_canonicalization':
+                print(f"  🪪 Fact keys: {test_result['size_before']} -> {test_result['size_after']}")
+                print(f"  🎯 Facts re-tagged for one new NPC: {test_result['facts_retagged']}")
+                print(f"  🧔 Marcus's turns, however he's named: {test_result['marcus_turns']}")
+            elif test_name == 'fact_store_eviction':
+                print(f"  🗃️ Facts kept: {test_result['size']} ({test_result['evictions']} evicted)")
+                print(f"  🧹 Dead postings collected: {test_result['collected_postings']}")
+            elif test_name == 'npc_interaction_index':
+                print(f"  📇 Marcus lately: {test_result['marcus_recent']}")
+                print(f"  👥 Diaries in a crowded scene's prompt: {test_result['diaries_in_crowded_prompt']}")
+                print(f"  👩 Elena's turns: {test_result['elena_turns']}")
+            elif test_name == 'relationship_graph':
+                print(f"  🕸️ Around Marcus: {test_result['around_marcus']}")
+                print(f"  🎁 Gift weight: {test_result['gift_weight']} over turns {test_result['gift_turns']}")
+            elif test_name == 'retention_policy':
+                print(f"  🧳 Plot point kept: {test_result['prophecy_resident']}")
+                print(f"  📦 Promotion working: {test_result['promotion_working']}")
+                print(f"  💽 Cold turns on disk, log compacted: {test_result['cold_on_disk']}")
+            elif test_name == 'duplicate_collapse':
+                print(f"  👯 Torch results: {test_result['torch_results']}, group after restart: {test_result['group_after_restart']}")
+            elif test_name == 'deadline_retrieval':
+                print(f"  ⏳ Stages before deadline: {test_result['rushed_stages']}")
+                print(f"  ⏱️ Rushed search took {test_result['rushed_seconds'] * 1000:.2f}ms")
+            elif test_name == 'filtered_retrieval':
+                print(f"  🗂️ Quest 3 only: {test_result['quest_three']}")
+            elif test_name == 'multi_query_retrieval':
+                print(f"  🧩 Sub-queries: {test_result['sub_queries']}")
+                print(f"  ✅ Batched search found turns: {test_result['found_turns']}")
         else:
             print(f"  ❌ FAILED: {result['error']}")
\ No newline at end of file
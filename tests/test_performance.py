@@ -3,6 +3,7 @@
 Performance, timing, and scalability tests for the storytelling engine
 """
 
+import re
 import time
 import psutil
 import os
@@ -35,6 +36,12 @@ class PerformanceTests:
             self.test_scalability_with_conversation_count(engine)
             self.test_npc_processing_overhead(engine)
             self.test_memory_usage_growth(engine)
+            self.test_fact_extraction_throughput(engine)
+            self.test_shared_text_analysis(engine)
+            self.test_npc_name_matching_scale(engine)
+            self.test_npc_extraction_throughput(engine)
+            self.test_fuzzy_name_resolution(engine)
+            self.test_async_llm_concurrency(engine)
             
         finally:
             # Cleanup
@@ -314,6 +321,353 @@ class PerformanceTests:
         
         self.results['memory_usage_growth'] = run_test_safely(memory_usage_test)
     
+    def test_fact_extraction_throughput(self, engine):
+        """Micro-benchmark: one-pass fact extractor vs the old per-pattern regex loops"""
+        print("  🔬 Benchmarking fact extraction throughput...")
+        
+        def legacy_extract_facts(text):
+            # The original extractor: every pattern, re.IGNORECASE, one findall each
+            entity_patterns = [
+                r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b',
+                r'\b(?:sword|shield|armor|weapon|potion|key|treasure|gold|silver)\b',
+                r'\b(?:castle|tavern|forest|mountain|village|city|tower|dungeon)\b',
+            ]
+            relationship_patterns = [
+                r'(\w+)\s+(?:gives?|gave|handed?|offered?)\s+(\w+)',
+                r'(\w+)\s+(?:tells?|told|said?|mentioned?)\s+(?:to\s+)?(\w+)',
+                r'(\w+)\s+(?:attacks?|attacked?|fights?|fought?)\s+(\w+)',
+                r'(\w+)\s+(?:helps?|helped?|assists?|assisted?)\s+(\w+)',
+            ]
+            facts = []
+            for pattern in entity_patterns:
+                matches = re.findall(pattern, text, re.IGNORECASE)
+                facts.extend([match.strip() for match in matches if len(match.strip()) > 2])
+            for pattern in relationship_patterns:
+                for match in re.findall(pattern, text, re.IGNORECASE):
+                    facts.append(f"{match[0]} -> {match[1]}")
+            return list(set(facts))
+        
+        def throughput_test():
+            turns = [
+                "Marcus the blacksmith hands you a gleaming sword. \"Take it to the castle,\" he says, "
+                "and Elena tells Marcus that the dragon attacked the village last night.",
+                "You walk through the dark forest toward the old tower. A raven watches from a branch "
+                "while the wind carries whispers of treasure and gold hidden in the dungeon below.",
+                "Sir Galahad helps the wounded guard to his feet and offers him a healing potion, "
+                "promising to escort him back to the tavern before nightfall.",
+            ] * 50
+            megabytes = sum(len(turn.encode()) for turn in turns) / (1024 * 1024)
+            
+            def measure(extract):
+                fact_database = {}
+                start_time = time.perf_counter()
+                for turn_id, turn in enumerate(turns):
+                    for fact in extract(turn):
+                        fact_database.setdefault(fact, []).append(turn_id)
+                elapsed = time.perf_counter() - start_time
+                return {
+                    'mb_per_second': megabytes / elapsed if elapsed > 0 else float('inf'),
+                    'facts_per_turn': sum(len(turns_seen) for turns_seen in fact_database.values()) / len(turns),
+                    'distinct_facts': len(fact_database)
+                }
+            
+            before = measure(legacy_extract_facts)
+            after = measure(engine.memory.extract_facts)
+            assert after['distinct_facts'] <= before['distinct_facts'], \
+                f"the one-pass extractor should not add noise facts ({after['distinct_facts']} vs {before['distinct_facts']})"
+            
+            return {
+                'corpus_mb': megabytes,
+                'before': before,
+                'after': after,
+                'speedup': after['mb_per_second'] / before['mb_per_second'],
+            }
+        
+        self.results['fact_extraction_throughput'] = run_test_safely(throughput_test)
+    
+    def test_shared_text_analysis(self, engine):
+        """Micro-benchmark: every per-turn stage reading the text itself vs one shared TextAnalysis"""
+        print("  📜 Benchmarking the shared per-turn text analysis...")
+        
+        def shared_analysis_test():
+            from storyteller.utils.text import TextAnalysis
+            
+            npcs = engine.npc_manager
+            for name, occupation in (("Marcus", "blacksmith"), ("Elena", "merchant")):
+                if name not in npcs.npcs:
+                    npcs.initialize_npc(name, occupation)
+            
+            turns = [
+                ("Please, Marcus, tell me about the sword", "Marcus the blacksmith hands you a gleaming sword "
+                 "and Elena tells Marcus that the dragon attacked the village last night."),
+                ("I threaten Elena with my dagger", "Elena steps back toward the tavern door, her eyes "
+                 "darting to the ancient treasure map on the table."),
+            ] * 100
+            
+            def run_stages(action, response):
+                return (
+                    tuple(npcs.get_mentioned_npcs(action)),
+                    npcs.analyze_player_tone(action),
+                    tuple(engine.memory.extract_facts(
+                        TextAnalysis.join(action, response) if isinstance(action, TextAnalysis)
+                        else action + " " + response
+                    )),
+                    engine.memory.calculate_importance(action, response),
+                    tuple(npcs.get_mentioned_npcs(response)),
+                )
+            
+            start_time = time.perf_counter()
+            separate = [run_stages(action, response) for action, response in turns]
+            separate_time = time.perf_counter() - start_time
+            
+            start_time = time.perf_counter()
+            shared = [run_stages(TextAnalysis.of(action), TextAnalysis.of(response)) for action, response in turns]
+            shared_time = time.perf_counter() - start_time
+            assert separate == shared, "one shared read should give every stage the same answers as reading separately"
+            
+            return {
+                'turns': len(turns),
+                'separate_ms_per_turn': separate_time * 1000 / len(turns),
+                'shared_ms_per_turn': shared_time * 1000 / len(turns),
+                'speedup': separate_time / shared_time if shared_time > 0 else float('inf'),
+            }
+        
+        self.results['shared_text_analysis'] = run_test_safely(shared_analysis_test)
+    
+    def test_npc_name_matching_scale(self, engine):
+        """Micro-benchmark: one trie walk vs one regex per NPC, with a thousands-strong roster"""
+        print("  🔎 Benchmarking NPC name matching with a huge roster...")
+        
+        def name_matching_test():
+            import contextlib
+            import io
+            from storyteller.core.npc import NPCManager
+            
+            manager = NPCManager()
+            syllables = ["bra", "ven", "tho", "mar", "eli", "dru", "kas", "lor", "fen", "zin"]
+            roster = [
+                (syllables[i % 10] + syllables[(i // 10) % 10] + syllables[(i // 100) % 10]).capitalize() + str(i // 1000 or "")
+                for i in range(2000)
+            ]
+            with contextlib.redirect_stdout(io.StringIO()):  # 2000 welcome messages is a lot of cheering
+                for name in roster + ["Marcus Blackwood"]:
+                    manager.initialize_npc(name)
+            
+            texts = [
+                f"{roster[i * 7 % 2000]} argues with {roster[i * 13 % 2000]} while Marcus Blackwood "
+                f"sharpens his sword by the tavern fire, ignoring the rain outside."
+                for i in range(100)
+            ]
+            
+            def legacy_mentions(text):
+                return sorted(
+                    name for name in manager.npcs
+                    if re.search(r'\b' + re.escape(name) + r'\b', text, re.IGNORECASE)
+                )
+            
+            start_time = time.perf_counter()
+            legacy = [legacy_mentions(text) for text in texts]
+            legacy_time = time.perf_counter() - start_time
+            
+            start_time = time.perf_counter()
+            matched = [sorted({mention.name for mention in manager.find_npc_mentions(text)}) for text in texts]
+            matcher_time = time.perf_counter() - start_time
+            assert legacy == matched, "the trie should find exactly the NPCs the per-NPC regexes found"
+            
+            return {
+                'roster_size': len(manager.npcs),
+                'legacy_ms_per_text': legacy_time * 1000 / len(texts),
+                'matcher_ms_per_text': matcher_time * 1000 / len(texts),
+                'speedup': legacy_time / matcher_time if matcher_time > 0 else float('inf'),
+            }
+        
+        self.results['npc_name_matching_scale'] = run_test_safely(name_matching_test)
+    
+    def test_npc_extraction_throughput(self, engine):
+        """Micro-benchmark: new-NPC extraction over long DM responses, one folded regex vs a findall per pattern"""
+        print("  📖 Benchmarking NPC extraction on long DM responses...")
+        
+        def extraction_test():
+            from storyteller.core import npc as npc_module
+            from storyteller.core.lexicons import NOT_NPC_NAMES
+            
+            manager = npc_module.NPCManager()
+            paragraph = (
+                "You meet Boric, the blacksmith, as the morning bell rings. Elara the merchant approaches "
+                "and says the road north is dangerous. The guard Marcus whispers that a wizard named Fenwick "
+                "walks the forest at night. Thorin takes a potion and hands the gold to the innkeeper Greta. "
+            )
+            responses = [paragraph * 20 for _ in range(20)]  # ~8KB each, like a chatty DM
+            
+            def legacy_valid(name):
+                excluded_words = set(NOT_NPC_NAMES)  # The old code built its word set on every call
+                return bool(
+                    name and name.replace("'", "").replace("-", "").isalpha() and len(name) >= 2 and
+                    name.lower() not in excluded_words and name[0].isupper() and not name.isupper()
+                )
+            
+            def legacy_extract(text):
+                detected = {}
+                for pattern in npc_module._NPC_PATTERNS:
+                    for match in re.findall(pattern.pattern, text, re.IGNORECASE):
+                        if match[0] and legacy_valid(match[0]):
+                            detected[match[0].capitalize()] = match[1].lower() if len(match) > 1 and match[1] else "person"
+                for pattern in npc_module._OCCUPATION_PATTERNS:
+                    for match in re.findall(pattern.pattern, text, re.IGNORECASE):
+                        if match[0] and legacy_valid(match[0]):
+                            detected[match[0].capitalize()] = match[1].lower()
+                        elif match[1] and legacy_valid(match[1]):
+                            detected[match[1].capitalize()] = match[0].lower()
+                return detected
+            
+            start_time = time.perf_counter()
+            legacy = [legacy_extract(text) for text in responses]
+            legacy_time = time.perf_counter() - start_time
+            
+            npc_module._is_valid_npc_name.cache_clear()
+            start_time = time.perf_counter()
+            extracted = [manager._new_npc_candidates(text) for text in responses]
+            shared_time = time.perf_counter() - start_time
+            memo = npc_module._is_valid_npc_name.cache_info()
+            
+            megabytes = sum(len(text) for text in responses) / 1e6
+            # Same characters found; "a wizard named Fenwick" now also knows he's a wizard
+            assert [sorted(found) for found in legacy] == [sorted(found) for found in extracted], \
+                "the folded regex should find the same characters as a findall per pattern"
+            return {
+                'legacy_mb_per_second': megabytes / legacy_time,
+                'shared_mb_per_second': megabytes / shared_time,
+                'speedup': legacy_time / shared_time if shared_time > 0 else float('inf'),
+                'memo_hit_rate': memo.hits / max(1, memo.hits + memo.misses),
+                'npcs_found': sorted(extracted[0]),
+                'named_occupation': extracted[0].get("Fenwick")
+            }
+        
+        self.results['npc_extraction_throughput'] = run_test_safely(extraction_test)
+    
+    def test_fuzzy_name_resolution(self, engine):
+        """Micro-benchmark: resolving misspelled names against thousands of NPCs via the trigram index"""
+        print("  🔤 Benchmarking fuzzy NPC name resolution...")
+        
+        def fuzzy_test():
+            import contextlib
+            import io
+            from storyteller.core.npc import NPCManager
+            
+            manager = NPCManager()
+            syllables = ["bra", "ven", "tho", "mar", "eli", "dru", "kas", "lor", "fen", "zin"]
+            roster = [
+                "".join(syllables[i // 10 ** power % 10] for power in range(4)).capitalize()
+                for i in range(3000)
+            ]
+            with contextlib.redirect_stdout(io.StringIO()):
+                for name in roster + ["Marcus", "Elena"]:
+                    manager.initialize_npc(name)
+            
+            # One letter changed in the middle of each name - the classic typo
+            typos = {name[:5] + ("x" if name[5] != "x" else "y") + name[6:]: name for name in roster[::10]}
+            
+            start_time = time.perf_counter()
+            resolved = {typo: manager.fuzzy_names.resolve(typo) for typo in typos}
+            resolve_time = time.perf_counter() - start_time
+            
+            with contextlib.redirect_stdout(io.StringIO()):
+                response = manager.analyze("You meet Elana, the merchant. Marcos waves.", find_new_npcs=True)
+                introduced = manager.analyze("A woman named Helena waves.", find_new_npcs=True)
+            
+            ms_per_lookup = resolve_time * 1000 / len(typos)
+            assert ms_per_lookup < 1.0, f"{ms_per_lookup:.3f}ms per lookup - the target is under a millisecond"
+            # Someone introduced by name is new, however much her name looks like Elena's
+            assert introduced.new_npcs == {"Helena": "woman"} and "Elena" not in introduced.mentioned, \
+                f"'a woman named Helena' was taken for Elena: {introduced.new_npcs}, {introduced.mentioned}"
+            assert not response.new_npcs and response.mentioned == ["Elena", "Marcus"], \
+                f"typos should resolve to known NPCs, got new {response.new_npcs}, mentioned {response.mentioned}"
+            
+            return {
+                'roster_size': len(manager.npcs),
+                'ms_per_lookup': ms_per_lookup,
+                'correct': sum(resolved[typo] == name for typo, name in typos.items()) / len(typos),
+                'wrong': sum(resolved[typo] not in (None, name) for typo, name in typos.items()),
+                'typo_mentions': response.mentioned
+            }
+        
+        self.results['fuzzy_name_resolution'] = run_test_safely(fuzzy_test)
+    
+    def test_async_llm_concurrency(self, engine):
+        """Micro-benchmark: overlapping requests from one event loop, capped by the async client's limit"""
+        print("  ⚡ Benchmarking async LLM request concurrency...")
+        
+        def concurrency_test():
+            import asyncio
+            from types import SimpleNamespace
+            from storyteller.utils.llm import AsyncLLMClient, get_async_llm_client, close_async_llm_client
+            
+            class SlowStoryteller:
+                """Stands in for the AI: every answer takes 50ms, and we count how many overlap"""
+                def __init__(self):
+                    self.in_flight = self.peak = 0
+                    self.hung_up = False
+                    self.chat = SimpleNamespace(completions=self)
+                
+                async def create(self, **kwargs):
+                    self.in_flight += 1
+                    self.peak = max(self.peak, self.in_flight)
+                    await asyncio.sleep(0.05)
+                    self.in_flight -= 1
+                    if kwargs.get('stream'):
+                        return self.chunks()
+                    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=" The door creaks open. "))])
+                
+                async def chunks(self):
+                    try:
+                        for word in ["The ", "door. ", "It ", "creaks. "] * 50:
+                            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=word))])
+                    finally:
+                        self.hung_up = True
+            
+            async def session():
+                client = AsyncLLMClient(max_concurrent_requests=4)
+                client.client = SlowStoryteller()
+                start_time = time.perf_counter()
+                replies = await asyncio.gather(*[
+                    client.continue_story("A hero", "No memories", "", f"I open door {i}") for i in range(16)
+                ])
+                elapsed = time.perf_counter() - start_time
+                shared = get_async_llm_client() is get_async_llm_client()
+                streamed = [piece async for piece in get_async_llm_client().generate_text_stream([])]
+                
+                # Stopping a stream early hands its request slot back as soon as it's closed
+                async with client.generate_text_stream([]) as stream:
+                    async for piece in stream:
+                        break
+                    assert client._slots._value == 3, "the stream should hold a slot"
+                assert client._slots._value == 4, "closing the stream should hand its slot back"
+                assert client.client.hung_up, "closing the stream should hang up on the AI"
+                
+                shared_client = get_async_llm_client()
+                await close_async_llm_client()
+                assert get_async_llm_client() is not shared_client, "a closed shared client should be replaced"
+                await close_async_llm_client()
+                return replies, elapsed, client.client.peak, shared, streamed
+            
+            replies, elapsed, peak, shared, streamed = asyncio.run(session())
+            assert peak == 4, f"{peak} requests in flight - the limit is 4"
+            assert elapsed < len(replies) * 0.05 / 2, \
+                f"{elapsed * 1000:.0f}ms for {len(replies)} requests - no faster than half of one at a time"
+            assert all(reply == "The door creaks open." for reply in replies), "a reply came back wrong"
+            assert shared, "the shared async client should be reused"
+            assert len(streamed) >= 1, "the shared client streamed nothing"
+            
+            return {
+                'requests': len(replies),
+                'elapsed_ms': elapsed * 1000,
+                'sequential_ms': len(replies) * 50,
+                'peak_in_flight': peak,
+                'streamed_pieces': len(streamed),
+            }
+        
+        self.results['async_llm_concurrency'] = run_test_safely(concurrency_test)
+    
     def _calculate_variance(self, values: List[float]) -> float:
         """Calculate variance of a list of values"""
         if len(values) < 2:
@@ -386,6 +740,39 @@ if __name__ == "__main__":
                 print(f"  📊 Memory per conversation: {test_result['memory_per_conversation_mb']:.3f}MB")
                 print(f"  💾 Total growth: {test_result['total_memory_growth_mb']:.1f}MB")
                 print(f"  ✅ Reasonable usage: {test_result['reasonable_memory_usage']}")
+            
+            elif test_name == 'fact_extraction_throughput':
+                for label in ('before', 'after'):
+                    stats = test_result[label]
+                    print(f"  🔬 {label.title()}: {stats['mb_per_second']:.2f} MB/s, "
+                          f"{stats['facts_per_turn']:.1f} facts/turn, {stats['distinct_facts']} distinct facts")
+                print(f"  ⚡ Speedup: {test_result['speedup']:.2f}x")
+            
+            elif test_name == 'npc_name_matching_scale':
+                print(f"  🔎 {test_result['roster_size']} NPCs: per-NPC regex {test_result['legacy_ms_per_text']:.3f}ms/text, "
+                      f"trie {test_result['matcher_ms_per_text']:.3f}ms/text")
+                print(f"  ⚡ Speedup: {test_result['speedup']:.1f}x")
+            
+            elif test_name == 'npc_extraction_throughput':
+                print(f"  📖 A findall per pattern: {test_result['legacy_mb_per_second']:.2f} MB/s, "
+                      f"one folded regex: {test_result['shared_mb_per_second']:.2f} MB/s")
+                print(f"  ⚡ Speedup: {test_result['speedup']:.2f}x (memo hit rate {test_result['memo_hit_rate']:.0%})")
+                print(f"  🧙 Fenwick the {test_result['named_occupation']}")
+            
+            elif test_name == 'async_llm_concurrency':
+                print(f"  ⚡ {test_result['requests']} requests in {test_result['elapsed_ms']:.0f}ms "
+                      f"(one at a time: {test_result['sequential_ms']}ms), peak in flight: {test_result['peak_in_flight']}")
+                print(f"  📡 Streamed pieces: {test_result['streamed_pieces']}")
+            
+            elif test_name == 'fuzzy_name_resolution':
+                print(f"  🔤 {test_result['roster_size']} NPCs: {test_result['ms_per_lookup']:.3f}ms per misspelled name")
+                print(f"  🎯 Resolved correctly: {test_result['correct']:.0%} (wrong: {test_result['wrong']})")
+                print(f"  🧾 'Elana' and 'Marcos' counted as: {test_result['typo_mentions']}")
+            
+            elif test_name == 'shared_text_analysis':
+                print(f"  📜 Separate reads: {test_result['separate_ms_per_turn']:.3f}ms/turn, "
+                      f"shared read: {test_result['shared_ms_per_turn']:.3f}ms/turn")
+                print(f"  ⚡ Speedup: {test_result['speedup']:.2f}x")
         
         else:
             print(f"  ❌ FAILED: {result['error']}")
\ No newline at end of file
@@ -38,6 +38,8 @@ class StoryConsistencyTests:
             self.test_world_state_consistency(engine)
             self.test_dialogue_consistency(engine)
             self.test_consequence_tracking(engine)
+            self.test_streamed_turn(engine)
+            self.test_quest_progression(engine)
             
         finally:
             # Cleanup
@@ -417,6 +419,158 @@ class StoryConsistencyTests:
             }
         
         self.results['consequence_tracking'] = run_test_safely(consequence_test)
+    
+    def test_streamed_turn(self, engine):
+        """Test that a streamed reply arrives in pieces and still lands in memory as one whole turn"""
+        print("  🌊 Testing streamed turn...")
+        
+        def streamed_turn_test():
+            import contextlib
+            import io
+            import shutil
+            import tempfile
+            from types import SimpleNamespace
+            from storyteller.core import engine as engine_module
+            from storyteller.utils import llm as llm_module
+            
+            # An adventure of its own, so turns from earlier runs don't muddle the count
+            save_path = tempfile.mkdtemp(prefix="streamed_turn_test_")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    adventure = engine_module.StorytellingEngine(save_path)
+                    adventure.create_character("Sir Galahad", "A noble knight", "Honorable", "Find the Grail")
+                    adventure.start_adventure()
+                    adventure.npc_manager.initialize_npc("Greta", "innkeeper")
+                    adventure.npc_manager.update_current_npcs("Greta waits nearby.")
+                
+                # Peek at what the storyteller is asked, whole and streamed
+                prompts = []
+                story_messages = llm_module._story_messages
+                def capturing_story_messages(*args, **kwargs):
+                    messages = story_messages(*args, **kwargs)
+                    prompts.append(messages[0]["content"])
+                    return messages
+                llm_module._story_messages = capturing_story_messages
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        adventure.process_player_action("I wave to Greta.")
+                    turns_before = len(adventure.memory.conversation_history)
+                    
+                    start_time = time.perf_counter()
+                    first_piece_at = None
+                    pieces = []
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        for piece in adventure.process_player_action_stream("I ask the innkeeper about the road north."):
+                            if first_piece_at is None:
+                                first_piece_at = time.perf_counter() - start_time
+                            pieces.append(piece)
+                    total_time = time.perf_counter() - start_time
+                finally:
+                    llm_module._story_messages = story_messages
+                
+                assert len(prompts) == 2 and all("Greta (innkeeper)" in prompt for prompt in prompts), \
+                    "the storyteller should be told who's in the scene, whole or streamed"
+                reply = "".join(pieces)
+                last_turn = adventure.memory.conversation_history[-1]
+                assert reply, "the streamed reply was empty"
+                assert len(adventure.memory.conversation_history) == turns_before + 1, \
+                    "a finished stream should add exactly one turn"
+                assert last_turn.dm_response == reply == adventure.last_stream.text, \
+                    "the remembered turn should be the whole streamed reply"
+                assert adventure.last_stream.time_to_first_token is not None
+                
+                # A stand-in AI: an empty reply gets the usual fallback, and a reader who stops early hangs up
+                class FakeStream:
+                    def __init__(self, words):
+                        self.chunks = [SimpleNamespace(choices=[SimpleNamespace(
+                            delta=SimpleNamespace(content=word), finish_reason=None)]) for word in words]
+                        self.closed = False
+                    
+                    def __iter__(self):
+                        return iter(self.chunks)
+                    
+                    def close(self):
+                        self.closed = True
+                
+                streams = []
+                def create(**kwargs):
+                    streams.append(FakeStream(words.pop(0)))
+                    return streams[-1]
+                words = [["", "  "], ["The ", "road ", "north ", "is ", "long."],
+                         ["Greta ", "scowls. ", "She ", "says ", "nothing."]]
+                storyteller = llm_module.LLMClient.__new__(llm_module.LLMClient)
+                storyteller.model = "stand-in"
+                storyteller.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+                empty_reply = list(storyteller.continue_story_stream("A hero", "", "", "I wait."))
+                for piece in storyteller.continue_story_stream("A hero", "", "", "I ask about the road."):
+                    break  # Only wanted the first words
+                assert empty_reply == [llm_module._STORY_FALLBACK], f"an empty reply came out as {empty_reply}"
+                assert all(stream.closed for stream in streams), "the AI's stream was left open"
+                
+                # Walking away from a streamed turn: the AI is hung up on and no turn is recorded,
+                # but (as documented) Greta has already felt the insult
+                greta_before = adventure.npc_manager.npcs["Greta"]["relationship_score"]
+                turns_before = len(adventure.memory.conversation_history)
+                real_storyteller, engine_module.llm_client = engine_module.llm_client, storyteller
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        turn = adventure.process_player_action_stream("Greta, you stupid fool, I hate you!")
+                        next(turn)
+                        turn.close()
+                finally:
+                    engine_module.llm_client = real_storyteller
+                assert streams[-1].closed, "walking away from a streamed turn should hang up on the AI"
+                assert len(adventure.memory.conversation_history) == turns_before, "an abandoned turn was recorded"
+                greta_after = adventure.npc_manager.npcs["Greta"]["relationship_score"]
+                assert greta_after < greta_before, "the action's tone should still have reached Greta"
+                
+                return {
+                    'pieces': len(pieces),
+                    'first_piece_seconds': first_piece_at,
+                    'total_seconds': total_time,
+                    'usage': adventure.last_stream.usage,
+                    'abandoned_greta_score': (greta_before, greta_after),
+                }
+            finally:
+                shutil.rmtree(save_path, ignore_errors=True)
+        
+        self.results['streamed_turn'] = run_test_safely(streamed_turn_test)
+    
+    def test_quest_progression(self, engine):
+        """Test that moving on to the next quest files later turns under it, even after a restart"""
+        print("  🗺️ Testing quest progression...")
+        
+        def quest_test():
+            import contextlib
+            import io
+            import shutil
+            import tempfile
+            from storyteller.core.bitmap_index import MemoryFilter
+            from storyteller.core.engine import StorytellingEngine
+            
+            save_path = tempfile.mkdtemp(prefix="quest_test_")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    adventure = StorytellingEngine(save_path)
+                    adventure.memory.add_conversation_turn("I find the rusty lantern", "It flickers", quest=adventure.current_quest)
+                    upcoming = adventure.advance_quest()
+                    adventure.memory.add_conversation_turn("I light the lantern", "It blazes", quest=adventure.current_quest)
+                    restarted = StorytellingEngine(save_path)
+                
+                assert upcoming is not None and adventure.current_quest == upcoming["number"] == 2, \
+                    f"the quest should move from 1 to 2, got {adventure.current_quest}"
+                assert restarted.current_quest == 2, f"a restart went back to quest {restarted.current_quest}"
+                second_quest = restarted.memory.retrieve_relevant_memories("lantern", memory_filter=MemoryFilter(quest=2))
+                assert any("blazes" in memory for memory in second_quest) and \
+                    not any("flickers" in memory for memory in second_quest), f"quest 2 filter gave {second_quest}"
+                
+                restarted.set_current_quest(len(restarted.get_plot()))
+                assert restarted.advance_quest() is None, "there's no quest after the last one"
+                return {'quest_two_memories': second_quest}
+            finally:
+                shutil.rmtree(save_path, ignore_errors=True)
+        
+        self.results['quest_progression'] = run_test_safely(quest_test)
 
 
 def run_story_consistency_tests():
@@ -457,6 +611,14 @@ if __name__ == "__main__":
             elif test_name == 'consequence_tracking':
                 print(f"  ⚡ Consequence tracking: {test_result['tracking_rate']:.2%}")
                 print(f"  🎯 Good tracking: {test_result['good_consequence_tracking']}")
+            
+            elif test_name == 'streamed_turn':
+                print(f"  🌊 {test_result['pieces']} pieces, first after {test_result['first_piece_seconds']:.3f}s "
+                      f"of {test_result['total_seconds']:.3f}s (usage: {test_result['usage']})")
+                print(f"  🚶 Greta's score before/after an abandoned turn: {test_result['abandoned_greta_score']}")
+            
+            elif test_name == 'quest_progression':
+                print(f"  🗺️ Quest 2 memories: {test_result['quest_two_memories']}")
         
         else:
             print(f"  ❌ FAILED: {result['error']}")
\ No newline at end of file